@@ -0,0 +1,6 @@
+"""Benchmarks for `bound_class.core`.
+
+The benchmarks are written in the style of `asv
+<https://asv.readthedocs.io>`_: classes with a ``setup`` method and
+``time_*`` methods.
+"""
@@ -0,0 +1,235 @@
+"""Run the benchmarks and export the results as JSON.
+
+The benchmarks are :mod:`asv`-style, so they can also be run with ``asv run``
+(see ``asv.conf.json``). This runner needs only the standard library::
+
+    python -m benchmarks                                  # run all
+    python -m benchmarks -k "TimeGet|TimeSelf"            # select by name
+    python -m benchmarks -o results.json                  # export as JSON
+    python -m benchmarks --compare baseline.json          # check regressions
+
+With ``--compare`` the time relative to the baseline is printed for every
+benchmark, e.g. to report the speedup of the mypyc-compiled build, and the exit
+status is 1 if any benchmark -- including tracked values, like the import time
+-- is slower than the baseline by more than ``--threshold``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import functools
+import importlib
+import inspect
+import itertools
+import json
+import pkgutil
+import platform
+import re
+import subprocess
+import sys
+import timeit
+from pathlib import Path
+from typing import Any
+
+import benchmarks
+from bound_class.core import base
+from bound_class.core.setup_package import __version__
+
+__all__: list[str] = []
+
+
+PREFIXES = ("time_", "track_")
+
+
+def discover(pattern: str | None = None) -> list[tuple[str, type, str]]:
+    """Find the benchmarks.
+
+    Parameters
+    ----------
+    pattern : str or None, optional
+        Regular expression searched for in the benchmark names,
+        ``<module>.<class>.<method>``.
+
+    Returns
+    -------
+    list[tuple[str, type, str]]
+        The name, class and method name of each benchmark.
+
+    """
+    found = []
+    for info in pkgutil.iter_modules(benchmarks.__path__):
+        if info.name.startswith("_"):
+            continue
+        module = importlib.import_module(f"benchmarks.{info.name}")
+        for cls_name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__ or cls_name.startswith("_"):
+                continue
+            for method_name in sorted(vars(cls)):
+                name = f"{info.name}.{cls_name}.{method_name}"
+                if method_name.startswith(PREFIXES) and (pattern is None or re.search(pattern, name)):
+                    found.append((name, cls, method_name))
+    return found
+
+
+def param_combinations(cls: type) -> list[dict[str, Any]]:
+    """Return the parameter combinations of an asv-style benchmark class."""
+    params = getattr(cls, "params", [])
+    if not params:
+        return [{}]
+    if not isinstance(params[0], list):  # a single parameter
+        params = [params]
+    names = getattr(cls, "param_names", [f"param{i + 1}" for i in range(len(params))])
+    return [dict(zip(names, combo, strict=True)) for combo in itertools.product(*params)]
+
+
+def run_benchmark(cls: type, method_name: str, params: dict[str, Any], repeat: int | None) -> dict[str, Any] | None:
+    """Run one benchmark for one parameter combination.
+
+    Returns
+    -------
+    dict[str, Any] or None
+        The result, or `None` if the ``setup`` raised `NotImplementedError`.
+
+    """
+    args = tuple(params.values())
+    repeat = repeat or getattr(cls, "repeat", 5)
+    number = getattr(cls, "number", 0)
+
+    samples: list[float] = []
+    for _ in range(1 if method_name.startswith("track_") else repeat):
+        bench = cls()
+        try:
+            if hasattr(bench, "setup"):
+                bench.setup(*args)
+        except NotImplementedError:
+            return None
+
+        func = getattr(bench, method_name)
+        if method_name.startswith("track_"):
+            samples.append(func(*args))
+        else:
+            timer = timeit.Timer(functools.partial(func, *args))
+            if not number:
+                number, _ = timer.autorange()
+            samples.append(timer.timeit(number) / number)
+
+        if hasattr(bench, "teardown"):
+            bench.teardown(*args)
+
+    return {
+        "params": params,
+        "unit": "seconds" if method_name.startswith("time_") else getattr(cls, "unit", "unit"),
+        "value": min(samples),
+        "samples": samples,
+        "number": number,
+    }
+
+
+def _commit() -> str | None:
+    try:
+        out = subprocess.run(  # noqa: S603  # a fixed command
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def _key(result: dict[str, Any]) -> str:
+    return f"{result['name']}{json.dumps(result['params'])}"
+
+
+def _compiled() -> bool:
+    """Return whether `bound_class.core` was compiled with mypyc (see ``setup.py``)."""
+    return not str(base.__file__).endswith(".py")
+
+
+def ratios(results: list[dict[str, Any]], baseline: dict[str, Any]) -> dict[str, float]:
+    """Return the results relative to a baseline.
+
+    Returns
+    -------
+    dict[str, float]
+        The value over the baseline value, by benchmark. Both timings and
+        tracked values, e.g. the import time or memory, are lower-is-better.
+
+    """
+    old = {(_key(r), r["unit"]): r["value"] for r in baseline["results"]}
+    return {
+        _key(result): result["value"] / old[_key(result), result["unit"]]
+        for result in results
+        if old.get((_key(result), result["unit"]))
+    }
+
+
+def compare(results: list[dict[str, Any]], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Compare results to a baseline.
+
+    Returns
+    -------
+    list[str]
+        The benchmarks slower than ``threshold`` times the baseline.
+
+    """
+    return [f"{key}: {ratio:.2f}x slower" for key, ratio in ratios(results, baseline).items() if ratio > threshold]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.split("\n")[0])
+    parser.add_argument("-k", "--pattern", help="only run benchmarks whose name matches this regex")
+    parser.add_argument("-o", "--output", type=Path, help="write the results to this JSON file")
+    parser.add_argument("-r", "--repeat", type=int, help="override the number of repeats")
+    parser.add_argument("--compare", type=Path, help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=1.2, help="slowdown ratio that is a regression")
+    args = parser.parse_args(argv)
+
+    results = []
+    for name, cls, method_name in discover(args.pattern):
+        for params in param_combinations(cls):
+            result = run_benchmark(cls, method_name, params, args.repeat)
+            if result is None:
+                continue
+            result = {"name": name, **result}
+            results.append(result)
+
+            label = f"{name}({', '.join(f'{k}={v!r}' for k, v in params.items())})"
+            if result["unit"] == "seconds":
+                value = f"{1e9 * result['value']:12.1f} ns"
+            else:
+                value = f"{result['value']:12.1f} {result['unit']}"
+            print(f"{label:<90} {value}")
+
+    output = {
+        "version": __version__,
+        "commit": _commit(),
+        "date": dt.datetime.now(tz=dt.timezone.utc).isoformat(),
+        "python": sys.version,
+        "platform": platform.platform(),
+        "compiled": _compiled(),
+        "results": results,
+    }
+    if args.output is not None:
+        args.output.write_text(json.dumps(output, indent=2))
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())
+        print(f"\nRelative to {args.compare} (compiled: {baseline.get('compiled', False)} -> {output['compiled']})")
+        for key, ratio in ratios(results, baseline).items():
+            print(f"{key:<90} {ratio:6.2f}x time  {1 / ratio:6.2f}x speedup")
+
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return int(bool(regressions))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+"""Benchmarks for `bound_class.core.base`."""
+
+from __future__ import annotations
+
+from bound_class.core.base import BoundClass, SlottedBoundClass
+
+__all__: list[str] = []
+
+
+class _Enclosing:
+    pass
+
+
+class TimeSelf:
+    """Time binding and dereferencing ``__self__``."""
+
+    params = ["BoundClass", "SlottedBoundClass"]
+    param_names = ["kind"]
+
+    def setup(self, kind: str) -> None:
+        """Make a bound instance."""
+        self.enclosing = _Enclosing()
+        self.bound = BoundClass() if kind == "BoundClass" else SlottedBoundClass()
+        self.bound._set__self__(self.enclosing)
+
+    def time___self__(self, _: str) -> None:
+        """Dereference ``__self__``."""
+        self.bound.__self__
+
+    def time__set__self__(self, _: str) -> None:
+        """(Re)bind to the enclosing instance."""
+        self.bound._set__self__(self.enclosing)
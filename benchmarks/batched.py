@@ -0,0 +1,65 @@
+"""Benchmarks for batched (vectorized) descriptors."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from math import hypot
+from typing import Any
+
+from bound_class.core import batch, batch_type, register_descriptor
+from bound_class.core.batched import HAS_NUMPY
+from bound_class.core.descriptors import InstanceDescriptor
+
+if HAS_NUMPY:
+    import numpy as np
+
+__all__: list[str] = []
+
+
+@dataclass
+class _Cartesian:
+    x: float
+    y: float
+
+
+class _BatchedPolar(InstanceDescriptor[Any]):
+    @property
+    def r(self) -> Any:
+        return np.hypot(self.enclosing.x, self.enclosing.y)
+
+
+@register_descriptor(_Cartesian, "polar", batched=_BatchedPolar)
+class _Polar(InstanceDescriptor[Any]):
+    @property
+    def r(self) -> float:
+        return hypot(self.enclosing.x, self.enclosing.y)
+
+
+class TimeBatched:
+    """Time a descriptor property on many enclosing objects."""
+
+    params = [[1_000, 100_000]]
+    param_names = ["n"]
+
+    def setup(self, n: int) -> None:
+        """Make the enclosing objects."""
+        if not HAS_NUMPY:
+            raise NotImplementedError
+
+        self.vectors = [_Cartesian(float(i), float(i + 1)) for i in range(n)]
+        self.x = np.array([v.x for v in self.vectors])
+        self.y = np.array([v.y for v in self.vectors])
+
+    def time_loop(self, _: int) -> None:
+        """Once per enclosing object."""
+        [v.polar.r for v in self.vectors]
+
+    def time_batch(self, _: int) -> None:
+        """Once on a batch of the enclosing objects, including gathering the fields."""
+        vectors = batch(self.vectors)  # the descriptor does not keep the batch alive
+        vectors.polar.r
+
+    def time_batch_from_fields(self, _: int) -> None:
+        """Once on a batch made from arrays of the fields."""
+        vectors = batch_type(_Cartesian).from_fields(x=self.x, y=self.y)
+        vectors.polar.r
@@ -0,0 +1,42 @@
+"""Benchmarks for the cost of the runtime counters."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from benchmarks.descriptors import KINDS, make_enclosing_cls
+from bound_class.core import disable_stats, enable_stats, reset_stats
+
+__all__: list[str] = []
+
+
+class TimeCounters:
+    """Time ``__get__`` with the counters off (the default) and on.
+
+    With the counters off the times should match those of
+    ``descriptors.TimeGet``.
+    """
+
+    params = [KINDS[:4], [False, True]]
+    param_names = ["kind", "enabled"]
+
+    def setup(self, kind: str, enabled: bool) -> None:  # noqa: FBT001
+        """Turn the counters on or off and make an enclosing instance."""
+        if enabled:
+            enable_stats(reset=True)
+        self.encl_cls = make_enclosing_cls(kind)
+        self.enclosing = self.encl_cls()
+        self.enclosing.attr
+
+    def teardown(self, *_: Any) -> None:
+        """Turn the counters off."""
+        disable_stats()
+        reset_stats()
+
+    def time_first_get(self, *_: Any) -> None:
+        """First access, which makes and stores the bound instance."""
+        self.encl_cls().attr
+
+    def time_repeated_get(self, *_: Any) -> None:
+        """Later access, which returns the stored bound instance."""
+        self.enclosing.attr
@@ -0,0 +1,339 @@
+"""Benchmarks for instance-level descriptors and accessors."""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import math
+import timeit
+from typing import Any
+
+from bound_class.core import bound_cached_property, invalidate, rebind_on_copy, track_fields, tracked_cached_property
+from bound_class.core.accessors import Accessor, AccessorProperty, CachedAccessorProperty
+from bound_class.core.descriptors import BoundDescriptor, InstanceDescriptor, SlottedInstanceDescriptor
+from bound_class.core.fields import clone, light_dataclass
+
+__all__: list[str] = []
+
+
+KINDS = [
+    "BoundDescriptor",
+    "InstanceDescriptor",
+    "AccessorProperty",
+    "CachedAccessorProperty",
+    "PandasCachedAccessor",
+]
+STORE_INS = ["__dict__", "_attrs_", "side_table", None]
+
+
+class PandasCachedAccessor:
+    """Reference implementation of pandas' ``CachedAccessor``.
+
+    See https://github.com/pandas-dev/pandas/blob/main/pandas/core/accessor.py.
+    """
+
+    def __init__(self, name: str, accessor: type) -> None:
+        self._name = name
+        self._accessor = accessor
+
+    def __get__(self, obj: Any, cls: type) -> Any:
+        if obj is None:
+            return self._accessor
+        accessor_obj = self._accessor(obj)
+        object.__setattr__(obj, self._name, accessor_obj)
+        return accessor_obj
+
+
+class _AttrsEnclosing:
+    """Base for enclosing classes that store bound instances in ``_attrs_``."""
+
+    __slots__ = ("__weakref__", "_attrs_")
+
+    def __init__(self) -> None:
+        self._attrs_: dict[str, Any] = {}
+
+
+def make_enclosing_cls(kind: str, store_in: str | None = "__dict__") -> type:
+    """Make an enclosing class with the attribute ``attr``.
+
+    Parameters
+    ----------
+    kind : str
+        One of `KINDS`.
+    store_in : str or None, optional
+        One of `STORE_INS`.
+
+    Returns
+    -------
+    type
+
+    Raises
+    ------
+    NotImplementedError
+        If ``kind`` does not support ``store_in``. :mod:`asv` (and
+        ``python -m benchmarks``) skip the benchmark.
+
+    """
+    if store_in != "__dict__" and kind in {"CachedAccessorProperty", "PandasCachedAccessor"}:
+        raise NotImplementedError
+
+    attr: Any
+    if kind == "BoundDescriptor":
+        attr = BoundDescriptor(store_in=store_in)
+    elif kind == "InstanceDescriptor":
+        attr = InstanceDescriptor(store_in=store_in)
+    elif kind == "AccessorProperty":
+        attr = AccessorProperty(Accessor, store_in=store_in)
+    elif kind == "CachedAccessorProperty":
+        attr = CachedAccessorProperty(Accessor)
+    else:
+        attr = PandasCachedAccessor("attr", Accessor)
+
+    if store_in == "_attrs_":
+        return type("Enclosing", (_AttrsEnclosing,), {"__slots__": (), "attr": attr})
+    if store_in == "side_table":  # slotted, without a ``__dict__``
+        return type("Enclosing", (object,), {"__slots__": ("__weakref__",), "attr": attr})
+    return type("Enclosing", (object,), {"attr": attr})
+
+
+class TimeGet:
+    """Time ``__get__`` on an enclosing instance."""
+
+    params = [KINDS, STORE_INS]
+    param_names = ["kind", "store_in"]
+
+    def setup(self, kind: str, store_in: str | None) -> None:
+        """Make an enclosing instance and access the attribute once."""
+        self.encl_cls = make_enclosing_cls(kind, store_in)
+        self.enclosing = self.encl_cls()
+        self.enclosing.attr
+
+    def time_first_get(self, *_: Any) -> None:
+        """First access, which makes and stores the bound instance."""
+        self.encl_cls().attr
+
+    def time_repeated_get(self, *_: Any) -> None:
+        """Repeated access, which returns the cached bound instance."""
+        self.enclosing.attr
+
+
+class TimeBindMany:
+    """Time binding many enclosing instances at once, vs one at a time."""
+
+    params = [KINDS[:3], ["bind", "cached"]]
+    param_names = ["kind", "state"]
+    # one call per setup, so that "bind" times binding, not cached lookups
+    number = 1
+    repeat = 10
+    warmup_time = 0
+
+    def setup(self, kind: str, state: str) -> None:
+        """Make enclosing instances, with cached bound instances if ``state="cached"``."""
+        self.encl_cls = make_enclosing_cls(kind)
+        self.descriptor = vars(self.encl_cls)["attr"]
+        self.enclosings = [self.encl_cls() for _ in range(10_000)]
+        if state == "cached":
+            for enclosing in self.enclosings:
+                enclosing.attr
+
+    def time_getattr_loop(self, *_: Any) -> None:
+        """Get the attribute on each enclosing instance."""
+        for enclosing in self.enclosings:
+            enclosing.attr
+
+    def time_bind_many(self, *_: Any) -> None:
+        """Bind all enclosing instances in one call."""
+        self.descriptor.bind_many(self.enclosings)
+
+
+class TimeDictLookup:
+    """Reference time: looking up a cached instance directly."""
+
+    def setup(self) -> None:
+        """Make an enclosing instance with a cached instance."""
+        self.enclosing = make_enclosing_cls("BoundDescriptor")()
+        self.enclosing.attr
+
+    def time_dict_lookup(self) -> None:
+        """Look up the cached instance in the instance ``__dict__``."""
+        self.enclosing.__dict__["attr"]
+
+
+class TimeCopy:
+    """Time copying enclosing instances that carry bound instances."""
+
+    params = KINDS[:3]
+    param_names = ["kind"]
+
+    def setup(self, kind: str) -> None:
+        """Make a list of enclosing instances with their bound instances."""
+        self.encl_cls = make_enclosing_cls(kind)
+        self.enclosings = [self.encl_cls() for _ in range(1_000)]
+        for enclosing in self.enclosings:
+            enclosing.attr
+
+        self.copied = copy.deepcopy(self.enclosings)
+        rebinding_cls = rebind_on_copy(type("Enclosing", (self.encl_cls,), {}))
+        self.rebinding = [rebinding_cls() for _ in range(1_000)]
+        for enclosing in self.rebinding:
+            enclosing.attr
+
+    def time_deepcopy(self, _: str) -> None:
+        """Deep copy, which rebinds the bound instances."""
+        copy.deepcopy(self.enclosings)
+
+    def time_get_after_deepcopy(self, _: str) -> None:
+        """Access on deep copies, which does not need to rebind."""
+        for enclosing in self.copied:
+            enclosing.attr
+
+    def time_copy_and_get(self, _: str) -> None:
+        """Shallow copy and access, which rebinds on access."""
+        for enclosing in self.enclosings:
+            copy.copy(enclosing).attr
+
+    def time_copy_and_get_rebind_on_copy(self, _: str) -> None:
+        """Shallow copy with `~bound_class.core.rebind_on_copy` and access."""
+        for enclosing in self.rebinding:
+            copy.copy(enclosing).attr
+
+
+class _Spherical(InstanceDescriptor["_Cartesian"]):
+    """Descriptor with the same computed attribute as a property and cached."""
+
+    @property
+    def r(self) -> float:
+        return math.hypot(self.enclosing.x, self.enclosing.y)
+
+    @bound_cached_property
+    def cached_r(self) -> float:
+        return math.hypot(self.enclosing.x, self.enclosing.y)
+
+    @tracked_cached_property
+    def tracked_r(self) -> float:
+        return math.hypot(self.enclosing.x, self.enclosing.y)
+
+
+@dataclasses.dataclass
+class _Cartesian:
+    x: float
+    y: float
+    z: float = 0.0
+    spherical = _Spherical()
+
+
+@track_fields
+@dataclasses.dataclass
+class _TrackedCartesian(_Cartesian):
+    pass
+
+
+class TimeCachedProperty:
+    """Time a computed attribute of a descriptor: a `property` and the cached properties."""
+
+    params = ["r", "cached_r", "tracked_r"]
+    param_names = ["attribute"]
+
+    def setup(self, attribute: str) -> None:
+        """Make an enclosing instance and access the attribute once."""
+        self.enclosing = _Cartesian(3.0, 4.0)
+        getattr(self.enclosing.spherical, attribute)
+
+    def time_get(self, attribute: str) -> None:
+        """Access the attribute on the bound descriptor."""
+        getattr(self.enclosing.spherical, attribute)
+
+
+class TimeTrackedWrite:
+    """Time writing a field of the enclosing object, then getting a cached value.
+
+    With ``invalidate_all`` every cached value is invalidated on a write, as
+    without dependency tracking. With ``tracked`` only the values that read the
+    written field are.
+    """
+
+    params = [["invalidate_all", "tracked"], ["x", "z"]]
+    param_names = ["invalidation", "field"]
+
+    def setup(self, invalidation: str, field: str) -> None:
+        """Make an enclosing instance and get the cached value once."""
+        self.tracked = invalidation == "tracked"
+        self.enclosing = (_TrackedCartesian if self.tracked else _Cartesian)(3.0, 4.0)
+        self.attribute = "tracked_r" if self.tracked else "cached_r"
+        self.field = field
+        getattr(self.enclosing.spherical, self.attribute)
+
+    def time_write_get(self, *_: Any) -> None:
+        """Write the field (``z`` is not read by the value) and get the value."""
+        setattr(self.enclosing, self.field, 1.0)
+        if not self.tracked:
+            invalidate(self.enclosing.spherical)
+        getattr(self.enclosing.spherical, self.attribute)
+
+
+DECORATORS = {
+    "dataclass": dataclasses.dataclass,
+    "light_dataclass": light_dataclass,
+}
+
+
+def _define_subclass(decorator: str, slots: bool) -> type:  # noqa: FBT001
+    """Define a descriptor subclass with two fields."""
+    base = SlottedInstanceDescriptor if slots else InstanceDescriptor
+
+    class Example(base):  # type: ignore[valid-type,misc]
+        __annotations__ = {"scale": "float", "offset": "float"}
+        scale = 1.0
+        offset = 0.0
+
+    return DECORATORS[decorator](slots=slots)(Example)
+
+
+class TimeDefineSubclass:
+    """Time defining a descriptor subclass that adds fields."""
+
+    params = [list(DECORATORS), [False, True]]
+    param_names = ["decorator", "slots"]
+
+    def time_define_subclass(self, decorator: str, slots: bool) -> None:  # noqa: FBT001
+        """Define the class and apply the decorator."""
+        _define_subclass(decorator, slots)
+
+
+class TimeClone:
+    """Time copying a descriptor, as on first access from an instance."""
+
+    params = [list(DECORATORS), [False, True]]
+    param_names = ["decorator", "slots"]
+
+    def setup(self, decorator: str, slots: bool) -> None:  # noqa: FBT001
+        """Make a descriptor."""
+        self.descriptor = _define_subclass(decorator, slots)(scale=2.0)
+
+    def time_replace(self, *_: Any) -> None:
+        """Copy with `dataclasses.replace`, which calls ``__init__``."""
+        dataclasses.replace(self.descriptor)
+
+    def time_clone(self, *_: Any) -> None:
+        """Copy with `bound_class.core.fields.clone`, which copies the fields."""
+        clone(self.descriptor)
+
+
+def main(number: int = 1_000_000) -> None:
+    """Print the repeated-access time relative to a plain dict lookup."""
+    ref = TimeDictLookup()
+    ref.setup()
+    lookup = min(timeit.repeat(ref.time_dict_lookup, number=number, repeat=5))
+
+    for kind in KINDS:
+        bench = TimeGet()
+        bench.setup(kind, "__dict__")
+        repeated = min(timeit.repeat(bench.time_repeated_get, number=number, repeat=5))
+        print(
+            f"{kind:<24} repeated get: {1e9 * repeated / number:6.1f} ns   "
+            f"dict lookup: {1e9 * lookup / number:6.1f} ns   ratio: {repeated / lookup:4.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
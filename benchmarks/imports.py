@@ -0,0 +1,65 @@
+"""Benchmarks for the import time of `bound_class.core`.
+
+Each import is in a new interpreter, timed with ``python -X importtime``.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+__all__: list[str] = []
+
+
+def import_time(code: str) -> int:
+    """Return the import time of `bound_class` when running ``code``.
+
+    Parameters
+    ----------
+    code : str
+        Python code run in a new interpreter, e.g. ``"import bound_class.core"``.
+
+    Returns
+    -------
+    int
+        The import time, in microseconds, of the modules of `bound_class` and
+        the modules they import. Modules imported lazily, on first access, are
+        included.
+
+    """
+    out = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    total = 0
+    for line in out.splitlines():
+        # columns: self time, cumulative time, indented module name
+        _, cumulative, name = line.split("|")
+        if name.startswith(" bound_class"):  # not indented, so imported by ``code``
+            total += int(cumulative)
+    return total
+
+
+class TrackImportTime:
+    """Import time, in microseconds, of the package and of what it provides.
+
+    The time is the least of ``repeat`` runs, as the first runs may be slowed
+    by writing bytecode caches.
+    """
+
+    params = [
+        "import bound_class.core",
+        "from bound_class.core import BoundClass",
+        "from bound_class.core.accessors import Accessor",
+        "from bound_class.core.descriptors import BoundDescriptor",
+        "from bound_class.core import register_accessor",
+    ]
+    param_names = ["code"]
+    unit = "us"
+    repeat = 10
+
+    def track_import_time(self, code: str) -> int:
+        """Import time of ``code``, including ``typing`` and other dependencies."""
+        return min(import_time(code) for _ in range(self.repeat))
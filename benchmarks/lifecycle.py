@@ -0,0 +1,99 @@
+"""Benchmarks for the lifecycle of many enclosing objects."""
+
+from __future__ import annotations
+
+import gc
+from typing import Any
+
+from benchmarks.descriptors import KINDS, make_enclosing_cls
+from bound_class.core.base import drain, set_deferred_cleanup
+
+__all__: list[str] = []
+
+
+class TimeLifecycle:
+    """Time making, accessing and dropping many enclosing objects."""
+
+    params = [KINDS[:3], [10_000, 1_000_000]]
+    param_names = ["kind", "n"]
+    number = 1
+    repeat = 3
+    warmup_time = 0
+    timeout = 300
+
+    def setup(self, kind: str, n: int) -> None:
+        """Make the enclosing class."""
+        self.encl_cls = make_enclosing_cls(kind)
+        self.n = n
+
+    def time_create_and_teardown(self, *_: Any) -> None:
+        """Make ``n`` enclosing objects, bind each, then drop them all."""
+        enclosings = [self.encl_cls() for _ in range(self.n)]
+        for enclosing in enclosings:
+            enclosing.attr
+        del enclosings
+        gc.collect()
+
+
+class TimeTeardown:
+    """Time dropping many bound enclosing objects."""
+
+    params = [KINDS[:3], [10_000, 1_000_000]]
+    param_names = ["kind", "n"]
+    # ``setup`` runs before each repeat, so each call has objects to drop.
+    number = 1
+    repeat = 3
+    warmup_time = 0
+    timeout = 300
+
+    def setup(self, kind: str, n: int) -> None:
+        """Make ``n`` enclosing objects, bind each."""
+        encl_cls = make_enclosing_cls(kind)
+        self.enclosings = [encl_cls() for _ in range(n)]
+        for enclosing in self.enclosings:
+            enclosing.attr
+
+    def time_teardown(self, *_: Any) -> None:
+        """Drop the enclosing objects and collect garbage."""
+        self.enclosings.clear()
+        gc.collect()
+
+
+class TimeDeferredTeardown:
+    """Time dropping many bound enclosing objects, with deferred cleanup.
+
+    ``time_teardown`` is the pause when the objects are dropped, and
+    ``time_teardown_and_drain`` adds the deferred cleanup, see
+    `bound_class.core.base.set_deferred_cleanup`.
+    """
+
+    params = [["immediate", "deferred"], [10_000, 1_000_000]]
+    param_names = ["cleanup", "n"]
+    # ``setup`` runs before each repeat, so each call has objects to drop.
+    number = 1
+    repeat = 3
+    warmup_time = 0
+    timeout = 300
+
+    def setup(self, cleanup: str, n: int) -> None:
+        """Make ``n`` enclosing objects, bind each."""
+        set_deferred_cleanup(cleanup == "deferred")
+        encl_cls = make_enclosing_cls("AccessorProperty")
+        self.enclosings = [encl_cls() for _ in range(n)]
+        for enclosing in self.enclosings:
+            enclosing.attr
+
+    def teardown(self, *_: Any) -> None:
+        """Turn deferred cleanup off, draining the queue."""
+        set_deferred_cleanup(False)
+
+    def time_teardown(self, *_: Any) -> None:
+        """Drop the enclosing objects and collect garbage."""
+        self.enclosings.clear()
+        gc.collect()
+
+    def time_teardown_and_drain(self, *_: Any) -> None:
+        """Drop the enclosing objects, collect garbage and clean up."""
+        self.enclosings.clear()
+        gc.collect()
+        drain()
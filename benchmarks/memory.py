@@ -0,0 +1,108 @@
+"""Memory benchmarks for bound objects."""
+
+from __future__ import annotations
+
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any
+
+from bound_class.core.accessors import Accessor, SlottedAccessor
+from bound_class.core.base import BoundClass, SlottedBoundClass
+from bound_class.core.descriptors import (
+    BoundDescriptor,
+    InstanceDescriptor,
+    SlottedBoundDescriptor,
+    SlottedInstanceDescriptor,
+)
+
+__all__: list[str] = []
+
+
+class _Enclosing:
+    pass
+
+
+class _SlottedAccessor(SlottedAccessor[Any]):
+    __slots__ = ()
+
+
+@dataclass(slots=True)
+class _SlottedBoundDescriptor(SlottedBoundDescriptor[Any]):
+    pass
+
+
+@dataclass(slots=True)
+class _SlottedInstanceDescriptor(SlottedInstanceDescriptor[Any]):
+    pass
+
+
+def _bind(kind: str, enclosing: Any) -> object:
+    """Make a bound object of type ``kind``."""
+    if kind in {"BoundClass", "SlottedBoundClass"}:
+        bound = BoundClass() if kind == "BoundClass" else SlottedBoundClass()
+        bound._set__self__(enclosing)
+        return bound
+    if kind == "Accessor":
+        return Accessor(enclosing)
+    if kind == "SlottedAccessor":
+        return _SlottedAccessor(enclosing)
+
+    descr = {
+        "BoundDescriptor": BoundDescriptor,
+        "InstanceDescriptor": InstanceDescriptor,
+        "SlottedBoundDescriptor": _SlottedBoundDescriptor,
+        "SlottedInstanceDescriptor": _SlottedInstanceDescriptor,
+    }[kind]()
+    descr.__set_name__(descr, "attr")
+    return descr._get_bound(enclosing)
+
+
+class TrackBoundObjectSize:
+    """Bytes per bound object, including its reference to the enclosing."""
+
+    params = [
+        "BoundClass",
+        "SlottedBoundClass",
+        "Accessor",
+        "SlottedAccessor",
+        "BoundDescriptor",
+        "SlottedBoundDescriptor",
+        "InstanceDescriptor",
+        "SlottedInstanceDescriptor",
+    ]
+    param_names = ["kind"]
+    unit = "bytes"
+
+    number = 10_000
+
+    def setup(self, _: str) -> None:
+        """Make the enclosing objects."""
+        self.enclosings = [_Enclosing() for _ in range(self.number)]
+
+    def track_bytes_per_object(self, kind: str) -> float:
+        """Average bytes allocated per bound object."""
+        _bind(kind, _Enclosing())  # warm up caches
+
+        tracemalloc.start()
+        try:
+            start, _ = tracemalloc.get_traced_memory()
+            bounds = [_bind(kind, enclosing) for enclosing in self.enclosings]
+            end, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        del bounds
+        # The list of bound objects is not part of the per-object cost.
+        return (end - start) / self.number - 8
+
+
+def main() -> None:
+    """Print the bytes per bound object."""
+    bench = TrackBoundObjectSize()
+    for kind in TrackBoundObjectSize.params:
+        bench.setup(kind)
+        print(f"{kind:<26} {bench.track_bytes_per_object(kind):6.1f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Benchmarks comparing the weak and strong ``ref_mode`` of bound classes."""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from typing import Any
+
+from bound_class.core.accessors import Accessor, AccessorProperty
+from bound_class.core.base import set_ref_mode
+
+__all__: list[str] = []
+
+REF_MODES = ["weak", "strong"]
+
+
+def make_enclosing_cls(ref_mode: str) -> type:
+    """Make an enclosing class with an accessor ``attr`` of mode ``ref_mode``."""
+    accessor_cls = type(f"{ref_mode.title()}Accessor", (Accessor,), {})
+    set_ref_mode(accessor_cls, ref_mode)  # type: ignore[arg-type]
+    return type("Enclosing", (), {"attr": AccessorProperty(accessor_cls)})
+
+
+class TimeRefMode:
+    """Time binding and dereferencing ``__self__``."""
+
+    params = REF_MODES
+    param_names = ["ref_mode"]
+
+    def setup(self, ref_mode: str) -> None:
+        """Make a bound accessor."""
+        encl_cls = make_enclosing_cls(ref_mode)
+        self.accessor_cls = vars(encl_cls)["attr"].accessor_cls
+        self.enclosing = encl_cls()
+        self.bound = self.enclosing.attr
+
+    def time_bind(self, _: str) -> None:
+        """Make a bound object, allocating its reference."""
+        self.accessor_cls(self.enclosing)
+
+    def time___self__(self, _: str) -> None:
+        """Dereference ``__self__``."""
+        self.bound.__self__
+
+
+class TrackRefModeSize:
+    """Bytes per bound object, including its reference to the enclosing."""
+
+    params = REF_MODES
+    param_names = ["ref_mode"]
+    unit = "bytes"
+
+    number = 10_000
+
+    def setup(self, ref_mode: str) -> None:
+        """Make the enclosing objects."""
+        self.encl_cls = make_enclosing_cls(ref_mode)
+        self.enclosings = [self.encl_cls() for _ in range(self.number)]
+
+    def track_bytes_per_object(self, _: str) -> float:
+        """Average bytes allocated per bound (and cached) accessor."""
+        self.encl_cls().attr  # warm up caches
+
+        tracemalloc.start()
+        try:
+            start, _ = tracemalloc.get_traced_memory()
+            for enclosing in self.enclosings:
+                enclosing.attr
+            end, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return (end - start) / self.number
+
+
+class TimeRefModeGC:
+    """Time garbage collection with many bound enclosing objects.
+
+    With weak references, dropped enclosing objects are freed by reference
+    counting, calling the callback of each reference. With strong references
+    they form cycles with their bound objects, which only `gc.collect` frees.
+    """
+
+    params = [REF_MODES, [10_000, 1_000_000]]
+    param_names = ["ref_mode", "n"]
+    # ``setup`` runs before each repeat, so each call has objects to drop.
+    number = 1
+    repeat = 3
+    warmup_time = 0
+    timeout = 300
+
+    def setup(self, ref_mode: str, n: int) -> None:
+        """Make ``n`` enclosing objects, bind each."""
+        encl_cls = make_enclosing_cls(ref_mode)
+        self.enclosings = [encl_cls() for _ in range(n)]
+        for enclosing in self.enclosings:
+            enclosing.attr
+        gc.collect()
+
+    def time_collect_live(self, *_: Any) -> None:
+        """A full collection while the objects are alive, e.g. a GC pause."""
+        gc.collect()
+
+    def time_teardown(self, *_: Any) -> None:
+        """Drop the enclosing objects and collect garbage."""
+        self.enclosings.clear()
+        gc.collect()
+
+
+def main() -> None:
+    """Print the bytes per bound object for each mode."""
+    bench = TrackRefModeSize()
+    for ref_mode in REF_MODES:
+        bench.setup(ref_mode)
+        print(f"{ref_mode:<8} {bench.track_bytes_per_object(ref_mode):6.1f} bytes")
+
+
+if __name__ == "__main__":
+    main()
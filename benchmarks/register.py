@@ -0,0 +1,44 @@
+"""Benchmarks for registering descriptors and accessors."""
+
+from __future__ import annotations
+
+from bound_class.core.accessors import Accessor, register_accessor
+from bound_class.core.descriptors import BoundDescriptor, register_descriptor
+
+__all__: list[str] = []
+
+
+class ExampleDescriptor(BoundDescriptor):
+    """Descriptor to register."""
+
+
+class ExampleAccessor(Accessor):
+    """Accessor to register."""
+
+
+class TimeRegister:
+    """Time registering on a new class.
+
+    Each registration is on a new class, so the time includes making the
+    class, see ``time_make_class``.
+    """
+
+    def time_make_class(self) -> None:
+        """Reference time: make the class registered on."""
+        type("Enclosing", (object,), {})
+
+    def time_register_descriptor(self) -> None:
+        """Register a descriptor."""
+        register_descriptor(type("Enclosing", (object,), {}), "attr")(ExampleDescriptor)
+
+    def time_register_accessor(self) -> None:
+        """Register an accessor."""
+        register_accessor(type("Enclosing", (object,), {}), "attr")(ExampleAccessor)
+
+    def time_register_lazy_descriptor(self) -> None:
+        """Register a descriptor by import path, without importing it."""
+        register_descriptor(type("Enclosing", (object,), {}), "attr")("benchmarks.register:ExampleDescriptor")
+
+    def time_register_lazy_accessor(self) -> None:
+        """Register an accessor by import path, without importing it."""
+        register_accessor(type("Enclosing", (object,), {}), "attr")("benchmarks.register:ExampleAccessor")
@@ -0,0 +1,72 @@
+"""Benchmarks for the exit time of an interpreter with many live bound objects.
+
+Each run is in a new interpreter, which binds ``n`` enclosing objects, keeps
+them alive and exits.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+
+__all__: list[str] = []
+
+CODE = """
+import time
+from bound_class.core.accessors import Accessor, AccessorProperty
+from bound_class.core.base import set_fast_shutdown
+
+set_fast_shutdown({fast})
+
+class Enclosing:
+    attr = AccessorProperty(Accessor)
+
+enclosings = [Enclosing() for _ in range({n})]
+for enclosing in enclosings:
+    enclosing.attr
+print(time.time())
+"""
+
+
+def exit_time(n: int, *, fast: bool) -> float:
+    """Return the time, in seconds, for an interpreter with ``n`` bound objects to exit.
+
+    Parameters
+    ----------
+    n : int
+        The number of enclosing objects, each with a bound accessor.
+    fast : bool
+        Whether fast shutdown is on, see
+        `bound_class.core.base.set_fast_shutdown`.
+
+    Returns
+    -------
+    float
+        The time from the end of the script to the end of the process.
+
+    """
+    out = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", CODE.format(n=n, fast=fast)],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return time.time() - float(out)
+
+
+class TrackExitTime:
+    """Exit time, in seconds, with many live bound objects.
+
+    The time is the least of ``repeat`` runs.
+    """
+
+    params = [["fast", "cleanup"], [100_000, 1_000_000]]
+    param_names = ["shutdown", "n"]
+    unit = "s"
+    repeat = 3
+    timeout = 300
+
+    def track_exit_time(self, shutdown: str, n: int) -> float:
+        """Time from the end of the script to the end of the process."""
+        return min(exit_time(n, fast=shutdown == "fast") for _ in range(self.repeat))
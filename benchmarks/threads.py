@@ -0,0 +1,59 @@
+"""Benchmarks for accessing bound instances from many threads."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from benchmarks.descriptors import KINDS, make_enclosing_cls
+
+__all__: list[str] = []
+
+
+class TimeThreads:
+    """Time ``__get__`` from 1 to N threads at once.
+
+    The enclosing objects are split between the threads, so with no contention
+    the time falls as threads are added (on a free-threaded build) or stays
+    flat (with the GIL). A global lock would make it rise.
+    """
+
+    params = [KINDS[:4], [1, 2, 4, 8]]
+    param_names = ["kind", "threads"]
+    number = 1
+    repeat = 5
+    warmup_time = 0
+
+    n = 20_000
+
+    def setup(self, kind: str, threads: int) -> None:
+        """Make the enclosing objects and start the threads."""
+        encl_cls = make_enclosing_cls(kind)
+        self.pool = ThreadPoolExecutor(threads)
+        self.chunks = [[encl_cls() for _ in range(self.n // threads)] for _ in range(threads)]
+        self.bound = [[encl_cls() for _ in range(self.n // threads)] for _ in range(threads)]
+        for chunk in self.bound:
+            for enclosing in chunk:
+                enclosing.attr
+
+        # Start the threads, so the timings do not include it.
+        barrier = threading.Barrier(threads)
+        list(self.pool.map(lambda _: barrier.wait(), range(threads)))
+
+    def teardown(self, *_: Any) -> None:
+        """Stop the threads."""
+        self.pool.shutdown()
+
+    @staticmethod
+    def _get(enclosings: list[Any]) -> None:
+        for enclosing in enclosings:
+            enclosing.attr
+
+    def time_first_get(self, *_: Any) -> None:
+        """First access, which makes and stores the bound instances."""
+        list(self.pool.map(self._get, self.chunks))
+
+    def time_get(self, *_: Any) -> None:
+        """Later accesses, which only read the stored bound instances."""
+        list(self.pool.map(self._get, self.bound))
@@ -0,0 +1,47 @@
+"""Build ``bound_class.core``, optionally compiling the hot modules with mypyc.
+
+Set the environment variable ``BOUND_CLASS_USE_MYPYC=1`` to compile
+`MYPYC_MODULES` with :mod:`mypyc`. Only then is mypy a build requirement.
+Otherwise, or if mypyc is not installed, the package is pure Python. The
+``.py`` sources are installed either way.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import warnings
+
+from setuptools import setup
+
+#: Modules compiled by mypyc. ``descriptors/base.py`` is excluded: mypyc
+#: treats ``__slots__`` in the body of a (non-native) dataclass as a field.
+MYPYC_MODULES = [
+    "src/bound_class/core/base.py",
+    "src/bound_class/core/accessors/descriptor.py",
+    "src/bound_class/core/descriptors/bound.py",
+    "src/bound_class/core/descriptors/instance.py",
+]
+
+#: The build requirements of mypyc, added to those in ``pyproject.toml``.
+MYPYC_REQUIRES = ["mypy>=1.5"]
+
+USE_MYPYC = os.environ.get("BOUND_CLASS_USE_MYPYC", "0") == "1"
+
+ext_modules = []
+if USE_MYPYC:
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        # mypyc is not yet installed when the build backend asks for the
+        # ``setup_requires`` (with ``egg_info``), so only warn when building.
+        if "egg_info" not in sys.argv:
+            warnings.warn("mypyc is not installed, building bound_class.core as pure Python", stacklevel=1)
+    else:
+        # ``separate=True`` because whole-program compilation assumes the
+        # classes have no interpreted subclasses, which all users define.
+        ext_modules = mypycify(MYPYC_MODULES, opt_level="3", separate=True)
+
+# The build backend asks for the ``setup_requires`` before building, so mypy is
+# installed in an isolated build environment only for a compiled build.
+setup(ext_modules=ext_modules, setup_requires=MYPYC_REQUIRES if USE_MYPYC else [])
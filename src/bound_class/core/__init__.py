@@ -1,19 +1,110 @@
 # see LICENSE.rst
 
-"""Bound Classes."""
+"""Bound Classes.
+
+The contents are imported on first access, so that, e.g., using
+`~bound_class.core.BoundClass` does not import the accessors and descriptors.
+"""
 
 from __future__ import annotations
 
-from bound_class.core.accessors import register_accessor
-from bound_class.core.base import BoundClass, BoundClassRef
-from bound_class.core.descriptors import BoundDescriptor, InstanceDescriptor, register_descriptor
+from typing import TYPE_CHECKING
+
+from bound_class.core.common import lazy_attributes
 from bound_class.core.setup_package import __version__  # noqa: F401
 
+if TYPE_CHECKING:
+    from bound_class.core.accessors import register_accessor
+    from bound_class.core.base import BoundClass, BoundClassRef, SlottedBoundClass
+    from bound_class.core.batched import Batch, batch, batch_type
+    from bound_class.core.budget import Budget, budget_usage, disable_budget, enable_budget, reset_budget
+    from bound_class.core.cached import bound_cached_property, invalidate
+    from bound_class.core.copying import rebind_on_copy
+    from bound_class.core.counters import collect_stats, disable_stats, enable_stats, reset_stats, stats
+    from bound_class.core.descriptors import (
+        BoundDescriptor,
+        InstanceDescriptor,
+        SlottedBoundDescriptor,
+        SlottedInstanceDescriptor,
+        register_descriptor,
+    )
+    from bound_class.core.descriptors.register import registered_attributes
+    from bound_class.core.diagnostics import MemoryReport, memory_report
+    from bound_class.core.hooks import add_hook, remove_hook
+    from bound_class.core.profiler import Profiler
+    from bound_class.core.tracking import track_fields, tracked_cached_property
+
 __all__ = [
+    "Batch",
     "BoundClass",
     "BoundClassRef",
+    "Budget",
     "BoundDescriptor",
     "InstanceDescriptor",
+    "MemoryReport",
+    "Profiler",
+    "SlottedBoundClass",
+    "SlottedBoundDescriptor",
+    "SlottedInstanceDescriptor",
+    "add_hook",
+    "batch",
+    "batch_type",
+    "bound_cached_property",
+    "budget_usage",
+    "collect_stats",
+    "disable_budget",
+    "disable_stats",
+    "enable_budget",
+    "enable_stats",
+    "invalidate",
+    "memory_report",
+    "rebind_on_copy",
     "register_descriptor",
     "register_accessor",
+    "registered_attributes",
+    "remove_hook",
+    "reset_budget",
+    "reset_stats",
+    "stats",
+    "track_fields",
+    "tracked_cached_property",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Batch": "bound_class.core.batched",
+        "Profiler": "bound_class.core.profiler",
+        "BoundClass": "bound_class.core.base",
+        "BoundClassRef": "bound_class.core.base",
+        "Budget": "bound_class.core.budget",
+        "BoundDescriptor": "bound_class.core.descriptors.bound",
+        "InstanceDescriptor": "bound_class.core.descriptors.instance",
+        "MemoryReport": "bound_class.core.diagnostics",
+        "SlottedBoundClass": "bound_class.core.base",
+        "SlottedBoundDescriptor": "bound_class.core.descriptors.bound",
+        "SlottedInstanceDescriptor": "bound_class.core.descriptors.instance",
+        "add_hook": "bound_class.core.hooks",
+        "batch": "bound_class.core.batched",
+        "batch_type": "bound_class.core.batched",
+        "bound_cached_property": "bound_class.core.cached",
+        "budget_usage": "bound_class.core.budget",
+        "collect_stats": "bound_class.core.counters",
+        "disable_budget": "bound_class.core.budget",
+        "disable_stats": "bound_class.core.counters",
+        "enable_budget": "bound_class.core.budget",
+        "enable_stats": "bound_class.core.counters",
+        "invalidate": "bound_class.core.cached",
+        "memory_report": "bound_class.core.diagnostics",
+        "rebind_on_copy": "bound_class.core.copying",
+        "register_descriptor": "bound_class.core.descriptors.register",
+        "register_accessor": "bound_class.core.accessors.register",
+        "registered_attributes": "bound_class.core.descriptors.register",
+        "remove_hook": "bound_class.core.hooks",
+        "reset_budget": "bound_class.core.budget",
+        "reset_stats": "bound_class.core.counters",
+        "stats": "bound_class.core.counters",
+        "track_fields": "bound_class.core.tracking",
+        "tracked_cached_property": "bound_class.core.tracking",
+    },
+)
@@ -1,12 +1,43 @@
-"""Accessors."""
+"""Accessors.
 
-from bound_class.core.accessors.core import Accessor, AccessorLike
-from bound_class.core.accessors.descriptor import AccessorProperty
-from bound_class.core.accessors.register import register_accessor
+The contents are imported on first access.
+"""
+
+from typing import TYPE_CHECKING
+
+from bound_class.core.common import lazy_attributes
+
+if TYPE_CHECKING:
+    from bound_class.core.accessors.asynchronous import AsyncAccessor, AsyncAccessorLike, AsyncAccessorProperty
+    from bound_class.core.accessors.core import Accessor, AccessorLike, SlottedAccessor
+    from bound_class.core.accessors.descriptor import AccessorProperty, CachedAccessorProperty
+    from bound_class.core.accessors.register import register_accessor, register_accessor_entry_points
 
 __all__ = [
     "AccessorLike",
     "Accessor",
     "AccessorProperty",
+    "AsyncAccessor",
+    "AsyncAccessorLike",
+    "AsyncAccessorProperty",
+    "CachedAccessorProperty",
     "register_accessor",
+    "register_accessor_entry_points",
+    "SlottedAccessor",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "AccessorLike": "bound_class.core.accessors.core",
+        "Accessor": "bound_class.core.accessors.core",
+        "AccessorProperty": "bound_class.core.accessors.descriptor",
+        "AsyncAccessor": "bound_class.core.accessors.asynchronous",
+        "AsyncAccessorLike": "bound_class.core.accessors.asynchronous",
+        "AsyncAccessorProperty": "bound_class.core.accessors.asynchronous",
+        "CachedAccessorProperty": "bound_class.core.accessors.descriptor",
+        "register_accessor": "bound_class.core.accessors.register",
+        "register_accessor_entry_points": "bound_class.core.accessors.register",
+        "SlottedAccessor": "bound_class.core.accessors.core",
+    },
+)
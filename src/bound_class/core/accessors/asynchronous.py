@@ -0,0 +1,224 @@
+"""Accessors that are initialized asynchronously, e.g. with I/O."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Coroutine,
+    Generator,
+    Generic,
+    Literal,
+    MutableMapping,
+    Protocol,
+    TypeVar,
+    overload,
+)
+
+from bound_class.core.accessors.core import Accessor, AccessorLike
+from bound_class.core.base import BndTo, with_ref_mode
+from bound_class.core.storage import check_store_in, get_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
+__all__: list[str] = []
+
+T = TypeVar("T")
+
+
+class AsyncAccessorLike(AccessorLike[BndTo], Protocol):
+    """Protocol for accessors that are initialized asynchronously."""
+
+    async def ainit(self) -> None:
+        """Finish initializing the accessor, e.g. by loading data."""
+        ...
+
+
+class AsyncAccessor(Accessor[BndTo]):
+    """Base class for accessors that are initialized asynchronously.
+
+    Override `ainit` to, e.g., load data for the accessee. It is awaited once,
+    when the accessor is made, by `AsyncAccessorProperty`.
+
+    Parameters
+    ----------
+    accessee : object
+        The object to which this object is the accessor.
+
+    """
+
+    async def ainit(self) -> None:
+        """Finish initializing the accessor, e.g. by loading data.
+
+        By default this does nothing.
+        """
+
+
+class _Ready(Generic[T]):
+    """An awaitable of a value that is already available."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: T) -> None:
+        self.value = value
+
+    def __await__(self) -> Generator[Any, None, T]:
+        return self.value
+        yield  # a generator, without suspending  # pragma: no cover
+
+
+@dataclass
+class AsyncAccessorProperty(Generic[BndTo]):
+    """Descriptor for accessors that are initialized asynchronously.
+
+    Accessing the attribute from an instance returns an awaitable of the
+    accessor: ``accessor = await obj.attribute``. On the first ``await`` the
+    accessor is made and its ``ainit`` awaited, then the accessor is stored
+    in ``store_in``, like `~bound_class.core.accessors.AccessorProperty`.
+    Later awaits return the stored accessor without suspending.
+
+    Concurrent awaits on the same instance, before the accessor is stored,
+    share one in-flight `asyncio.Task`: the accessor is made and ``ainit``
+    awaited once. If ``ainit`` raises, every awaiter gets the error and the
+    next ``await`` tries again. Cancelling an awaiter does not cancel the
+    task, which still stores the accessor for later awaits.
+
+    Parameters
+    ----------
+    accessor_cls : type
+        The accessor class. See `AsyncAccessorLike` and `AsyncAccessor`.
+    store_in : {"__dict__", "_attrs_", "side_table"} or None, optional
+        Where to store the accessor, as for
+        `~bound_class.core.accessors.AccessorProperty`. If `None`, a new
+        accessor is made on every ``await``.
+    ref_mode : {"weak", "strong"} or None, optional
+        How the accessors reference the enclosing object, as for
+        `~bound_class.core.accessors.AccessorProperty`.
+
+    Raises
+    ------
+    ValueError
+        If the accessors have ``ref_mode="strong"`` and ``store_in`` is
+        ``"side_table"``, see `bound_class.core.storage.check_store_in`.
+
+    Examples
+    --------
+        >>> import asyncio
+        >>> from bound_class.core.accessors import AsyncAccessor
+
+        >>> class Calibration(AsyncAccessor):
+        ...     async def ainit(self):
+        ...         print("loading")
+        ...         await asyncio.sleep(0)  # e.g. read a file
+        ...         self.table = {"gain": 2.0}
+
+        >>> class Detector:
+        ...     calibration = AsyncAccessorProperty(Calibration)
+
+        >>> async def main():
+        ...     det = Detector()
+        ...     cals = await asyncio.gather(*(det.calibration for _ in range(3)))
+        ...     cal = await det.calibration
+        ...     return all(c is cal for c in cals), cal.table["gain"]
+        >>> asyncio.run(main())
+        loading
+        (True, 2.0)
+
+    """
+
+    accessor_cls: type[AsyncAccessorLike[BndTo]]
+    store_in: Literal["__dict__", "_attrs_", "side_table"] | None = "__dict__"
+    ref_mode: Literal["weak", "strong"] | None = field(default=None, kw_only=True)
+    _enclosing_attr: str = field(init=False, repr=False, compare=False)
+    # The class of the accessors made, as for `~bound_class.core.accessors.AccessorProperty`.
+    _accessor_type: type[AsyncAccessorLike[BndTo]] = field(init=False, repr=False, compare=False)
+    # The in-flight tasks, by event loop and ``id`` of the enclosing object,
+    # which the task keeps alive.
+    _tasks: dict[tuple[asyncio.AbstractEventLoop, int], asyncio.Task[Any]] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+
+    def __post_init__(self) -> None:
+        ref_mode = self.ref_mode
+        self._accessor_type = (
+            self.accessor_cls if ref_mode is None else with_ref_mode(self.accessor_cls, ref_mode)  # type: ignore[type-var]
+        )
+        check_store_in(self._accessor_type, self.store_in)
+        # Set the docstring
+        self.__doc__ = self.accessor_cls.__doc__
+
+    def __set_name__(self, _: Any, name: str) -> None:  # noqa: ANN401
+        """Store the name of the attribute on the enclosing object."""
+        self._enclosing_attr = name
+
+    @overload
+    def __get__(self, enclosing: None, _: type[BndTo]) -> type[AsyncAccessorLike[BndTo]]: ...
+
+    @overload
+    def __get__(self, enclosing: BndTo, _: None) -> Awaitable[AsyncAccessorLike[BndTo]]: ...
+
+    def __get__(
+        self,
+        enclosing: BndTo | None,
+        _: None | type[BndTo],
+    ) -> Awaitable[AsyncAccessorLike[BndTo]] | type[AsyncAccessorLike[BndTo]]:
+        # Opt 1) accessed from the class, so return the accessor class.
+        if enclosing is None:
+            return self.accessor_cls
+
+        # Opt 2) accessed from the instance. If the accessor is stored and
+        # bound, it is returned without suspending.
+        if self.store_in is None:
+            return self._make(enclosing, None)
+        cache = get_cache(enclosing, self.store_in)
+        accessor = self._cached(enclosing, cache)
+        if accessor is not None:
+            return _Ready(accessor)
+        return self._get(enclosing, cache)
+
+    def __set__(self, _: object, __: object) -> None:
+        raise AttributeError  # TODO: useful error message
+
+    def _cached(self, enclosing: BndTo, cache: MutableMapping[str, Any]) -> AsyncAccessorLike[BndTo] | None:
+        """Return the stored accessor, if it is bound to ``enclosing``."""
+        obj = cache.get(self._enclosing_attr)
+        if obj is None:
+            return None
+        if not isinstance(obj, self.accessor_cls):
+            msg = f"accessor must be type <{self.accessor_cls}> not <{type(obj)}>"
+            raise TypeError(msg)
+        selfref = obj.__selfref__
+        return obj if selfref is not None and selfref() is enclosing else None
+
+    async def _get(self, enclosing: BndTo, cache: MutableMapping[str, Any]) -> AsyncAccessorLike[BndTo]:
+        """Return the accessor, making it or waiting for it to be made."""
+        key = (asyncio.get_running_loop(), id(enclosing))
+        task = self._tasks.get(key)
+        if task is None:
+            # check again: it may have been stored since ``__get__``.
+            accessor = self._cached(enclosing, cache)
+            if accessor is not None:
+                return accessor
+
+            task = self._tasks[key] = asyncio.ensure_future(self._make(enclosing, cache))
+            task.add_done_callback(lambda t: self._tasks.pop(key) if self._tasks.get(key) is t else None)
+
+        # Shield the task, so cancelling one awaiter does not cancel it for all.
+        return await asyncio.shield(task)
+
+    def _make(
+        self, enclosing: BndTo, cache: MutableMapping[str, Any] | None
+    ) -> Coroutine[Any, Any, AsyncAccessorLike[BndTo]]:
+        """Return a coroutine to make the accessor, and store it in ``cache``."""
+
+        async def make() -> AsyncAccessorLike[BndTo]:
+            accessor = self._accessor_type(enclosing)
+            await accessor.ainit()
+            if cache is not None:  # store only once it is initialized
+                cache[self._enclosing_attr] = accessor
+            return accessor
+
+        return make()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Protocol, TypeVar, runtime_checkable
 
-from bound_class.core.base import BndTo, BoundClass, BoundClassLike
+from bound_class.core.base import BndTo, BoundClass, BoundClassLike, SlottedBoundClass
 
 __all__: list[str] = []
 
@@ -23,13 +23,10 @@ class AccessorLike(BoundClassLike[BndTo], Protocol):
     # from BoundClassLike
 
 
-class Accessor(BoundClass[BndTo]):
-    """A convenience base class for acceessors.
+class SlottedAccessor(SlottedBoundClass[BndTo]):
+    """`Accessor` without an instance ``__dict__``.
 
-    This class ensures the accessee is stored as a `weakref.ReferenceType` and
-    correctly cleaned up. Classes do NOT need to be subclasses of this class to
-    work with the accessor machinery. The only requirement is that they are
-    `AccessorLike` (a run-time-checkable `~typing.Protocool`).
+    Subclasses must also define ``__slots__`` to not gain a ``__dict__``.
 
     Parameters
     ----------
@@ -38,6 +35,8 @@ class Accessor(BoundClass[BndTo]):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, accessee: BndTo) -> None:
         self._set__self__(accessee)
 
@@ -54,3 +53,24 @@ class Accessor(BoundClass[BndTo]):
             obj = accessor.accessee obj...
         """
         return self.__self__
+
+
+class Accessor(SlottedAccessor[BndTo], BoundClass[BndTo]):
+    """A convenience base class for acceessors.
+
+    This class ensures the accessee is stored as a `weakref.ReferenceType` and
+    correctly cleaned up. Classes do NOT need to be subclasses of this class to
+    work with the accessor machinery. The only requirement is that they are
+    `AccessorLike` (a run-time-checkable `~typing.Protocool`).
+
+    Parameters
+    ----------
+    accessee : object
+        The object to which this object is the accessor.
+
+    See Also
+    --------
+    bound_class.core.accessors.SlottedAccessor
+        A version of this class without an instance ``__dict__``.
+
+    """
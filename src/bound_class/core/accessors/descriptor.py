@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Literal, MutableMapping, NoReturn, overload
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Generic, Iterable, Literal, MutableMapping, NoReturn, overload
 
-from bound_class.core.base import BndTo
+from mypy_extensions import mypyc_attr
+
+from bound_class.core.base import BndTo, with_ref_mode
 from bound_class.core.descriptors.base import BoundDescriptorBase
+from bound_class.core.locks import lock_for
+from bound_class.core.storage import SIDE_TABLE, check_store_in, side_table
 
 if TYPE_CHECKING:
     from bound_class.core.accessors.core import AccessorLike
@@ -14,6 +18,7 @@ if TYPE_CHECKING:
 __all__: list[str] = []
 
 
+@mypyc_attr(native_class=False)
 @dataclass
 class AccessorProperty(BoundDescriptorBase[BndTo]):
     """Descriptor for accessors.
@@ -24,24 +29,50 @@ class AccessorProperty(BoundDescriptorBase[BndTo]):
         Must NOT be None. This may look like a valid option, but it is not.
         :mod:`dataclasses` in Python <= 3.10 does not support inheitance and
         keyword argument ordering.
-    store_in : {"__dict__", "_attrs_"}
-        Should be in ``__slots__`` of enclosing object.
+    store_in : {"__dict__", "_attrs_", "side_table"} or None
+        Where to store the accessor: the enclosing object's ``__dict__``,
+        its ``_attrs_`` mapping (which should be in its ``__slots__``) or,
+        for enclosing objects with neither, the side table of
+        `bound_class.core.storage`. If `None`, a new accessor is made on
+        every access.
+    ref_mode : {"weak", "strong"} or None, optional
+        How the accessors made by this descriptor reference the enclosing
+        object, see `bound_class.core.base.set_ref_mode`. `None` (default)
+        keeps the mode of ``accessor_cls``. Otherwise the accessors are
+        instances of ``with_ref_mode(accessor_cls, ref_mode)`` (see
+        `bound_class.core.base.with_ref_mode`), and ``accessor_cls`` is not
+        changed.
+
+    Raises
+    ------
+    ValueError
+        If the accessors have ``ref_mode="strong"`` and ``store_in`` is
+        ``"side_table"``, see `bound_class.core.storage.check_store_in`.
 
     """
 
     # See https://github.com/pandas-dev/pandas/blob/main/pandas/_libs/properties.pyx for a CPython implementation
 
     accessor_cls: type[AccessorLike[BndTo]] | None = None
-    store_in: Literal["__dict__", "_attrs_"] | None = "__dict__"
+    store_in: Literal["__dict__", "_attrs_", "side_table"] | None = "__dict__"
+    ref_mode: Literal["weak", "strong"] | None = None
+    # The class of the accessors made: ``accessor_cls``, with ``ref_mode``.
+    _accessor_type: type[AccessorLike[BndTo]] = field(init=False, repr=False, compare=False)
 
     # TODO: not need this in py3.9 when have improved dataclass
     def __init__(
         self,
         accessor_cls: type[AccessorLike[BndTo]],
-        store_in: Literal["__dict__", "_attrs_"] | None = "__dict__",
+        store_in: Literal["__dict__", "_attrs_", "side_table"] | None = "__dict__",
+        *,
+        ref_mode: Literal["weak", "strong"] | None = None,
     ) -> None:
+        accessor_type = accessor_cls if ref_mode is None else with_ref_mode(accessor_cls, ref_mode)  # type: ignore[type-var]
+        check_store_in(accessor_type, store_in)
         object.__setattr__(self, "accessor_cls", accessor_cls)
         object.__setattr__(self, "store_in", store_in)
+        object.__setattr__(self, "ref_mode", ref_mode)
+        object.__setattr__(self, "_accessor_type", accessor_type)
 
     def __post_init__(self) -> None:
         # TODO: remove when py3.10+
@@ -74,23 +105,216 @@ class AccessorProperty(BoundDescriptorBase[BndTo]):
 
         # Opt 2) accessed from the instance, so return accesssor instance.
         if self.store_in is None:
-            accessor = self.accessor_cls(enclosing)
-
-        else:  # try to get from cache
-            cache: MutableMapping[str, Any] = getattr(enclosing, self.store_in)
-            obj = cache.get(self._enclosing_attr)  # get from enclosing.
-
-            if obj is None:  # hasn't been created on the enclosing
-                accesssor = self.accessor_cls(enclosing)
-                # store on enclosing instance
-                cache[self._enclosing_attr] = accesssor
-            elif not isinstance(obj, self.accessor_cls):
-                msg = f"accessor must be type <{type(self)}> not <{type(obj)}>"
+            return self._accessor_type(enclosing)
+
+        # try to get from cache
+        store_in = self.store_in
+        cache: MutableMapping[str, Any] = (
+            side_table(enclosing) if store_in == SIDE_TABLE else getattr(enclosing, store_in)
+        )
+        obj = cache.get(self._enclosing_attr)  # get from enclosing.
+
+        if obj is not None:
+            if not isinstance(obj, self.accessor_cls):
+                msg = f"accessor must be type <{self.accessor_cls}> not <{type(obj)}>"
                 raise TypeError(msg)
-            else:
-                accesssor = obj
+            # The cached accessor is usually bound to ``enclosing``. If not,
+            # e.g. it was shared by ``copy.copy``, a new one is made below.
+            selfref = obj.__selfref__
+            if selfref is not None and selfref() is enclosing:
+                return obj
+
+        # hasn't been created on (or isn't bound to) the enclosing. Make it
+        # once, even if many threads get here.
+        with lock_for(enclosing, self._enclosing_attr):
+            return self._make(enclosing, cache)
+
+    def _make(self, enclosing: BndTo, cache: MutableMapping[str, Any]) -> AccessorLike[BndTo]:
+        """Return the accessor bound to ``enclosing``, making it if needed.
+
+        Call with the lock of ``enclosing`` and the attribute, see
+        `bound_class.core.locks`.
+        """
+        assert self.accessor_cls is not None  # TODO: rm py3.10+  # noqa: S101
+
+        # check again, now with the lock: another thread may have made it.
+        obj = cache.get(self._enclosing_attr)
+        if isinstance(obj, self.accessor_cls):
+            selfref = obj.__selfref__
+            if selfref is not None and selfref() is enclosing:
+                return obj
+
+        accessor = self._accessor_type(enclosing)
+        # store on enclosing instance
+        cache[self._enclosing_attr] = accessor
 
         return accessor
 
-    def __set__(self, _: str, __: object) -> NoReturn:
+    def bind_many(self, enclosings: Iterable[BndTo]) -> list[AccessorLike[BndTo]]:  # type: ignore[override]
+        """Return the accessor bound to each of ``enclosings``.
+
+        This is equivalent to ``[getattr(enc, name) for enc in enclosings]``
+        for the attribute ``name`` of this descriptor, but the work that is the
+        same for every enclosing object is done once.
+
+        Parameters
+        ----------
+        enclosings : Iterable[BndTo]
+            Instances of the enclosing class.
+
+        Returns
+        -------
+        list[AccessorLike[BndTo]]
+            The accessors bound to each of ``enclosings``.
+
+        Raises
+        ------
+        TypeError
+            If an accessor stored on an enclosing object is not an instance of
+            ``accessor_cls``.
+
+        Examples
+        --------
+        From the class the attribute is the accessor class, so get the
+        descriptor from the class ``__dict__``:
+
+            >>> from bound_class.core.accessors import Accessor
+            >>> class Example:
+            ...     attribute = AccessorProperty(Accessor)
+            >>> exs = [Example() for _ in range(3)]
+            >>> accessors = vars(Example)["attribute"].bind_many(exs)
+            >>> all(a is ex.attribute for a, ex in zip(accessors, exs))
+            True
+
+        """
+        accessor_cls = self.accessor_cls
+        assert accessor_cls is not None  # TODO: rm py3.10+  # noqa: S101
+        store_in = self.store_in
+        if store_in is None:
+            accessor_type = self._accessor_type
+            return [accessor_type(enclosing) for enclosing in enclosings]
+
+        name = self._enclosing_attr
+        out: list[AccessorLike[BndTo]] = []
+        for enclosing in enclosings:
+            # As in `__get__`
+            cache: MutableMapping[str, Any] = (
+                side_table(enclosing) if store_in == SIDE_TABLE else getattr(enclosing, store_in)
+            )
+            obj = cache.get(name)
+            if obj is not None:
+                if not isinstance(obj, accessor_cls):
+                    msg = f"accessor must be type <{accessor_cls}> not <{type(obj)}>"
+                    raise TypeError(msg)
+                selfref = obj.__selfref__
+                if selfref is not None and selfref() is enclosing:
+                    out.append(obj)
+                    continue
+
+            with lock_for(enclosing, name):
+                out.append(self._make(enclosing, cache))
+
+        return out
+
+    def __set__(self, _: object, __: object) -> NoReturn:
         raise AttributeError  # TODO: useful error message
+
+
+@mypyc_attr(native_class=False)
+@dataclass
+class CachedAccessorProperty(Generic[BndTo]):
+    """Non-data descriptor for accessors, like `functools.cached_property`.
+
+    On first access from an instance the accessor is made and stored in the
+    instance's ``__dict__`` under the descriptor's name. As this is not a data
+    descriptor (it has no ``__set__``), the stored accessor then shadows the
+    descriptor and later reads are plain attribute lookups.
+
+    Parameters
+    ----------
+    accessor_cls : type
+        The accessor class.
+    ref_mode : {"weak", "strong"} or None, optional
+        How the accessors reference the enclosing object, as for
+        `AccessorProperty`.
+
+    Notes
+    -----
+    Like `AccessorProperty`, the accessor is made once per instance, even when
+    first accessed from many threads at the same time.
+
+    The enclosing class must have a ``__dict__``. Deleting the attribute, e.g.
+    ``del obj.accessor``, removes the cached accessor; it is remade on the next
+    access.
+
+    Accessors are `~bound_class.core.base.BoundClass` instances, so
+    `copy.deepcopy` and :mod:`pickle` of the enclosing object rebind the cached
+    accessor to the new object. `copy.copy` copies the enclosing ``__dict__``
+    without passing through this descriptor, so -- as with
+    `functools.cached_property` -- the copy shares the original's accessor.
+    Use `AccessorProperty`, which checks the binding on every access, if
+    shallow copies of the enclosing object are common, decorate the enclosing
+    class with `~bound_class.core.rebind_on_copy`, or ``del`` the attribute on
+    the copy.
+
+    Examples
+    --------
+        >>> from bound_class.core.accessors import Accessor
+        >>> class ExampleAccessor(Accessor):
+        ...     pass
+        >>> class Example:
+        ...     attribute = CachedAccessorProperty(ExampleAccessor)
+
+        >>> ex = Example()
+        >>> ex.attribute.accessee is ex
+        True
+        >>> vars(ex)["attribute"] is ex.attribute
+        True
+
+    """
+
+    # See https://github.com/pandas-dev/pandas/blob/main/pandas/core/accessor.py for ``CachedAccessor``
+
+    accessor_cls: type[AccessorLike[BndTo]]
+    ref_mode: Literal["weak", "strong"] | None = field(default=None, kw_only=True)
+    _enclosing_attr: str = field(init=False, repr=False, compare=False)
+    # The class of the accessors made, as for `AccessorProperty`.
+    _accessor_type: type[AccessorLike[BndTo]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        ref_mode = self.ref_mode
+        self._accessor_type = (
+            self.accessor_cls if ref_mode is None else with_ref_mode(self.accessor_cls, ref_mode)  # type: ignore[type-var]
+        )
+        # Set the docstring
+        self.__doc__ = self.accessor_cls.__doc__
+
+    def __set_name__(self, _: Any, name: str) -> None:  # noqa: ANN401
+        """Store the name of the attribute on the enclosing object."""
+        self._enclosing_attr = name
+
+    @overload
+    def __get__(self, enclosing: None, _: type[BndTo]) -> type[AccessorLike[BndTo]]: ...
+
+    @overload
+    def __get__(self, enclosing: BndTo, _: None) -> AccessorLike[BndTo]: ...
+
+    def __get__(
+        self,
+        enclosing: BndTo | None,
+        _: None | type[BndTo],
+    ) -> AccessorLike[BndTo] | type[AccessorLike[BndTo]]:
+        # Opt 1) accessed from the class, so return the accessor class.
+        if enclosing is None:
+            return self.accessor_cls
+
+        # Opt 2) accessed from the instance, so make the accessor and store it
+        # where it shadows this descriptor. Another thread may have just done
+        # so, in which case that accessor is used.
+        name = self._enclosing_attr
+        cache = enclosing.__dict__
+        with lock_for(enclosing, name):
+            accessor = cache.get(name)
+            if accessor is None:
+                accessor = cache[name] = self._accessor_type(enclosing)
+        return accessor
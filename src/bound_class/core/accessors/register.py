@@ -3,15 +3,21 @@
 from __future__ import annotations
 
 import warnings
-from typing import TYPE_CHECKING, Callable, Literal
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Literal, TypeVar
 
-from bound_class.core.accessors.descriptor import AccessorProperty
-from bound_class.core.descriptors.register import DescriptorRegistrationWarning
+from bound_class.core.accessors.descriptor import AccessorProperty, CachedAccessorProperty
+from bound_class.core.batched import batch_type
+from bound_class.core.descriptors.register import DescriptorRegistrationWarning, LazyDescriptor, _record
+from bound_class.core.storage import SIDE_TABLE
 
 if TYPE_CHECKING:
+    from bound_class.core.accessors.asynchronous import AsyncAccessorProperty
     from bound_class.core.accessors.core import AccessorLike
     from bound_class.core.base import BndTo
 
+    Registered = TypeVar("Registered", bound="type[AccessorLike[Any]] | str")
+
 __all__: list[str] = []
 
 
@@ -19,12 +25,16 @@ class AccessorRegistrationWarning(DescriptorRegistrationWarning):
     """Warning for conflicts in accessor registration."""
 
 
-def register_accessor(
+def register_accessor(  # noqa: PLR0913
     cls: type[BndTo],
     name: str,
     *,
-    store_in: Literal["__dict__", "_attrs_"] | None = "__dict__",
-) -> Callable[[type[AccessorLike[BndTo]]], type[AccessorLike[BndTo]]]:
+    store_in: Literal["__dict__", "_attrs_", "side_table"] | None = "__dict__",
+    shadow: bool = False,
+    asynchronous: bool = False,
+    batched: type[AccessorLike[Any]] | str | None = None,
+    ref_mode: Literal["weak", "strong"] | None = None,
+) -> Callable[[Registered], Registered]:
     """Decorator to register an accessor class.
 
     Parameters
@@ -33,18 +43,70 @@ def register_accessor(
         The class to which to add the accessor.
     name : str
         The name of the accessor on `cls`.
-    store_in : Literal["__dict__", "_attrs_"] | None, optional
-        The attribute of the class to which to store the accessor instance. By
-        default, this is ``"__dict__"``.
+    store_in : Literal["__dict__", "_attrs_", "side_table"] | None, optional
+        The attribute of the class to which to store the accessor instance,
+        or ``"side_table"`` for classes without ``__dict__`` (see
+        `bound_class.core.storage`). By default, this is ``"__dict__"``.
+    shadow : bool, optional
+        Whether the cached accessor instance shadows the descriptor, like
+        `functools.cached_property`, so that after the first access reads are
+        plain attribute lookups. See
+        `~bound_class.core.accessors.CachedAccessorProperty`. Requires
+        ``store_in="__dict__"``. By default, `False`.
+    asynchronous : bool, optional
+        Whether the accessor is initialized asynchronously, so that the
+        attribute must be awaited: ``await obj.name``. The accessor must have
+        an ``async def ainit(self)`` method, e.g. by subclassing
+        `~bound_class.core.accessors.AsyncAccessor`. See
+        `~bound_class.core.accessors.AsyncAccessorProperty`. By default,
+        `False`.
+    batched : type[AccessorLike] or str or None, optional
+        A vectorized implementation of the accessor, registered under ``name``
+        on the `~bound_class.core.batched.batch_type` of ``cls``. It is used on
+        a `~bound_class.core.batched.Batch` of instances of ``cls``, whose
+        fields are arrays. Without it, the accessor is used on each instance in
+        the batch. See `~bound_class.core.register_descriptor` for an example.
+    ref_mode : {"weak", "strong"} or None, optional
+        How the accessors reference the object they are bound to, see
+        `~bound_class.core.base.set_ref_mode`. `None` (default) keeps the mode
+        of the accessor class, which is weak unless set. Otherwise the
+        accessors of this registration are instances of
+        `~bound_class.core.base.with_ref_mode` of the class, which is not
+        changed. ``"strong"`` also binds objects that are not
+        weak-referenceable, but cannot be used with
+        ``store_in="side_table"``.
 
     Returns
     -------
-    Callable[[type[AccessorLike[BndTo]]], type[AccessorLike[BndTo]]]
-        The decorator.
+    Callable
+        Decorator for the accessor class. Instead of the class, it can be
+        called with its import path ``"module:qualname"`` to import the class
+        on the first access of the accessor, from the class or an instance.
+        See also `register_accessor_entry_points`.
+
+    Raises
+    ------
+    ValueError
+        If ``shadow`` is `True` and ``store_in`` is not ``"__dict__"``, if
+        both ``shadow`` and ``asynchronous`` are `True`, if ``ref_mode`` is
+        not valid, or if the accessors have ``ref_mode="strong"`` and
+        ``store_in`` is ``"side_table"``.
+    TypeError
+        If ``ref_mode`` is given and the accessor class is not a
+        `~bound_class.core.base.SlottedBoundClass` subclass.
 
     """
-
-    def decorator(accessor_cls: type[AccessorLike[BndTo]]) -> type[AccessorLike[BndTo]]:
+    if shadow and store_in != "__dict__":
+        msg = f"shadow=True requires store_in='__dict__', not {store_in!r}"
+        raise ValueError(msg)
+    if shadow and asynchronous:
+        msg = "shadow=True and asynchronous=True are incompatible"
+        raise ValueError(msg)
+    if ref_mode == "strong" and store_in == SIDE_TABLE:
+        msg = "ref_mode='strong' cannot be used with store_in='side_table'"
+        raise ValueError(msg)
+
+    def decorator(accessor_cls: Registered) -> Registered:
         # TODO: validation that ``accessor_cls``
 
         if hasattr(cls, name):
@@ -55,10 +117,80 @@ def register_accessor(
                 stacklevel=2,
             )
 
-        descriptor = AccessorProperty(accessor_cls, store_in=store_in)
-        descriptor.__set_name__(descriptor, name)
-        setattr(cls, name, descriptor)
+        if isinstance(accessor_cls, str):
+            register = partial(_set_accessor, cls, name, store_in, shadow, asynchronous, ref_mode)
+            setattr(cls, name, LazyDescriptor(accessor_cls, register))
+            _record(cls, name)
+        else:
+            _set_accessor(cls, name, store_in, shadow, asynchronous, ref_mode, accessor_cls)
+
+        if batched is not None:
+            register_accessor(
+                batch_type(cls), name, store_in=store_in, shadow=shadow, asynchronous=asynchronous, ref_mode=ref_mode
+            )(batched)
 
         return accessor_cls
 
     return decorator
+
+
+def _set_accessor(  # noqa: PLR0913
+    cls: type[BndTo],
+    name: str,
+    store_in: Literal["__dict__", "_attrs_", "side_table"] | None,
+    shadow: bool,  # noqa: FBT001
+    asynchronous: bool,  # noqa: FBT001
+    ref_mode: Literal["weak", "strong"] | None,
+    accessor_cls: type[AccessorLike[BndTo]],
+) -> AccessorProperty[BndTo] | CachedAccessorProperty[BndTo] | AsyncAccessorProperty[BndTo]:
+    """Make the accessor descriptor and set it on the class."""
+    descriptor: AccessorProperty[BndTo] | CachedAccessorProperty[BndTo] | AsyncAccessorProperty[BndTo]
+    if asynchronous:
+        # Imported here, as importing `asyncio` is slow.
+        from bound_class.core.accessors.asynchronous import AsyncAccessorProperty
+
+        descriptor = AsyncAccessorProperty(accessor_cls, store_in=store_in, ref_mode=ref_mode)  # type: ignore[arg-type]
+    elif shadow:
+        descriptor = CachedAccessorProperty(accessor_cls, ref_mode=ref_mode)
+    else:
+        descriptor = AccessorProperty(accessor_cls, store_in=store_in, ref_mode=ref_mode)
+    descriptor.__set_name__(descriptor, name)
+    setattr(cls, name, descriptor)
+    _record(cls, name)
+    return descriptor
+
+
+def register_accessor_entry_points(
+    cls: type[BndTo],
+    group: str,
+    **kwargs: Any,  # noqa: ANN401
+) -> list[str]:
+    """Register the accessors advertised under an entry-point group.
+
+    Each entry point in ``group`` registers the accessor class at its value,
+    ``"module:qualname"``, under its name, like
+    ``register_accessor(cls, ep.name, **kwargs)(ep.value)``. The accessor
+    modules are imported on first access, not here.
+
+    Parameters
+    ----------
+    cls : type[BndTo]
+        The class to which to add the accessors.
+    group : str
+        The entry-point group, e.g. ``"mypackage.accessors"``.
+    **kwargs : Any
+        Arguments passed to `register_accessor`.
+
+    Returns
+    -------
+    list[str]
+        The names of the registered accessors.
+
+    """
+    from importlib.metadata import entry_points  # slow, so only when needed
+
+    names = []
+    for ep in entry_points(group=group):
+        register_accessor(cls, ep.name, **kwargs)(ep.value)
+        names.append(ep.name)
+    return names
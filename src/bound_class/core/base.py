@@ -1,41 +1,33 @@
 """Bound classes."""
 
 # TODO: the following list
-# 1. compile this with mypyc when https://github.com/python/mypy/issues/13231 is resolved
-# 2. clean up shim when py3.9+
-# 3. decide __selfref__ or __self_ref__ or ...
+# 1. make the classes native to mypyc when https://github.com/python/mypy/issues/13231 is resolved
+# 2. decide __selfref__ or __self_ref__ or ...
 
 
 from __future__ import annotations
 
-import sys
+import atexit
 import weakref
-from typing import TYPE_CHECKING, Any, Callable, Generic, Protocol, TypeVar
+from collections import deque
+from copy import deepcopy
+from functools import partial, partialmethod
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Generic, Literal, Protocol, TypeVar
+
+from mypy_extensions import mypyc_attr
 
 __all__: list[str] = []
 
 if TYPE_CHECKING:
     Self = TypeVar("Self")
+    SelfBound = TypeVar("SelfBound", bound="SlottedBoundClass[Any]")
     # TODO: ``from typing_extensions import Self`` when supported
 
 BndTo = TypeVar("BndTo")
 
 
-if sys.version_info >= (3, 9):
-
-    class ReferenceTypeShim(weakref.ReferenceType[BndTo]):
-        """Python 3.9+ shim for `weakref.ReferenceType`."""
-
-else:  # TODO: remove when py3.9+
-
-    class ReferenceTypeShim(weakref.ReferenceType):
-        """Python 3.9+ shim for `weakref.ReferenceType`."""
-
-        def __class_getitem__(cls: type[ReferenceTypeShim], item: Any) -> type[ReferenceTypeShim]:  # noqa: ANN401
-            return cls
-
-
-class BoundClassRef(ReferenceTypeShim[BndTo]):
+@mypyc_attr(native_class=False)
+class BoundClassRef(weakref.ReferenceType[BndTo]):
     """`weakref.ref` keeping a `BoundClass` connected to its referant.
 
     Attributes
@@ -48,14 +40,19 @@ class BoundClassRef(ReferenceTypeShim[BndTo]):
     `weakref.ProxyType` autodetects and cleans up deletion of the referent.
     However, unlike a dereferenced `weakref.ReferenceType`, `~weakref.ProxyType`
     fails ``is`` and ``issubclass`` checks. To emulate the auto-cleanup of
-    `weakref.ProxyType`, this class adds a custom finalizer to
-    `~weakref.ReferenceType` that will clean the referent on the bound instance.
+    `weakref.ProxyType`, this class uses the callback of
+    `~weakref.ReferenceType` to clean the referent on the bound instance.
     It is therefore also necessary to store a weak reference (using the base
     `weakref.ref`) to the bound object in the attribute ``_bound_ref``.::
 
         bound object  --> BoundClassRef  --> referent
             ^------- ref <-----|
 
+    The callback lives on the reference itself, not in a global registry like
+    that of `weakref.finalize`, so a reference that is replaced (e.g. when the
+    bound object is rebound) is freed along with its callback and the memory
+    per (referent, bound object) pair is constant.
+
     """
 
     __slots__ = ("_bound_ref",)
@@ -66,33 +63,627 @@ class BoundClassRef(ReferenceTypeShim[BndTo]):
         ob: BndTo,
         callback: Callable[[weakref.ReferenceType[BndTo]], Any] | None = None,
         *,
-        bound: BoundClass[BndTo],  # noqa: ARG003
+        bound: SlottedBoundClass[BndTo],  # noqa: ARG003
     ) -> Self:
-        ref: Self = super().__new__(cls, ob, callback)  # type: ignore[misc]
+        # The weakref callback is called when the referant is deleted, setting
+        # ``bound.__selfref__ = None``. A user callback is called after that.
+        # With deferred cleanup, the callback only queues the reference, and
+        # each new reference cleans up a few queued ones.
+        cleanup: Callable[[Any], Any]
+        if callback is not None:
+            cleanup = partial(_chained_callback, callback)
+        elif _deferred:
+            cleanup = _pending.append
+            if _pending:
+                drain(DRAIN_BATCH)
+        else:
+            cleanup = _referent_callback
+        ref: Self = weakref.ReferenceType.__new__(cls, ob, cleanup)  # type: ignore[arg-type,type-var]
         return ref
 
     def __init__(
         self,
-        ob: BndTo,
+        ob: BndTo,  # noqa: ARG002
         _: Callable[[weakref.ReferenceType[BndTo]], Any] | None = None,
         *,
-        bound: BoundClass[BndTo],
+        bound: SlottedBoundClass[BndTo],
     ) -> None:
         # Add a reference to the BoundClass object (it holds ``ob``)
         self._bound_ref = weakref.ref(bound)
-        # Create a finalizer that will be called when the referant is deleted,
-        # setting ``bound.__selfref__ = None``.
-        weakref.finalize(ob, self._finalizer_callback)
 
     def _finalizer_callback(self) -> None:
         """Callback for finalizer that sets ``bound.__selfref__ = None``."""
         bound = self._bound_ref()
-        if bound is not None:  # check that reference to bound is alive.
+        # check that reference to bound is alive and still refers to this
+        # reference, not one from a later binding.
+        if bound is not None and getattr(bound, "__selfref__", None) is self:
             # del bound.__self__
             bound._del__self__()  # noqa: SLF001
 
 
-class BoundClass(Generic[BndTo]):
+@mypyc_attr(native_class=False)
+class StrongRef(Generic[BndTo]):
+    """A strong reference keeping a `BoundClass` connected to its referant.
+
+    Use it instead of `BoundClassRef` for referents that are not
+    weak-referenceable, e.g. of classes with ``__slots__`` but no
+    ``__weakref__`` slot, with ``ref_mode="strong"`` (see `set_ref_mode`). It
+    is called like a `weakref.ref` to dereference it, so ``__self__`` works as
+    with `BoundClassRef`, including raising `ReferenceError` after
+    ``__self__`` is deleted. Unlike `BoundClassRef`, it keeps the referent
+    alive for as long as the bound object is alive.
+
+    A bound object that is cached on its referent, in its ``__dict__`` or
+    ``_attrs_``, forms a reference cycle with it::
+
+        bound object  --> StrongRef  --> referent
+            ^------------------------------|
+
+    which the garbage collector frees once neither is otherwise referenced.
+    A bound object held from elsewhere, e.g. a global, keeps its referent
+    alive for as long as it is held. So bound objects with a `StrongRef`
+    cannot be stored in the side table of `bound_class.core.storage`, which
+    is global, and which needs weak references anyway. A referent with
+    neither ``__weakref__`` nor ``__dict__`` can cache them only in an
+    ``_attrs_`` slot (which costs more than a ``__weakref__`` slot), or not
+    at all, with ``store_in=None``.
+
+    There is no callback and no back-reference, so a `StrongRef` is also
+    smaller and faster to make than a `BoundClassRef`.
+
+    Examples
+    --------
+        >>> from bound_class.core.base import BoundClass
+
+        >>> class Record:
+        ...     __slots__ = ("value",)  # no "__weakref__"
+        >>> class Bound(BoundClass, ref_mode="strong"):
+        ...     pass
+
+        >>> rec, bound = Record(), Bound()
+        >>> bound._set__self__(rec)
+        >>> bound.__self__ is rec
+        True
+        >>> type(bound.__selfref__).__name__
+        'StrongRef'
+
+    """
+
+    __slots__ = ("_referent",)
+
+    def __init__(self, ob: BndTo, *, bound: SlottedBoundClass[BndTo]) -> None:  # noqa: ARG002
+        self._referent = ob
+
+    def __call__(self) -> BndTo:
+        """Return the referent."""
+        return self._referent
+
+
+#: The ``ref_mode`` of a bound class and the type of its reference to the
+#: bound object, see `set_ref_mode`.
+REF_MODES: dict[str, type[BoundClassRef[Any] | StrongRef[Any]]] = {"weak": BoundClassRef, "strong": StrongRef}
+
+
+def set_ref_mode(cls: type[SlottedBoundClass[Any]], ref_mode: Literal["weak", "strong"]) -> None:
+    """Set how instances of a bound class reference the object they are bound to.
+
+    Parameters
+    ----------
+    cls : type[SlottedBoundClass]
+        The bound class. Its instances that are bound afterwards, including
+        those of subclasses that do not set their own mode, use the mode.
+    ref_mode : {"weak", "strong"}
+        ``"weak"`` for a `BoundClassRef`, which does not keep the object
+        alive. ``"strong"`` for a `StrongRef`, which does, for objects that
+        are not weak-referenceable or that are short-lived anyway. Strong
+        bound objects cannot be stored in the side table, see `StrongRef`.
+
+    Raises
+    ------
+    TypeError
+        If ``cls`` is not a `SlottedBoundClass` subclass.
+    ValueError
+        If ``ref_mode`` is not one of `REF_MODES`.
+
+    """
+    _check_ref_mode(cls, ref_mode)
+    cls.__selfref_type__ = REF_MODES[ref_mode]
+
+
+def _check_ref_mode(cls: type, ref_mode: str) -> None:
+    """Raise an error if ``cls`` cannot have the mode ``ref_mode``, see `set_ref_mode`."""
+    if not (isinstance(cls, type) and issubclass(cls, SlottedBoundClass)):
+        msg = f"ref_mode requires a subclass of SlottedBoundClass, not {cls!r}"
+        raise TypeError(msg)
+    if ref_mode not in REF_MODES:
+        msg = f"ref_mode must be one of {list(REF_MODES)}, not {ref_mode!r}"
+        raise ValueError(msg)
+
+
+# The subclasses made by `with_ref_mode`, by class and mode. They are kept
+# alive by the descriptors and bound objects that use them.
+_ref_mode_classes: weakref.WeakValueDictionary[tuple[type, str], type] = weakref.WeakValueDictionary()
+
+
+def with_ref_mode(cls: type[SelfBound], ref_mode: Literal["weak", "strong"]) -> type[SelfBound]:
+    """Return a bound class like ``cls`` whose instances use ``ref_mode``.
+
+    Unlike `set_ref_mode`, ``cls`` is not changed: if it does not already use
+    ``ref_mode`` this returns a subclass of it, with the same name, that does.
+    It is made once per class and mode, and `ref_mode_base` returns ``cls``
+    from it. Its instances can be copied and pickled like those of ``cls``. `~bound_class.core.register_accessor` and
+    `~bound_class.core.register_descriptor` use it for their ``ref_mode``, so
+    that each registration of a class can have its own mode.
+
+    Parameters
+    ----------
+    cls : type[SlottedBoundClass]
+        The bound class.
+    ref_mode : {"weak", "strong"}
+        See `set_ref_mode`.
+
+    Returns
+    -------
+    type[SlottedBoundClass]
+        ``cls`` or a subclass of it.
+
+    Raises
+    ------
+    TypeError
+        If ``cls`` is not a `SlottedBoundClass` subclass.
+    ValueError
+        If ``ref_mode`` is not one of `REF_MODES`.
+
+    Examples
+    --------
+        >>> class Bound(BoundClass):
+        ...     pass
+        >>> StrongBound = with_ref_mode(Bound, "strong")
+        >>> StrongBound.__name__, issubclass(StrongBound, Bound)
+        ('Bound', True)
+        >>> StrongBound.__selfref_type__.__name__, Bound.__selfref_type__.__name__
+        ('StrongRef', 'BoundClassRef')
+        >>> with_ref_mode(Bound, "strong") is StrongBound, with_ref_mode(Bound, "weak") is Bound
+        (True, True)
+
+    """
+    _check_ref_mode(cls, ref_mode)
+    if cls.__selfref_type__ is REF_MODES[ref_mode]:
+        return cls
+
+    key = (cls, ref_mode)
+    sub = _ref_mode_classes.get(key)
+    if sub is None:
+        namespace = {
+            "__slots__": (),
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "__doc__": cls.__doc__,
+            "__selfref_type__": REF_MODES[ref_mode],
+            "_ref_mode_base": cls,
+            "__reduce_ex__": partialmethod(_reduce_with_ref_mode),  # a method, also when compiled
+        }
+        sub = _ref_mode_classes[key] = type(cls)(cls.__name__, (cls,), namespace)  # type: ignore[misc]
+    return sub
+
+
+def ref_mode_base(cls: type) -> type:
+    """Return the class from which `with_ref_mode` made ``cls``, or ``cls`` itself.
+
+    Parameters
+    ----------
+    cls : type
+        A bound class.
+
+    Returns
+    -------
+    type
+        The class it was made from, or ``cls``.
+
+    Examples
+    --------
+        >>> class Bound(BoundClass):
+        ...     pass
+        >>> ref_mode_base(with_ref_mode(Bound, "strong")) is ref_mode_base(Bound) is Bound
+        True
+
+    """
+    base: type = vars(cls).get("_ref_mode_base", cls)
+    return base
+
+
+def _reduce_with_ref_mode(self: SlottedBoundClass[Any], _: int) -> tuple[Any, ...]:
+    """Reduce an instance of a `with_ref_mode` subclass, which pickle cannot find by name."""
+    cls = type(self)
+    ref_mode = next(mode for mode, ref_type in REF_MODES.items() if ref_type is cls.__selfref_type__)
+    return _new_with_ref_mode, (ref_mode_base(cls), ref_mode), self.__getstate__()
+
+
+def _new_with_ref_mode(cls: type[SelfBound], ref_mode: Literal["weak", "strong"]) -> SelfBound:
+    """Make an uninitialized instance of ``with_ref_mode(cls, ref_mode)``, for unpickling."""
+    sub = with_ref_mode(cls, ref_mode)
+    return sub.__new__(sub)
+
+
+# Whether fast shutdown is on, see `set_fast_shutdown`, and whether the
+# interpreter is exiting with it on, so that unbinding is skipped.
+_fast_shutdown = True
+_skip_unbind = False
+
+
+def set_fast_shutdown(enabled: bool = True) -> None:  # noqa: FBT001, FBT002
+    """Set whether to skip unbinding bound objects at interpreter exit.
+
+    When the interpreter exits, it deletes the objects that are still alive,
+    calling the callback of the `BoundClassRef` of each bound object whose
+    referent is deleted. The callback unbinds the bound object, which is
+    about to be deleted too, so with millions of bound objects exiting takes
+    seconds. With fast shutdown, on by default, an :mod:`atexit` handler
+    turns the callbacks into no-ops. ``__self__`` of a bound object whose
+    referent was deleted at exit still raises `ReferenceError`, but its
+    cached properties are not cleared and no ``"finalize"`` or ``"unbind"``
+    events are reported (see `bound_class.core.hooks`). User callbacks of a
+    `BoundClassRef` are still called.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        Whether to skip unbinding at exit.
+
+    """
+    global _fast_shutdown  # noqa: PLW0603
+    _fast_shutdown = enabled
+
+
+def _at_exit() -> None:
+    """`atexit` handler, skipping unbinding from then on if fast shutdown is on."""
+    global _skip_unbind  # noqa: PLW0603
+    _skip_unbind = _fast_shutdown
+
+
+# Registered on import, so it runs after the handlers of modules that import
+# this one, which may still rely on unbinding.
+atexit.register(_at_exit)
+
+
+# Whether new `BoundClassRef`s defer their cleanup, see `set_deferred_cleanup`,
+# and the references whose referent was deleted, to clean up in `drain`.
+_deferred = False
+_pending: deque[BoundClassRef[Any]] = deque()
+
+#: The number of queued references that `drain` processes on each new
+#: `BoundClassRef` and each ``__self__`` of an unbound one, with deferred
+#: cleanup. More than one, so the queue shrinks while references are made.
+DRAIN_BATCH = 2
+
+
+def set_deferred_cleanup(enabled: bool = True) -> None:  # noqa: FBT001, FBT002
+    """Set whether to defer unbinding bound objects whose referent is deleted.
+
+    By default, the callback of the `BoundClassRef` of a bound object unbinds
+    it as soon as its referent is deleted. When a batch of a million objects
+    is deleted, e.g. by the garbage collector, that is a million Python
+    calls, which lengthen the pause. With deferred cleanup the callbacks of
+    the references made from then on only queue the reference, at C speed,
+    and the bound objects are unbound by `drain`, or each on its next access
+    of ``__self__``. ``__self__`` raises `ReferenceError` either way, as the
+    referent is gone, but until then the bound object's
+    `~bound_class.core.cached.bound_cached_property` values are kept and its
+    ``"finalize"`` and ``"unbind"`` events (see `bound_class.core.hooks`)
+    are delayed.
+
+    Each new reference, and each such access of ``__self__``, also drains
+    `DRAIN_BATCH` queued references, so the queue does not grow without
+    bound while bound objects are made. Once they no longer are, the rest
+    stay queued, keeping their bound objects bound, until `drain` is called.
+    So call `drain` after a burst of deletions, or periodically.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        Whether to defer the cleanup. Turning it off drains the queue;
+        references made while it was on still queue.
+
+    Examples
+    --------
+        >>> from bound_class.core.base import BoundClass, drain, set_deferred_cleanup
+
+        >>> class Example:
+        ...     pass
+
+        >>> set_deferred_cleanup()
+        >>> exs = [Example() for _ in range(3)]
+        >>> bounds = [BoundClass() for _ in exs]
+        >>> for bound, ex in zip(bounds, exs):
+        ...     bound._set__self__(ex)
+        >>> del ex, exs
+        >>> bounds[0].__selfref__ is None  # not yet unbound
+        False
+        >>> drain()
+        3
+        >>> bounds[0].__selfref__ is None
+        True
+        >>> set_deferred_cleanup(False)
+
+    """
+    global _deferred  # noqa: PLW0603
+    _deferred = enabled
+    if not enabled:
+        drain()
+
+
+def drain(max_items: int | None = None) -> int:
+    """Unbind the bound objects whose referent was deleted with deferred cleanup.
+
+    See `set_deferred_cleanup`. It is safe to call from any thread, e.g.
+    periodically from a background thread, or after each batch of work.
+
+    Parameters
+    ----------
+    max_items : int or None, optional
+        The maximum number of queued references to process, to bound the
+        time taken. `None` (default) processes them all.
+
+    Returns
+    -------
+    int
+        The number of processed references.
+
+    """
+    n = 0
+    while max_items is None or n < max_items:
+        try:
+            ref = _pending.popleft()
+        except IndexError:
+            break
+        n += 1
+        bound = ref._bound_ref()  # noqa: SLF001
+        # Skip if already unbound on access of ``__self__``, or rebound.
+        if bound is None or getattr(bound, "__selfref__", None) is ref:
+            ref._finalizer_callback()  # noqa: SLF001
+    return n
+
+
+def _referent_callback(ref: BoundClassRef[Any]) -> None:
+    """`weakref.ref` callback for `BoundClassRef`."""
+    if not _skip_unbind:
+        ref._finalizer_callback()  # noqa: SLF001
+
+
+def _chained_callback(callback: Callable[[BoundClassRef[Any]], Any], ref: BoundClassRef[Any]) -> None:
+    """`weakref.ref` callback for `BoundClassRef`, followed by a user callback."""
+    if not _skip_unbind:
+        ref._finalizer_callback()  # noqa: SLF001
+    callback(ref)
+
+
+@mypyc_attr(native_class=False)
+class SlottedBoundClass(Generic[BndTo]):
+    """`BoundClass` without an instance ``__dict__``.
+
+    The reference to the bound object is stored in a slot, so instances are
+    smaller and faster to create than `BoundClass` instances. Subclasses must
+    also define ``__slots__`` to not gain a ``__dict__``.
+
+    Subclasses can choose the reference with the ``ref_mode`` class keyword,
+    ``class Bound(SlottedBoundClass, ref_mode="strong")``, see `set_ref_mode`.
+
+    Examples
+    --------
+        >>> class Example:
+        ...     pass
+        >>> class Slotted(SlottedBoundClass):
+        ...     __slots__ = ()
+        >>> ex, bound = Example(), Slotted()
+        >>> bound._set__self__(ex)
+        >>> bound.__self__ is ex
+        True
+        >>> hasattr(bound, "__dict__")
+        False
+
+    """
+
+    __slots__ = ("__selfref__", "__weakref__")
+
+    __selfref__: BoundClassRef[BndTo] | StrongRef[BndTo] | None
+
+    #: The type of reference to the bound object: `BoundClassRef` (weak) or
+    #: `StrongRef`, e.g. for objects that are not weak-referenceable. Set it
+    #: with ``ref_mode``, see `set_ref_mode`.
+    __selfref_type__: ClassVar[type[BoundClassRef[Any] | StrongRef[Any]]] = BoundClassRef
+
+    #: The names of the `~bound_class.core.cached.bound_cached_property`
+    #: attributes, whose values are cleared when the object is (re/un)bound.
+    _bound_cached_names: ClassVar[tuple[str, ...]] = ()
+
+    def __init_subclass__(
+        cls, *, ref_mode: Literal["weak", "strong"] | None = None, **kwargs: Any  # noqa: ANN401
+    ) -> None:
+        super().__init_subclass__(**kwargs)
+        if ref_mode is not None:
+            set_ref_mode(cls, ref_mode)
+
+    @property
+    def __self__(self) -> BndTo:
+        """Return object to which this one is bound.
+
+        Returns
+        -------
+        object
+
+        Raises
+        ------
+        `weakref.ReferenceError`
+            If no referant was assigned, if it was deleted, or if it was
+            de-refenced (e.g. by ``del self.__self__``).
+
+        """
+        selfref: BoundClassRef[BndTo] | StrongRef[BndTo] | None = getattr(self, "__selfref__", None)
+        if selfref is None:
+            msg = "no weakly-referenced object"
+            raise ReferenceError(msg)
+
+        boundto = selfref()  # dereference
+        if boundto is None:
+            if isinstance(selfref, BoundClassRef):  # its cleanup was deferred
+                selfref._finalizer_callback()  # noqa: SLF001
+                drain(DRAIN_BATCH)
+            msg = "weakly-referenced object no longer exists"
+            raise ReferenceError(msg)
+        return boundto
+
+    # TODO: https://github.com/python/mypy/issues/13231
+    # @__self__.setter
+    # def __self__(self, value: BndTo) -> None:
+    def _set__self__(self, value: BndTo) -> None:
+        # Set the reference.
+        object.__setattr__(self, "__selfref__", self.__selfref_type__(value, bound=self))
+        if self._bound_cached_names:
+            _clear_cached(self, self._bound_cached_names)
+        # Note: we use ReferenceType over ProxyType b/c the latter fails ``is``
+        # and ``issubclass`` checks. ProxyType autodetects and cleans up
+        # deletion of the referent, which ReferenceType does not, so we need a
+        # custom ReferenceType subclass to emulate this behavior.
+
+    # @__self__.deleter
+    # def __self__(self) -> None:
+    def _del__self__(self) -> None:
+        # Romove reference without deleting the attribute.
+        object.__setattr__(self, "__selfref__", None)
+        if self._bound_cached_names:
+            _clear_cached(self, self._bound_cached_names)
+
+    # ===============================================================
+    # Copying & Pickling
+
+    def __getstate__(self) -> tuple[dict[str, Any] | None, dict[str, Any]]:
+        """Return the state for copying and pickling.
+
+        The `BoundClassRef` cannot be copied or pickled, so the state holds the
+        bound object itself under ``"__selfref__"``, to be rebound by
+        `__setstate__`. When this object is pickled or deep-copied as part of
+        the bound object, the memo of :mod:`pickle` or `copy.deepcopy` makes
+        this a reference to the new bound object. The values of
+        `~bound_class.core.cached.bound_cached_property` attributes are left
+        out, as they are cleared on rebinding.
+
+        Returns
+        -------
+        tuple[dict[str, Any] | None, dict[str, Any]]
+            The instance ``__dict__`` (if any) and the slots.
+
+        """
+        slots = {name: getattr(self, name) for name in _slot_names(type(self)) if hasattr(self, name)}
+        if slots.get("__selfref__") is not None:
+            slots["__selfref__"] = slots["__selfref__"]()  # dereference
+        instance_dict: dict[str, Any] | None = getattr(self, "__dict__", None)
+        if instance_dict and self._bound_cached_names:
+            instance_dict = {k: v for k, v in instance_dict.items() if k not in self._bound_cached_names}
+        return instance_dict, slots
+
+    def __setstate__(self, state: tuple[dict[str, Any] | None, dict[str, Any]]) -> None:
+        """Set the state from `__getstate__`, rebinding the bound object.
+
+        Parameters
+        ----------
+        state : tuple[dict[str, Any] | None, dict[str, Any]]
+            The instance ``__dict__`` (if any) and the slots.
+
+        """
+        instance_dict, slots = state
+        if instance_dict:
+            self.__dict__.update(instance_dict)
+
+        slots = dict(slots)
+        has_selfref = "__selfref__" in slots
+        boundto = slots.pop("__selfref__", None)
+        for name, value in slots.items():
+            object.__setattr__(self, name, value)
+
+        if boundto is not None:
+            self._set__self__(boundto)
+        elif has_selfref:
+            self._del__self__()
+
+    def __copy__(self: SelfBound) -> SelfBound:
+        """Return a copy, bound to the same object."""
+        cls = type(self)
+        new = cls.__new__(cls)
+        new.__setstate__(self.__getstate__())
+        return new
+
+    def __deepcopy__(self: SelfBound, memo: dict[int, Any]) -> SelfBound:
+        """Return a deep copy, bound to the copy of the bound object.
+
+        The bound object is rebound once, here, so that e.g. descriptors
+        cached on a deep-copied enclosing object do not need to be rebound when
+        they are accessed. A weak reference does not own its referent, so the
+        bound object is only replaced by its copy if it is also being copied --
+        as when this object is in the bound object's ``__dict__`` -- otherwise
+        the copy stays bound to the same object.
+
+        Parameters
+        ----------
+        memo : dict[int, Any]
+            The `copy.deepcopy` memo.
+
+        Returns
+        -------
+        SlottedBoundClass
+
+        """
+        cls = type(self)
+        new = cls.__new__(cls)
+        memo[id(self)] = new
+
+        instance_dict, slots = self.__getstate__()
+        boundto = slots.pop("__selfref__", None)
+        state = (deepcopy(instance_dict, memo), {k: deepcopy(v, memo) for k, v in slots.items()})
+        if boundto is not None:
+            state[1]["__selfref__"] = memo.get(id(boundto), boundto)
+        elif hasattr(self, "__selfref__"):
+            state[1]["__selfref__"] = None
+
+        new.__setstate__(state)
+        return new
+
+
+def _clear_cached(obj: SlottedBoundClass[Any], names: tuple[str, ...]) -> None:
+    """Clear the cached values of the attributes ``names`` of ``obj``."""
+    cache = obj.__dict__
+    for name in names:
+        cache.pop(name, None)
+
+
+def _slot_names(cls: type) -> list[str]:
+    """Return the names of the (non-special) slots of a class.
+
+    Parameters
+    ----------
+    cls : type
+        The class.
+
+    Returns
+    -------
+    list[str]
+        The (mangled) slot names, excluding ``__dict__`` and ``__weakref__``.
+
+    """
+    names: list[str] = []
+    for c in cls.__mro__:
+        slots = c.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name in ("__dict__", "__weakref__"):
+                continue
+            if name.startswith("__") and not name.endswith("__"):  # private, so mangled
+                names.append(f"_{c.__name__.lstrip('_')}{name}")
+            else:
+                names.append(name)
+    return names
+
+
+@mypyc_attr(native_class=False)
+class BoundClass(SlottedBoundClass[BndTo]):
     """Base class for a class bound to an instance of another class.
 
     Attributes
@@ -151,55 +742,29 @@ class BoundClass(Generic[BndTo]):
         ... except ReferenceError: print("ex2 has been deleted")
         ex2 has been deleted
 
-    """
-
-    @property
-    def __self__(self) -> BndTo:
-        """Return object to which this one is bound.
-
-        Returns
-        -------
-        object
-
-        Raises
-        ------
-        `weakref.ReferenceError`
-            If no referant was assigned, if it was deleted, or if it was
-            de-refenced (e.g. by ``del self.__self__``).
+    See Also
+    --------
+    bound_class.core.base.SlottedBoundClass
+        A version of this class without an instance ``__dict__``.
 
-        """
-        if hasattr(self, "__selfref__") and isinstance(self.__selfref__, BoundClassRef):
-            boundto = self.__selfref__()  # dereference
-            if boundto is not None:
-                return boundto
+    """
 
-            msg = "weakly-referenced object no longer exists"
-            raise ReferenceError(msg)
 
-        msg = "no weakly-referenced object"
-        raise ReferenceError(msg)
+def _class_getitem(cls: type, _: Any) -> type:  # noqa: ANN401
+    """``__class_getitem__`` for classes that mypyc compiled without `typing.Generic`."""
+    return cls
 
-    # TODO: https://github.com/python/mypy/issues/13231
-    # @__self__.setter
-    # def __self__(self, value: BndTo) -> None:
-    def _set__self__(self, value: BndTo) -> None:
-        # Set the reference.
-        self.__selfref__: BoundClassRef[BndTo] | None
-        object.__setattr__(self, "__selfref__", BoundClassRef(value, bound=self))
-        # Note: we use ReferenceType over ProxyType b/c the latter fails ``is``
-        # and ``issubclass`` checks. ProxyType autodetects and cleans up
-        # deletion of the referent, which ReferenceType does not, so we need a
-        # custom ReferenceType subclass to emulate this behavior.
 
-    # @__self__.deleter
-    # def __self__(self) -> None:
-    def _del__self__(self) -> None:
-        # Romove reference without deleting the attribute.
-        object.__setattr__(self, "__selfref__", None)
+# mypyc drops `typing.Generic` from the bases of (non-native) compiled classes,
+# so they must be made subscriptable for ``SlottedBoundClass[BndTo]``.
+for _cls in (SlottedBoundClass, StrongRef):
+    if Generic not in _cls.__mro__:
+        setattr(_cls, "__class_getitem__", classmethod(_class_getitem))  # noqa: B010
+del _cls
 
 
 class BoundClassLike(Protocol[BndTo]):
     """Protocol for classes that behave like `BoundClass`."""
 
-    __selfref__: BoundClassRef[BndTo] | None
+    __selfref__: BoundClassRef[BndTo] | StrongRef[BndTo] | None
     __self__: BndTo
@@ -0,0 +1,207 @@
+"""Batches of enclosing objects, for vectorized accessors and descriptors."""
+
+from __future__ import annotations
+
+import weakref
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, Iterable, Iterator, TypeVar
+
+from bound_class.core.base import BndTo, SlottedBoundClass
+
+# NumPy is imported when first needed, not with this module.
+HAS_NUMPY = find_spec("numpy") is not None
+
+__all__: list[str] = []
+
+if TYPE_CHECKING:
+    Self = TypeVar("Self", bound="Batch[Any]")
+    # TODO: ``from typing_extensions import Self`` when supported
+
+
+class Batch(Generic[BndTo]):
+    """A homogeneous collection of enclosing objects.
+
+    Each enclosing class has its own subclass of `Batch` (see `batch_type`),
+    on which :func:`~bound_class.core.register_accessor` and
+    :func:`~bound_class.core.register_descriptor` put the batched
+    implementation of an accessor or descriptor. A batch is an enclosing
+    object like any other, but its fields are arrays, so a batched
+    implementation can be written like the per-object one, using vectorized
+    functions.
+
+    Parameters
+    ----------
+    objects : Iterable[BndTo] or None, optional
+        The enclosing objects, which must all be of type ``enclosing_cls``. A
+        field, e.g. ``batch.x``, is gathered from the objects on first access,
+        as a `numpy.ndarray` if NumPy is installed, otherwise as a `list`.
+    **fields : Any
+        Fields given directly, e.g. NumPy arrays, instead of gathered from
+        ``objects``.
+
+    Raises
+    ------
+    TypeError
+        If an object is not of type ``enclosing_cls``.
+
+    Notes
+    -----
+    A field is gathered once, so the batch does not see later changes to the
+    objects. Attributes without a batched implementation are gathered from the
+    objects like fields. If they are bound classes, e.g. accessors, they are
+    gathered into another batch, so that ``batch.accessor.attribute`` loops
+    over the objects.
+
+    As with any enclosing object, a batched accessor or descriptor does not
+    keep its batch alive, so keep a reference to the batch while using them.
+
+    """
+
+    #: The class of the enclosing objects.
+    enclosing_cls: ClassVar[type]
+
+    def __init__(self, objects: Iterable[BndTo] | None = None, /, **fields: Any) -> None:  # noqa: ANN401
+        if objects is not None:
+            objects = tuple(objects)
+            for obj in objects:
+                if type(obj) is not self.enclosing_cls:
+                    msg = f"batch of <{self.enclosing_cls}> cannot contain <{type(obj)}>"
+                    raise TypeError(msg)
+        self._objects: tuple[BndTo, ...] | None = objects
+        self._len = len(objects) if objects is not None else len(next(iter(fields.values()), ()))
+        self.__dict__.update(fields)
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        # Only called if ``name`` is not an attribute or field of the batch.
+        objects = self.__dict__.get("_objects")
+        if objects is None or name.startswith("_"):
+            msg = f"{type(self).__name__!r} object has no attribute {name!r}"
+            raise AttributeError(msg)
+
+        value = _gather([getattr(obj, name) for obj in objects])
+        self.__dict__[name] = value  # cache
+        return value
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[BndTo]:
+        if self._objects is None:
+            msg = "a batch made from fields cannot be iterated"
+            raise TypeError(msg)
+        return iter(self._objects)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} of {len(self)}>"
+
+    # ===============================================================
+
+    @classmethod
+    def from_fields(cls: type[Self], **fields: Any) -> Self:  # noqa: ANN401
+        """Make a batch from arrays of the fields of the enclosing objects.
+
+        Parameters
+        ----------
+        **fields : Any
+            The fields, e.g. NumPy arrays.
+
+        Returns
+        -------
+        Batch
+
+        """
+        return cls(None, **fields)
+
+
+def _gather(values: list[Any]) -> Any:  # noqa: ANN401
+    """Gather the values of an attribute of the objects in a batch."""
+    if values and isinstance(values[0], SlottedBoundClass) and all(type(v) is type(values[0]) for v in values):
+        return batch(values)
+    if HAS_NUMPY:
+        import numpy as np
+
+        return np.asarray(values)
+    return values
+
+
+class _WeakClass:
+    """Class attribute returning a class that it references weakly.
+
+    As `Batch.enclosing_cls`, so that a batch type does not keep its enclosing
+    class, the key of ``_BATCH_TYPES``, alive.
+    """
+
+    __slots__ = ("ref",)
+
+    def __init__(self, cls: type) -> None:
+        self.ref = weakref.ref(cls)
+
+    def __get__(self, _: object, __: type | None = None) -> type | None:
+        return self.ref()
+
+
+# The batch type of each enclosing class, while the enclosing class is alive.
+_BATCH_TYPES: weakref.WeakKeyDictionary[type, type[Batch[Any]]] = weakref.WeakKeyDictionary()
+
+
+def batch_type(cls: type[BndTo]) -> type[Batch[BndTo]]:
+    """Return the `Batch` subclass for an enclosing class.
+
+    Parameters
+    ----------
+    cls : type[BndTo]
+        The enclosing class.
+
+    Returns
+    -------
+    type[Batch[BndTo]]
+        The same class for every call with ``cls``. It does not keep ``cls``
+        alive.
+
+    """
+    try:
+        return _BATCH_TYPES[cls]
+    except KeyError:
+        batch_cls: type[Batch[BndTo]] = type(f"{cls.__name__}Batch", (Batch,), {"enclosing_cls": _WeakClass(cls)})
+        _BATCH_TYPES[cls] = batch_cls
+        return batch_cls
+
+
+def batch(objects: Iterable[BndTo]) -> Batch[BndTo]:
+    """Make a batch of enclosing objects.
+
+    Parameters
+    ----------
+    objects : Iterable[BndTo]
+        Enclosing objects, all of the same type. There must be at least one.
+
+    Returns
+    -------
+    Batch[BndTo]
+        An instance of the `batch_type` of the objects' type.
+
+    Raises
+    ------
+    ValueError
+        If ``objects`` is empty.
+    TypeError
+        If the objects are not all of the same type.
+
+    Examples
+    --------
+        >>> from dataclasses import dataclass
+        >>> @dataclass
+        ... class Point:
+        ...     x: float
+        >>> points = batch([Point(1.0), Point(2.0)])
+        >>> points
+        <PointBatch of 2>
+        >>> print(*points.x)
+        1.0 2.0
+
+    """
+    objects = tuple(objects)
+    if not objects:
+        msg = "cannot batch no objects"
+        raise ValueError(msg)
+    return batch_type(type(objects[0]))(objects)
@@ -0,0 +1,261 @@
+"""An opt-in memory budget for the cached bound objects of all enclosing objects.
+
+Descriptors and accessors cache their bound objects on the enclosing object,
+so they live as long as it does. With a budget, the least-recently-used bound
+objects are evicted from their enclosing objects when there are more than
+``max_count`` or they take more than ``max_bytes``. An evicted object is made
+again on the next access, like on first access.
+
+Like the `bound_class.core.counters`, the budget is off by default and then
+costs nothing. It is built on the hooks of `bound_class.core.hooks`: turning
+it on swaps in versions of the methods of the descriptors and accessors that
+report each access, which are used to order the bound objects by when they
+were last accessed.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import weakref
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from bound_class.core import hooks
+from bound_class.core.storage import get_cache, locate
+
+__all__: list[str] = []
+
+
+@dataclass(slots=True)
+class _Entry:
+    """A cached bound object, with where it is stored on the object it is bound to."""
+
+    bound_ref: weakref.KeyedRef[Any, Any]
+    store_in: str
+    name: str
+    nbytes: int
+
+
+# The cached bound objects, by ``id``, from least to most recently used.
+_entries: OrderedDict[int, _Entry] = OrderedDict()
+_nbytes = 0
+_evictions: Counter[type] = Counter()
+_limits: tuple[int | None, int | None] = (None, None)
+# Re-entrant, as evicting a bound object can delete it, calling `_forget`.
+_lock = threading.RLock()
+
+
+@dataclass(frozen=True)
+class Budget:
+    """The limits and use of the memory budget.
+
+    Parameters
+    ----------
+    max_count, max_bytes : int or None
+        The limits, see `enable_budget`.
+    count : int
+        The number of cached bound objects that are tracked.
+    nbytes : int
+        Their estimated size in bytes, see `enable_budget`.
+    evictions : Counter[type]
+        The number of evicted bound objects, by class.
+
+    """
+
+    max_count: int | None = None
+    max_bytes: int | None = None
+    count: int = 0
+    nbytes: int = 0
+    evictions: Counter[type] = field(default_factory=Counter)
+
+    def __str__(self) -> str:
+        """Return a summary, with the evictions per class."""
+        limits = ", ".join(
+            f"{name}={limit}"
+            for name, limit in (("max_count", self.max_count), ("max_bytes", self.max_bytes))
+            if limit is not None
+        )
+        lines = [f"budget ({limits or 'off'}): {self.count} bound objects, {self.nbytes} bytes"]
+        lines.extend(f"  evicted {n} {cls.__module__}.{cls.__qualname__}" for cls, n in self.evictions.most_common())
+        return "\n".join(lines)
+
+
+# ===================================================================
+
+
+def _sizeof(bound: object) -> int:
+    """Estimate the size of a bound object: it and its ``__dict__``, not their contents."""
+    size = sys.getsizeof(bound)
+    instance_dict = getattr(bound, "__dict__", None)
+    if instance_dict is not None:
+        size += sys.getsizeof(instance_dict)
+    return size
+
+
+def _forget(ref: weakref.KeyedRef[Any, Any]) -> None:
+    """`weakref.ref` callback, untracking a deleted bound object."""
+    global _nbytes  # noqa: PLW0603
+    with _lock:
+        entry = _entries.get(ref.key)
+        if entry is not None and entry.bound_ref is ref:
+            del _entries[ref.key]
+            _nbytes -= entry.nbytes
+
+
+def _over_budget() -> bool:
+    max_count, max_bytes = _limits
+    return (max_count is not None and len(_entries) > max_count) or (max_bytes is not None and _nbytes > max_bytes)
+
+
+def _evict() -> list[tuple[Any, Any]]:
+    """Evict the least-recently-used bound objects until within budget.
+
+    Call with the lock. The most recently used object is never evicted.
+
+    Returns
+    -------
+    list[tuple[Any, Any]]
+        The evicted bound objects and their enclosing objects.
+
+    """
+    global _nbytes  # noqa: PLW0603
+    evicted = []
+    while len(_entries) > 1 and _over_budget():
+        _, entry = _entries.popitem(last=False)
+        _nbytes -= entry.nbytes
+        bound = entry.bound_ref()
+        selfref = getattr(bound, "__selfref__", None)
+        enclosing = None if selfref is None else selfref()
+        if enclosing is None:
+            continue
+        cache = get_cache(enclosing, entry.store_in)
+        if cache.get(entry.name) is bound:
+            del cache[entry.name]
+            evicted.append((bound, enclosing))
+    return evicted
+
+
+def _budget_event(event: str, _: type, bound: Any, enclosing: Any) -> None:  # noqa: ANN401
+    """`bound_class.core.hooks` listener that tracks use and evicts."""
+    global _nbytes  # noqa: PLW0603
+    if event not in {"get", "make", "rebind"}:
+        return
+
+    key = id(bound)
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None and entry.bound_ref() is bound:
+            _entries.move_to_end(key)
+            return
+
+    location = locate(bound, enclosing)
+    if location is None:  # not cached, e.g. ``store_in=None``
+        return
+    try:
+        bound_ref = weakref.KeyedRef(bound, _forget, key)
+    except TypeError:  # not weak-referenceable, so not tracked
+        return
+
+    with _lock:
+        entry = _entries[key] = _Entry(bound_ref, *location, _sizeof(bound))
+        _nbytes += entry.nbytes
+        evicted = _evict()
+        _evictions.update(type(b) for b, _ in evicted)
+
+    for b, e in evicted:
+        hooks._emit("evict", type(b), b, e)  # noqa: SLF001
+
+
+# ===================================================================
+# API
+
+
+def enable_budget(*, max_count: int | None = None, max_bytes: int | None = None) -> None:
+    """Limit the cached bound objects of all descriptors and accessors.
+
+    When a bound object is cached on its enclosing object and there are then
+    more than ``max_count`` cached bound objects, or they take more than
+    ``max_bytes``, the least-recently-used ones are evicted: removed from
+    their enclosing objects. An evicted object is made again on the next
+    access. Objects that are still referenced elsewhere stay bound.
+
+    The budget tracks the bound objects that are cached or accessed while it
+    is on. Accessors registered with ``shadow=True`` are read as plain
+    attributes once cached, so for them only the first access counts.
+
+    Parameters
+    ----------
+    max_count : int or None, optional
+        The maximum number of cached bound objects.
+    max_bytes : int or None, optional
+        The maximum estimated size of the cached bound objects in bytes. The
+        size of each is estimated by `sys.getsizeof` of it and its
+        ``__dict__``, not counting the objects they refer to.
+
+    Raises
+    ------
+    ValueError
+        If neither limit is given.
+
+    Examples
+    --------
+        >>> from bound_class.core import budget_usage, disable_budget, enable_budget
+        >>> from bound_class.core.descriptors import BoundDescriptor
+
+        >>> class Example:
+        ...     attr = BoundDescriptor()
+
+        >>> enable_budget(max_count=2)
+        >>> exs = [Example() for _ in range(3)]
+        >>> dscs = [ex.attr for ex in exs]
+        >>> ["attr" in vars(ex) for ex in exs]  # the first was evicted
+        [False, True, True]
+        >>> exs[0].attr.enclosing is exs[0]  # and is made again
+        True
+        >>> budget_usage().evictions[BoundDescriptor]
+        2
+        >>> disable_budget()
+
+    """
+    global _limits  # noqa: PLW0603
+    if max_count is None and max_bytes is None:
+        msg = "one of max_count and max_bytes must be given"
+        raise ValueError(msg)
+    with _lock:
+        _limits = (max_count, max_bytes)
+        evicted = _evict()
+        _evictions.update(type(b) for b, _ in evicted)
+    hooks._add_listener(_budget_event)  # noqa: SLF001
+
+
+def disable_budget() -> None:
+    """Turn the budget off, keeping the cached bound objects.
+
+    The evictions are kept, see `budget_usage`, until `reset_budget`.
+    """
+    global _limits, _nbytes  # noqa: PLW0603
+    hooks._remove_listener(_budget_event)  # noqa: SLF001
+    with _lock:
+        _limits = (None, None)
+        _entries.clear()
+        _nbytes = 0
+
+
+def reset_budget() -> None:
+    """Set the counts of evictions to 0."""
+    with _lock:
+        _evictions.clear()
+
+
+def budget_usage() -> Budget:
+    """Return the limits and use of the budget, and the evictions.
+
+    Returns
+    -------
+    `Budget`
+
+    """
+    with _lock:
+        return Budget(*_limits, len(_entries), _nbytes, Counter(_evictions))
@@ -0,0 +1,130 @@
+"""Cached properties of bound classes."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Generic, TypeVar, overload
+
+from bound_class.core.base import SlottedBoundClass, _clear_cached
+
+__all__: list[str] = []
+
+T = TypeVar("T")
+
+
+class bound_cached_property(Generic[T]):  # noqa: N801
+    """A `functools.cached_property` for bound classes.
+
+    The value is computed on first access and stored in the instance
+    ``__dict__``, so later accesses are plain attribute lookups. Unlike
+    `functools.cached_property`, the value is cleared when the instance is
+    rebound to an enclosing object -- e.g. when a descriptor is copied with its
+    enclosing object -- or unbound because the enclosing object was deleted.
+    Use `invalidate` to clear it explicitly, e.g. when the enclosing object is
+    mutated.
+
+    The class must be a |BoundClass| subclass with a ``__dict__``, e.g. a
+    subclass of `~bound_class.core.accessors.Accessor` or
+    `~bound_class.core.descriptors.InstanceDescriptor`.
+
+    Parameters
+    ----------
+    func : callable[[BoundClass], T]
+        The function computing the value.
+
+    Examples
+    --------
+        >>> from dataclasses import dataclass
+        >>> from math import sqrt
+        >>> from bound_class.core.descriptors import InstanceDescriptor
+
+        >>> class SphericalDescriptor(InstanceDescriptor):
+        ...     @bound_cached_property
+        ...     def r(self):
+        ...         print("computing")
+        ...         return sqrt(self.enclosing.x**2 + self.enclosing.y**2)
+
+        >>> @dataclass
+        ... class Cartesian:
+        ...     x: float
+        ...     y: float
+        ...     spherical = SphericalDescriptor()
+
+        >>> v = Cartesian(3.0, 4.0)
+        >>> v.spherical.r
+        computing
+        5.0
+        >>> v.spherical.r
+        5.0
+
+        >>> v.x = 6.0
+        >>> invalidate(v.spherical)
+        >>> v.spherical.r
+        computing
+        7.211102550927978
+
+    """
+
+    attrname: str  # set by `__set_name__`
+
+    def __init__(self, func: Callable[[Any], T]) -> None:
+        self.func = func
+        self.__doc__ = func.__doc__
+        self.__module__ = func.__module__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        if not issubclass(owner, SlottedBoundClass):
+            msg = f"bound_cached_property {name!r} must be on a BoundClass subclass, not {owner.__qualname__!r}"
+            raise TypeError(msg)
+        if owner.__dictoffset__ == 0:
+            msg = f"bound_cached_property {name!r} needs a __dict__ on {owner.__qualname__!r} to cache its value"
+            raise TypeError(msg)
+
+        self.attrname = name
+        names = owner._bound_cached_names  # noqa: SLF001
+        if name not in names:
+            owner._bound_cached_names = (*names, name)  # noqa: SLF001
+
+    @overload
+    def __get__(self, instance: None, owner: type | None = None) -> bound_cached_property[T]: ...
+
+    @overload
+    def __get__(self, instance: object, owner: type | None = None) -> T: ...
+
+    def __get__(self, instance: object | None, owner: type | None = None) -> bound_cached_property[T] | T:
+        if instance is None:
+            return self
+        # Only reached on a cache miss: a cached value in the instance
+        # ``__dict__`` takes precedence over this (non-data) descriptor.
+        selfref = getattr(instance, "__selfref__", None)
+        value = self.func(instance)
+        # Don't cache a value computed from an object that was rebound meanwhile.
+        if getattr(instance, "__selfref__", None) is selfref:
+            instance.__dict__[self.attrname] = value
+        return value
+
+
+def invalidate(bound: SlottedBoundClass[Any], *names: str) -> None:
+    """Clear the cached values of `bound_cached_property` attributes.
+
+    The values are computed again on the next access.
+
+    Parameters
+    ----------
+    bound : BoundClass
+        The object with the cached values.
+    *names : str
+        The names of the attributes to clear. If none are given, all are
+        cleared.
+
+    Raises
+    ------
+    AttributeError
+        If a name is not a `bound_cached_property` attribute of ``bound``.
+
+    """
+    cached = type(bound)._bound_cached_names  # noqa: SLF001
+    for name in names:
+        if name not in cached:
+            msg = f"{type(bound).__qualname__!r} has no bound_cached_property {name!r}"
+            raise AttributeError(msg)
+    _clear_cached(bound, names or cached)
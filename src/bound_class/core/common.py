@@ -2,9 +2,62 @@
 
 from __future__ import annotations
 
+from importlib import import_module
+from typing import Any, Callable
+
 __all__: list[str] = []
 
 
 # TODO: move this to a better file
 class DescriptorRegistrationWarning(Warning):
     """Warning for conflicts in descriptor registration."""
+
+
+def lazy_attributes(
+    package: str,
+    attributes: dict[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Return the ``__getattr__`` and ``__dir__`` of a package with lazy attributes.
+
+    Following :pep:`562`, the module with an attribute is imported on the
+    first access of the attribute, not with the package. The attribute is then
+    set on the package, so later accesses are plain lookups.
+
+    Parameters
+    ----------
+    package : str
+        The name of the package, i.e. its ``__name__``.
+    attributes : dict[str, str]
+        The name of the module with each attribute.
+
+    Returns
+    -------
+    __getattr__ : Callable[[str], Any]
+    __dir__ : Callable[[], list[str]]
+        To be set on the package.
+
+    Examples
+    --------
+    In the package's ``__init__.py``:
+
+    .. code-block:: python
+
+        __getattr__, __dir__ = lazy_attributes(__name__, {"BoundClass": "bound_class.core.base"})
+
+    """
+
+    def __getattr__(name: str) -> Any:  # noqa: ANN401, N807
+        try:
+            module = attributes[name]
+        except KeyError:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg) from None
+
+        value = getattr(import_module(module), name)
+        setattr(import_module(package), name, value)  # cache on the package
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted({*vars(import_module(package)), *attributes})
+
+    return __getattr__, __dir__
@@ -0,0 +1,151 @@
+"""Rebinding the cached bound objects of shallow copies of enclosing objects.
+
+`copy.copy` of an enclosing object copies its ``__dict__``, and so the bound
+objects cached in it, which stay bound to the original. Descriptors and
+`~bound_class.core.accessors.AccessorProperty` notice this on the next read
+and make a bound object for the copy then. `rebind_on_copy` instead does this
+once, when the enclosing object is copied, so reads on the copy never rebind.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, TypeVar
+
+from bound_class.core.accessors.descriptor import AccessorProperty, CachedAccessorProperty
+from bound_class.core.base import SlottedBoundClass
+from bound_class.core.descriptors.base import SlottedBoundDescriptorBase
+
+__all__: list[str] = []
+
+T = TypeVar("T")
+C = TypeVar("C", bound=type)
+
+#: The descriptors whose cached bound objects are rebound.
+CACHING = (SlottedBoundDescriptorBase, AccessorProperty, CachedAccessorProperty)
+
+
+def _lookup(cls: type, name: str) -> Any:  # noqa: ANN401
+    """Return the class attribute ``name`` of ``cls``, without calling ``__get__``."""
+    for klass in cls.__mro__:
+        attr = vars(klass).get(name)
+        if attr is not None:
+            return attr
+    return None
+
+
+def rebind(obj: object) -> int:
+    """Rebind the cached bound objects of ``obj`` that are bound to another object.
+
+    Each bound object of a descriptor or accessor of ``type(obj)`` that is
+    cached in ``obj.__dict__`` or ``obj._attrs_`` but bound to another
+    object, e.g. after `copy.copy`, is replaced by one bound to ``obj``, as
+    on a read of the attribute. Bound objects in the side table are not
+    copied with ``obj``, so they are never stale.
+
+    Parameters
+    ----------
+    obj : object
+        The enclosing object.
+
+    Returns
+    -------
+    int
+        The number of bound objects rebound.
+
+    """
+    cls = type(obj)
+    rebound = 0
+    for store_in in ("__dict__", "_attrs_"):
+        cache = getattr(obj, store_in, None)
+        if cache is None:
+            continue
+        for name, bound in list(cache.items()):
+            if not isinstance(bound, SlottedBoundClass):
+                continue
+            selfref = bound.__selfref__
+            if selfref is None or selfref() is obj:
+                continue
+            descriptor = _lookup(cls, name)
+            if isinstance(descriptor, CACHING):
+                del cache[name]
+                getattr(obj, name)
+                rebound += 1
+    return rebound
+
+
+def _copy(obj: T) -> T:
+    """Return a shallow copy of ``obj``, as `copy.copy` does without ``__copy__``."""
+    rv = obj.__reduce_ex__(4)
+    if isinstance(rv, str):  # a global, e.g. a singleton
+        return obj
+    func, args, state, listitems, dictitems = (*rv, None, None, None)[:5]
+    new: Any = func(*args)
+    if state is not None:
+        if hasattr(new, "__setstate__"):
+            new.__setstate__(state)
+        else:
+            slotstate = None
+            if isinstance(state, tuple) and len(state) == 2:  # noqa: PLR2004
+                state, slotstate = state
+            if state:
+                new.__dict__.update(state)
+            for key, value in (slotstate or {}).items():
+                setattr(new, key, value)
+    for item in listitems or ():
+        new.append(item)
+    for key, value in dictitems or ():
+        new[key] = value
+    return new  # type: ignore[no-any-return]
+
+
+def rebind_on_copy(cls: C) -> C:
+    """Class decorator rebinding the cached bound objects of shallow copies.
+
+    The ``__copy__`` of ``cls`` (or the default of `copy.copy`) is wrapped to
+    give the copy its own ``_attrs_``, if any, and `rebind` the bound objects
+    cached on the copy, once. `copy.deepcopy` already rebinds them, see
+    `bound_class.core.base.SlottedBoundClass.__deepcopy__`.
+
+    Parameters
+    ----------
+    cls : type
+        The enclosing class.
+
+    Returns
+    -------
+    type
+        ``cls``, with a ``__copy__`` method.
+
+    Examples
+    --------
+        >>> import copy
+        >>> from bound_class.core.accessors import Accessor, AccessorProperty
+
+        >>> @rebind_on_copy
+        ... class Example:
+        ...     attr = AccessorProperty(Accessor)
+
+        >>> ex = Example()
+        >>> ex.attr.accessee is ex
+        True
+        >>> ex2 = copy.copy(ex)
+        >>> vars(ex2)["attr"].accessee is ex2  # rebound on copy, not on read
+        True
+        >>> ex.attr.accessee is ex
+        True
+
+    """
+    copier = getattr(cls, "__copy__", _copy)
+
+    def __copy__(self: T) -> T:  # noqa: N807
+        new = copier(self)
+        attrs = getattr(self, "_attrs_", None)
+        if attrs is not None and getattr(new, "_attrs_", None) is attrs:
+            object.__setattr__(new, "_attrs_", copy.copy(attrs))
+        rebind(new)
+        return new
+
+    __copy__.__qualname__ = f"{cls.__qualname__}.__copy__"
+    cls.__copy__ = __copy__  # type: ignore[attr-defined]
+    return cls
@@ -0,0 +1,223 @@
+"""Opt-in counters of binding, cache and finalizer activity.
+
+The counters are off by default and then cost nothing: like the hooks of
+`bound_class.core.hooks`, on which they are built, `enable_stats` swaps in
+versions of the methods of the descriptors and accessors that report events,
+and `disable_stats` swaps the originals back (unless there are hooks).
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+from bound_class.core import hooks
+
+__all__: list[str] = []
+
+#: The events that are counted, see `Stats`.
+EVENTS = ("get", "make", "rebind", "ref", "finalize")
+
+_counts: dict[type, Counter[str]] = {}
+_lock = threading.Lock()
+
+
+def _count(cls: type, event: str, n: int = 1) -> None:
+    with _lock:
+        counter = _counts.get(cls)
+        if counter is None:
+            counter = _counts[cls] = Counter()
+        counter[event] += n
+
+
+@dataclass(frozen=True)
+class Stats:
+    """Counts of events per descriptor, accessor or bound class.
+
+    The counts are keyed by class: the descriptor class for descriptors, the
+    accessor class for accessors (not `~bound_class.core.accessors.AccessorProperty`)
+    and the bound class for references. The events are
+
+    - ``"get"``: an access from an enclosing instance, including `bind_many`.
+      `~bound_class.core.accessors.CachedAccessorProperty` is only accessed
+      until its accessor is cached, after which reads are plain attribute
+      lookups and are not counted.
+    - ``"make"``: a new bound descriptor or accessor was made, e.g. on first
+      access or with ``store_in=None``.
+    - ``"rebind"``: the cached bound descriptor was bound to the enclosing
+      object again, e.g. after unpickling.
+    - ``"ref"``: a `~bound_class.core.base.BoundClassRef` (or
+      `~bound_class.core.base.StrongRef`) was made, i.e. an object was bound.
+    - ``"finalize"``: the callback of a `~bound_class.core.base.BoundClassRef`
+      fired, as its referent was deleted. If the bound object was also deleted
+      the count is keyed by `~bound_class.core.base.BoundClassRef`.
+
+    Cache hits are gets without a make or rebind, see `hits`.
+
+    Parameters
+    ----------
+    counts : dict[type, Counter[str]]
+        The counts of each event, per class.
+
+    Examples
+    --------
+        >>> from bound_class.core import collect_stats
+        >>> from bound_class.core.descriptors import BoundDescriptor
+
+        >>> class Example:
+        ...     attr = BoundDescriptor()
+
+        >>> with collect_stats() as stats:
+        ...     ex = Example()
+        ...     for _ in range(3):
+        ...         _ = ex.attr
+        >>> stats[BoundDescriptor]["get"], stats[BoundDescriptor]["make"]
+        (3, 1)
+        >>> stats.hits(BoundDescriptor)
+        2
+        >>> print(stats)
+        class                                               get  make  rebind  ref  finalize
+        bound_class.core.descriptors.bound.BoundDescriptor    3     1       0    1         0
+
+    """
+
+    counts: dict[type, Counter[str]] = field(default_factory=dict)
+
+    def __getitem__(self, cls: type) -> Counter[str]:
+        """Return the counts of the events of a class."""
+        return self.counts.get(cls, Counter())
+
+    def __sub__(self, other: Stats) -> Stats:
+        """Return the counts since ``other``."""
+        counts: dict[type, Counter[str]] = {}
+        for cls, counter in self.counts.items():
+            diff = counter - other[cls]
+            if diff:
+                counts[cls] = diff
+        return Stats(counts)
+
+    def hits(self, cls: type) -> int:
+        """Return the number of gets that found the bound object cached."""
+        counter = self[cls]
+        return counter["get"] - counter["make"] - counter["rebind"]
+
+    def total(self, event: str) -> int:
+        """Return the count of an event, summed over all classes."""
+        return sum(counter[event] for counter in self.counts.values())
+
+    def most_common(self, event: str = "make", n: int | None = None) -> list[tuple[type, int]]:
+        """Return the classes with the highest counts of an event.
+
+        Parameters
+        ----------
+        event : str, optional
+            One of `EVENTS`. The default, ``"make"``, finds the classes that
+            make the most bound objects, i.e. that cause the most churn.
+        n : int or None, optional
+            The number of classes. `None` (default) for all of them.
+
+        Returns
+        -------
+        list[tuple[type, int]]
+            The classes and their counts, from most to least common.
+
+        """
+        counts = sorted(((cls, c[event]) for cls, c in self.counts.items() if c[event]), key=lambda x: -x[1])
+        return counts[:n]
+
+    def __str__(self) -> str:
+        """Return a table of the counts, one row per class."""
+        rows: list[tuple[str, ...]] = [("class", *EVENTS)]
+        rows.extend(
+            (f"{cls.__module__}.{cls.__qualname__}", *(str(c[event]) for event in EVENTS))
+            for cls, c in sorted(self.counts.items(), key=lambda x: -x[1]["make"])
+        )
+        widths = [max(len(row[i]) for row in rows) for i in range(len(EVENTS) + 1)]
+        return "\n".join(
+            "  ".join(row[0].ljust(widths[0]) if i == 0 else v.rjust(widths[i]) for i, v in enumerate(row))
+            for row in rows
+        )
+
+
+# ===================================================================
+# API
+
+
+def _count_event(event: str, cls: type, _: Any, __: Any) -> None:  # noqa: ANN401
+    """`bound_class.core.hooks` listener that counts the events."""
+    if event in EVENTS:
+        _count(cls, event)
+
+
+def stats_enabled() -> bool:
+    """Return whether the counters are on."""
+    return _count_event in hooks._listeners  # noqa: SLF001
+
+
+def enable_stats(*, reset: bool = False) -> None:
+    """Turn the counters on.
+
+    Parameters
+    ----------
+    reset : bool, optional
+        Whether to set the counts to 0 first.
+
+    """
+    if reset:
+        reset_stats()
+    hooks._add_listener(_count_event)  # noqa: SLF001
+
+
+def disable_stats() -> None:
+    """Turn the counters off.
+
+    The counts are kept, see `stats`.
+    """
+    hooks._remove_listener(_count_event)  # noqa: SLF001
+
+
+def reset_stats() -> None:
+    """Set the counts to 0."""
+    with _lock:
+        _counts.clear()
+
+
+def stats() -> Stats:
+    """Return the counts since the counters were turned on (or reset).
+
+    Returns
+    -------
+    `Stats`
+        A copy of the counts.
+
+    """
+    with _lock:
+        return Stats({cls: Counter(counter) for cls, counter in _counts.items()})
+
+
+@contextmanager
+def collect_stats() -> Iterator[Stats]:
+    """Count the events in a ``with`` block.
+
+    The counters are turned on for the block, unless they already were.
+
+    Yields
+    ------
+    `Stats`
+        Empty until the end of the block, when it is filled with the counts of
+        the block.
+
+    """
+    was_enabled = stats_enabled()
+    enable_stats()
+    before = stats()
+    out = Stats()
+    try:
+        yield out
+    finally:
+        out.counts.update((stats() - before).counts)
+        if not was_enabled:
+            disable_stats()
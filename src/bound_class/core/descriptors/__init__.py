@@ -1,7 +1,37 @@
-"""Descriptors."""
+"""Descriptors.
 
-from bound_class.core.descriptors.bound import BoundDescriptor
-from bound_class.core.descriptors.instance import InstanceDescriptor
-from bound_class.core.descriptors.register import register_descriptor
+The contents are imported on first access.
+"""
 
-__all__ = ["BoundDescriptor", "InstanceDescriptor", "register_descriptor"]
+from typing import TYPE_CHECKING
+
+from bound_class.core.common import lazy_attributes
+
+if TYPE_CHECKING:
+    from bound_class.core.descriptors.bound import BoundDescriptor, SlottedBoundDescriptor
+    from bound_class.core.descriptors.instance import InstanceDescriptor, SlottedInstanceDescriptor
+    from bound_class.core.descriptors.register import LazyDescriptor, register_descriptor
+    from bound_class.core.fields import light_dataclass
+
+__all__ = [
+    "BoundDescriptor",
+    "InstanceDescriptor",
+    "LazyDescriptor",
+    "SlottedBoundDescriptor",
+    "SlottedInstanceDescriptor",
+    "register_descriptor",
+    "light_dataclass",
+]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "BoundDescriptor": "bound_class.core.descriptors.bound",
+        "InstanceDescriptor": "bound_class.core.descriptors.instance",
+        "LazyDescriptor": "bound_class.core.descriptors.register",
+        "SlottedBoundDescriptor": "bound_class.core.descriptors.bound",
+        "SlottedInstanceDescriptor": "bound_class.core.descriptors.instance",
+        "register_descriptor": "bound_class.core.descriptors.register",
+        "light_dataclass": "bound_class.core.fields",
+    },
+)
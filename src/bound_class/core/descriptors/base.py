@@ -2,49 +2,44 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Literal, NoReturn
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterable, Literal, MutableMapping, NoReturn, TypeVar
 
-from bound_class.core.base import BndTo, BoundClass, BoundClassRef
+from bound_class.core.base import BndTo, BoundClass, SlottedBoundClass
+from bound_class.core.fields import clone
+from bound_class.core.locks import lock_for
+from bound_class.core.storage import SIDE_TABLE, check_store_in, side_table
 
 __all__: list[str] = []
 
+if TYPE_CHECKING:
+    Self = TypeVar("Self", bound="SlottedBoundDescriptorBase[Any]")
+    # TODO: ``from typing_extensions import Self`` when supported
 
-@dataclass
-class BoundDescriptorBase(BoundClass[BndTo]):
-    """Base class for instance-level descriptors.
 
-    Attributes
-    ----------
-    enclosing : BndTo
-        Returns the enclosing instance to which this one is bound.
-
-    Notes
-    -----
-    Normally descriptors are bound to a class and are used on instances of that
-    class according to the ``__get__`` method. While very useful for, e.g.
-    performing validation, this essentially makes descriptors just fancy
-    methods. Using |BoundClass| descriptors can now be easily bound to class
-    instances, not the class.
+@dataclass
+class SlottedBoundDescriptorBase(SlottedBoundClass[BndTo]):
+    """Base class for instance-level descriptors, without a ``__dict__``.
 
-    There are currently some limitations:
+    This class defines the fields and behaviour shared by all instance-level
+    descriptors, but does not store them: subclasses either have a
+    ``__dict__`` (see `BoundDescriptorBase`) or are ``@dataclass(slots=True)``,
+    e.g. :class:`bound_class.descriptors.SlottedBoundDescriptor`.
 
-    1. The class must have a ``__dict__`` attribute. This doesn't preclude
-       slots, but few slotted classes also have a ``__dict__``.
-    2. The class must have a ``__name__`` attribute. Pretty much all classes do,
-       so don't worry about this one.
-
-    This is a base class and mostly exists because MyPy complains that
-    :class:`bound_class.descriptors.BoundDescriptor` and
-    :class:`bound_class.descriptors.InstanceDescriptor` do not have matching
-    signatures for ``__get__``.
+    Subclasses that add fields are dataclasses. Use
+    `~bound_class.core.descriptors.light_dataclass` instead of
+    `dataclasses.dataclass` to define them faster.
 
     """
 
-    store_in: Literal["__dict__", "_attrs_"] | None = "__dict__"
+    __slots__ = ()
+
+    store_in: Literal["__dict__", "_attrs_", "side_table"] | None = "__dict__"
+    _enclosing_attr: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        self.__selfref__: BoundClassRef[BndTo] | None
+        if self.store_in == SIDE_TABLE:
+            check_store_in(type(self), self.store_in)
         object.__setattr__(self, "__selfref__", None)
 
     # ===============================================================
@@ -53,7 +48,6 @@ class BoundDescriptorBase(BoundClass[BndTo]):
     def __set_name__(self, _: Any, name: str) -> None:  # noqa: ANN401
         """Store the name of the attribute on the enclosing object."""
         # Store the name of the attribute on the enclosing object
-        self._enclosing_attr: str
         object.__setattr__(self, "_enclosing_attr", name)
 
     # @abstractmethod
@@ -64,10 +58,158 @@ class BoundDescriptorBase(BoundClass[BndTo]):
     # ):
     #     ...
 
-    def __set__(self, _: str, __: object) -> NoReturn:
+    def __set__(self, _: object, __: object) -> NoReturn:
         """Raise an error when trying to set the value."""
         raise AttributeError  # TODO: useful error message
 
+    def _get_bound(self: Self, enclosing: Any) -> Self:  # noqa: ANN401
+        """Return the descriptor bound to ``enclosing``, making it if needed.
+
+        Parameters
+        ----------
+        enclosing : BndTo
+            The instance of the enclosing class.
+
+        Returns
+        -------
+        Self
+            A copy of this descriptor (see `bound_class.core.fields.clone`),
+            bound to ``enclosing``.
+
+        Raises
+        ------
+        TypeError
+            If the descriptor stored on the enclosing object is not of the same
+            type as this descriptor.
+
+        Notes
+        -----
+        This is thread-safe: the descriptor is made once per enclosing
+        object, under the lock of `bound_class.core.locks.lock_for`. Reading
+        an already-bound descriptor does not take the lock.
+
+        """
+        # accessed from an enclosing
+        if self.store_in is None:
+            dsc = clone(self)
+            dsc._set__self__(enclosing)  # noqa: SLF001
+            return dsc
+
+        # try to get from cache. The cached descriptor is usually already bound
+        # to ``enclosing``, in which case this is just a dereference.
+        store_in = self.store_in
+        cache: MutableMapping[str, Any] = (
+            side_table(enclosing) if store_in == SIDE_TABLE else getattr(enclosing, store_in)
+        )
+        obj = cache.get(self._enclosing_attr)  # get from enclosing.
+        if isinstance(obj, type(self)):
+            selfref = obj.__selfref__
+            if selfref is not None and selfref() is enclosing:
+                return obj
+
+        # Otherwise make (or rebind) it, once, even if many threads get here.
+        with lock_for(enclosing, self._enclosing_attr):
+            return self._bind(enclosing, cache)
+
+    def _bind(self: Self, enclosing: Any, cache: MutableMapping[str, Any]) -> Self:  # noqa: ANN401
+        """Return the descriptor bound to ``enclosing``, making it if needed.
+
+        Call with the lock of ``enclosing`` and the attribute. See `_get_bound`.
+        """
+        obj = cache.get(self._enclosing_attr)  # check again, now with the lock
+
+        if obj is None:  # hasn't been created on the enclosing
+            dsc = clone(self)
+            # transfer any other information
+            dsc.__set_name__(dsc, self._enclosing_attr)
+            # store on enclosing instance
+            cache[self._enclosing_attr] = dsc
+        elif not isinstance(obj, type(self)):
+            msg = f"descriptor must be type <{type(self)}> not <{type(obj)}>"
+            raise TypeError(msg)
+        else:
+            dsc = obj
+            # Only (re)bind when needed. If one makes copies of the enclosing
+            # object, e.g. with ``copy.copy``, 'dsc' is shared with the
+            # original and must be replaced on the copy, not rebound.
+            selfref = dsc.__selfref__
+            if selfref is not None:
+                boundto = selfref()
+                if boundto is enclosing:
+                    return dsc
+                if boundto is not None:  # bound to another live object
+                    dsc = clone(self)
+                    dsc.__set_name__(dsc, self._enclosing_attr)
+                    cache[self._enclosing_attr] = dsc
+
+        dsc._set__self__(enclosing)  # noqa: SLF001
+
+        return dsc
+
+    def bind_many(self: Self, enclosings: Iterable[Any]) -> list[Self]:
+        """Return the descriptor bound to each of ``enclosings``.
+
+        This is equivalent to ``[getattr(enc, name) for enc in enclosings]``
+        for the attribute ``name`` of this descriptor, but the work that is the
+        same for every enclosing object, e.g. finding the fields to copy, is
+        done once.
+
+        Parameters
+        ----------
+        enclosings : Iterable[BndTo]
+            Instances of the enclosing class.
+
+        Returns
+        -------
+        list[Self]
+            Copies of this descriptor, bound to each of ``enclosings``.
+
+        Raises
+        ------
+        TypeError
+            If a descriptor stored on an enclosing object is not of the same
+            type as this descriptor.
+
+        Examples
+        --------
+            >>> from bound_class.core.descriptors import BoundDescriptor
+            >>> class Enclosing:
+            ...     attr = BoundDescriptor()
+            >>> enclosings = [Enclosing() for _ in range(3)]
+            >>> dscs = Enclosing.attr.bind_many(enclosings)
+            >>> all(d is e.attr for d, e in zip(dscs, enclosings))
+            True
+
+        """
+        cls = type(self)
+        name = self._enclosing_attr
+        store_in = self.store_in
+        bind = cls._set__self__
+        rebind = cls._bind
+
+        out: list[Self] = []
+        for enclosing in enclosings:
+            if store_in is None:
+                dsc = clone(self)
+                bind(dsc, enclosing)
+                out.append(dsc)
+                continue
+
+            # As in `_get_bound`
+            cache: MutableMapping[str, Any] = (
+                side_table(enclosing) if store_in == SIDE_TABLE else getattr(enclosing, store_in)
+            )
+            obj = cache.get(name)
+            if isinstance(obj, cls):
+                selfref = obj.__selfref__
+                if selfref is not None and selfref() is enclosing:
+                    out.append(obj)
+                    continue
+            with lock_for(enclosing, name):
+                out.append(rebind(self, enclosing, cache))
+
+        return out
+
     # ===============================================================
 
     @property
@@ -83,3 +225,37 @@ class BoundDescriptorBase(BoundClass[BndTo]):
             obj = accessor.accessee obj...
         """
         return self.__self__
+
+
+@dataclass
+class BoundDescriptorBase(SlottedBoundDescriptorBase[BndTo], BoundClass[BndTo]):
+    """Base class for instance-level descriptors.
+
+    Attributes
+    ----------
+    enclosing : BndTo
+        Returns the enclosing instance to which this one is bound.
+
+    Notes
+    -----
+    Normally descriptors are bound to a class and are used on instances of that
+    class according to the ``__get__`` method. While very useful for, e.g.
+    performing validation, this essentially makes descriptors just fancy
+    methods. Using |BoundClass| descriptors can now be easily bound to class
+    instances, not the class.
+
+    There are currently some limitations:
+
+    1. The class must have a ``__dict__`` attribute. This doesn't preclude
+       slots, but few slotted classes also have a ``__dict__``. Instances of
+       other classes can store the descriptors in a side table, with
+       ``store_in="side_table"`` (see `bound_class.core.storage`).
+    2. The class must have a ``__name__`` attribute. Pretty much all classes do,
+       so don't worry about this one.
+
+    This is a base class and mostly exists because MyPy complains that
+    :class:`bound_class.descriptors.BoundDescriptor` and
+    :class:`bound_class.descriptors.InstanceDescriptor` do not have matching
+    signatures for ``__get__``.
+
+    """
@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, replace
-from typing import Any, MutableMapping, overload
+from dataclasses import dataclass
+from typing import overload
+
+from mypy_extensions import mypyc_attr
 
 from bound_class.core.base import BndTo
-from bound_class.core.descriptors.base import BoundDescriptorBase
+from bound_class.core.descriptors.base import BoundDescriptorBase, SlottedBoundDescriptorBase
 
 __all__: list[str] = []
 
 
+@mypyc_attr(native_class=False)
 @dataclass
 class BoundDescriptor(BoundDescriptorBase[BndTo]):
     """Descriptor stored on and accessess its enclosing instance.
@@ -90,6 +93,8 @@ class BoundDescriptor(BoundDescriptorBase[BndTo]):
     --------
     bound_class.descriptors.InstanceDescriptor
         A version of this descriptor that only permits access from the instance.
+    bound_class.descriptors.SlottedBoundDescriptor
+        A version of this descriptor without an instance ``__dict__``.
 
     """
 
@@ -118,27 +123,54 @@ class BoundDescriptor(BoundDescriptorBase[BndTo]):
         if enclosing is None:
             return self
 
-        # accessed from an enclosing
-        if self.store_in is None:
-            dsc = replace(self)
-        else:  # try to get from cache
-            cache: MutableMapping[str, Any] = getattr(enclosing, self.store_in)
-            obj = cache.get(self._enclosing_attr)  # get from enclosing.
-
-            if obj is None:  # hasn't been created on the enclosing
-                dsc = replace(self)
-                # transfer any other information
-                dsc.__set_name__(dsc, self._enclosing_attr)
-                # store on enclosing instance
-                cache[self._enclosing_attr] = dsc
-            elif not isinstance(obj, type(self)):
-                msg = f"descriptor must be type <{type(self)}> not <{type(obj)}>"
-                raise TypeError(msg)
-            else:
-                dsc = obj
-
-        # We set `__self__` on every call, since if one makes copies of objs,
-        # 'dsc' will be copied as well, which will lose the reference.
-        dsc._set__self__(enclosing)  # noqa: SLF001
-
-        return dsc
+        return self._get_bound(enclosing)
+
+
+@mypyc_attr(native_class=False)
+@dataclass(slots=True)
+class SlottedBoundDescriptor(SlottedBoundDescriptorBase[BndTo]):
+    """`BoundDescriptor` without an instance ``__dict__``.
+
+    Subclasses must also be ``@dataclass(slots=True)`` (or
+    ``@light_dataclass(slots=True)``, or define ``__slots__``) to not gain a
+    ``__dict__``.
+
+    Examples
+    --------
+        >>> from dataclasses import dataclass
+        >>> @dataclass(slots=True)
+        ... class ExampleSlottedDescriptor(SlottedBoundDescriptor):
+        ...     pass
+
+        >>> class Example:
+        ...     attribute = ExampleSlottedDescriptor()
+
+        >>> ex = Example()
+        >>> ex.attribute
+        ExampleSlottedDescriptor(store_in='__dict__')
+        >>> ex.attribute.enclosing is ex
+        True
+        >>> hasattr(ex.attribute, "__dict__")
+        False
+
+    """
+
+    @overload
+    def __get__(self: SlottedBoundDescriptor[BndTo], enclosing: BndTo, _: None) -> SlottedBoundDescriptor[BndTo]: ...
+
+    @overload
+    def __get__(
+        self: SlottedBoundDescriptor[BndTo], enclosing: None, _: type[BndTo]
+    ) -> SlottedBoundDescriptor[BndTo]: ...
+
+    def __get__(
+        self: SlottedBoundDescriptor[BndTo], enclosing: BndTo | None, _: type[BndTo] | None
+    ) -> SlottedBoundDescriptor[BndTo]:
+        """Return the descriptor bound to the enclosing instance.
+
+        See `bound_class.descriptors.BoundDescriptor.__get__`.
+        """
+        if enclosing is None:
+            return self
+
+        return self._get_bound(enclosing)
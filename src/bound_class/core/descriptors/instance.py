@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, replace
-from typing import Any, MutableMapping, NoReturn, overload
+from dataclasses import dataclass
+from typing import NoReturn, overload
+
+from mypy_extensions import mypyc_attr
 
 from bound_class.core.base import BndTo
-from bound_class.core.descriptors.base import BoundDescriptorBase
+from bound_class.core.descriptors.base import BoundDescriptorBase, SlottedBoundDescriptorBase
 
 __all__: list[str] = []
 
 
+@mypyc_attr(native_class=False)
 @dataclass
 class InstanceDescriptor(BoundDescriptorBase[BndTo]):
     """Descriptor stored on and accessess its enclosing instance.
@@ -72,6 +75,11 @@ class InstanceDescriptor(BoundDescriptorBase[BndTo]):
     access will return the instance in ``__dict__``, first passing through this
     descriptor to make sure references are kept up-to-date.
 
+    See Also
+    --------
+    bound_class.descriptors.SlottedInstanceDescriptor
+        A version of this descriptor without an instance ``__dict__``.
+
     """
 
     @overload
@@ -120,28 +128,59 @@ class InstanceDescriptor(BoundDescriptorBase[BndTo]):
             )
             raise AttributeError(msg)
 
-        # accessed from an enclosing
-        if self.store_in is None:
-            dsc = replace(self)
-        else:  # try to get from cache
-            cache: MutableMapping[str, Any] = getattr(enclosing, self.store_in)
-            obj = cache.get(self._enclosing_attr)  # get from enclosing.
-
-            if obj is None:  # hasn't been created on the enclosing
-                dsc = replace(self)
-                # transfer any other information
-                dsc.__set_name__(dsc, self._enclosing_attr)
-                # store on enclosing instance
-                cache[self._enclosing_attr] = dsc
-            elif not isinstance(obj, type(self)):
-                msg = f"descriptor must be type <{type(self)}> not <{type(obj)}>"
-                raise TypeError(msg)
-            else:
-                dsc = obj
-
-        # We set `__self__` on every call, since if one makes copies of objs,
-        # 'dsc' will be copied as well, which will lose the reference.
-        dsc._set__self__(enclosing)  # noqa: SLF001
-        # TODO: is it faster to check the reference then always make a new one?
-
-        return dsc
+        return self._get_bound(enclosing)
+
+
+@mypyc_attr(native_class=False)
+@dataclass(slots=True)
+class SlottedInstanceDescriptor(SlottedBoundDescriptorBase[BndTo]):
+    """`InstanceDescriptor` without an instance ``__dict__``.
+
+    Subclasses must also be ``@dataclass(slots=True)`` (or
+    ``@light_dataclass(slots=True)``, or define ``__slots__``) to not gain a
+    ``__dict__``.
+
+    Examples
+    --------
+        >>> from dataclasses import dataclass
+        >>> @dataclass(slots=True)
+        ... class ExampleSlottedDescriptor(SlottedInstanceDescriptor):
+        ...     pass
+
+        >>> class Example:
+        ...     attribute = ExampleSlottedDescriptor()
+
+        >>> ex = Example()
+        >>> ex.attribute
+        ExampleSlottedDescriptor(store_in='__dict__')
+        >>> ex.attribute.enclosing is ex
+        True
+        >>> hasattr(ex.attribute, "__dict__")
+        False
+
+    """
+
+    @overload
+    def __get__(
+        self: SlottedInstanceDescriptor[BndTo], enclosing: BndTo, enclosing_cls: None
+    ) -> SlottedInstanceDescriptor[BndTo]: ...
+
+    @overload
+    def __get__(self: SlottedInstanceDescriptor[BndTo], enclosing: None, enclosing_cls: type[BndTo]) -> NoReturn: ...
+
+    def __get__(
+        self: SlottedInstanceDescriptor[BndTo],
+        enclosing: BndTo | None,
+        enclosing_cls: type[BndTo] | None,
+    ) -> SlottedInstanceDescriptor[BndTo]:
+        """Return a copy of this descriptor bound to the enclosing object.
+
+        See `bound_class.descriptors.InstanceDescriptor.__get__`.
+        """
+        if enclosing is None:
+            msg = f"{self._enclosing_attr!r} can only be accessed from " + (
+                "its enclosing object." if enclosing_cls is None else f"a {enclosing_cls.__name__!r} object"
+            )
+            raise AttributeError(msg)
+
+        return self._get_bound(enclosing)
@@ -2,27 +2,78 @@
 
 from __future__ import annotations
 
+import importlib
 import inspect
 import warnings
-from typing import TYPE_CHECKING, Any, Callable
+import weakref
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Literal, TypeVar
 
-from bound_class.core.descriptors.base import BoundDescriptorBase
+from bound_class.core.base import with_ref_mode
+from bound_class.core.batched import batch_type
+from bound_class.core.descriptors.base import SlottedBoundDescriptorBase
+from bound_class.core.storage import SIDE_TABLE
 
 if TYPE_CHECKING:
     from bound_class.core.base import BndTo
 
+    Registered = TypeVar("Registered", bound="type[SlottedBoundDescriptorBase[Any]] | str")
+
 __all__: list[str] = []
+__doctest_requires__ = {"register_descriptor": ["numpy"]}
 
 
 class DescriptorRegistrationWarning(Warning):
     """Warning for conflicts in descriptor registration."""
 
 
+# The names registered on each class, in order, see `registered_attributes`.
+_registered: weakref.WeakKeyDictionary[type, dict[str, None]] = weakref.WeakKeyDictionary()
+# Called as ``listener(cls, name)`` when a descriptor or accessor is set on a
+# class, e.g. by `bound_class.core.profiler.Profiler`.
+_register_listeners: list[Callable[[type, str], None]] = []
+
+
+def _record(cls: type, name: str) -> None:
+    """Record that a descriptor or accessor was set on ``cls`` under ``name``."""
+    _registered.setdefault(cls, {})[name] = None
+    for listener in _register_listeners:
+        listener(cls, name)
+
+
+def registered_attributes() -> list[tuple[type, str]]:
+    """Return the attributes registered by `register_descriptor` and `register_accessor`.
+
+    Returns
+    -------
+    list[tuple[type, str]]
+        The class and name of each attribute, in order of registration,
+        including those registered by import path that were not yet imported.
+        Classes that were deleted are not included.
+
+    Examples
+    --------
+        >>> from bound_class.core import register_accessor, registered_attributes
+        >>> from bound_class.core.accessors import Accessor
+        >>> class Example:
+        ...     pass
+        >>> register_accessor(Example, "attr")(Accessor)
+        <class '...Accessor'>
+        >>> (Example, "attr") in registered_attributes()
+        True
+
+    """
+    return [(cls, name) for cls, names in list(_registered.items()) for name in names]
+
+
 def register_descriptor(
     cls: type[BndTo],
     name: str,
+    *,
+    batched: type[SlottedBoundDescriptorBase[Any]] | str | None = None,
+    ref_mode: Literal["weak", "strong"] | None = None,
     **kwargs: Any,  # noqa: ANN401
-) -> Callable[[type[BoundDescriptorBase[BndTo]]], type[BoundDescriptorBase[BndTo]]]:
+) -> Callable[[Registered], Registered]:
     """Decorator to register a descriptor class.
 
     Parameters
@@ -31,8 +82,32 @@ def register_descriptor(
         The class to which to add the descriptor.
     name : str
         The name of the descriptor on `cls`.
+    batched : type[SlottedBoundDescriptorBase] or str or None, optional
+        A vectorized implementation of the descriptor, registered under
+        ``name`` on the `~bound_class.core.batched.batch_type` of ``cls``. It
+        is used on a `~bound_class.core.batched.Batch` of instances of ``cls``,
+        whose fields are arrays. Without it, the descriptor is used on each
+        instance in the batch.
+    ref_mode : {"weak", "strong"} or None, optional
+        How the descriptor (and ``batched``) references the object it is
+        bound to, see `~bound_class.core.base.set_ref_mode`. `None` (default)
+        keeps the mode of the descriptor class, which is weak unless set.
+        Otherwise the descriptor is an instance of
+        `~bound_class.core.base.with_ref_mode` of the class, which is not
+        changed. ``"strong"`` also binds objects that are not
+        weak-referenceable, but cannot be used with
+        ``store_in="side_table"``.
     **kwargs : Any
-        Arguments passed to the descriptor class.
+        Arguments passed to the descriptor class (and ``batched``).
+
+    Returns
+    -------
+    Callable
+        Decorator for the descriptor class. Instead of the class, it can be
+        called with its import path ``"module:qualname"`` to import the class
+        on the first access of the descriptor, from the class or an instance.
+        The imported descriptor then replaces the `LazyDescriptor`
+        placeholder.
 
     Examples
     --------
@@ -68,27 +143,71 @@ def register_descriptor(
         >>> v.spherical.theta  # doctest: +FLOAT_CMP
         0.92729
 
+    On a batch of vectors the descriptor is used on each vector in turn:
+
+        >>> from bound_class.core import batch
+        >>> vs = batch([Cartesian(3.0, 4.0), Cartesian(6.0, 8.0)])
+        >>> print(*vs.spherical.r)
+        5.0 10.0
+
+    A batched implementation computes on all the vectors at once. The fields
+    of a batch are NumPy arrays, so it is written like the per-vector one,
+    with NumPy functions:
+
+        >>> import numpy as np
+        >>> class BatchedSphericalDescriptor(InstanceDescriptor):
+        ...
+        ...     @property
+        ...     def r(self):
+        ...         return np.hypot(self.enclosing.x, self.enclosing.y)
+        ...     @property
+        ...     def theta(self):
+        ...         return np.arctan2(self.enclosing.y, self.enclosing.x)
+
+        >>> @register_descriptor(Cartesian, "polar", batched=BatchedSphericalDescriptor)
+        ... class PolarDescriptor(SphericalDescriptor):
+        ...     pass
+
+        >>> vs = batch([Cartesian(3.0, 4.0), Cartesian(6.0, 8.0)])
+        >>> vs.polar.r
+        array([ 5., 10.])
+
+    Batches can also be made directly from arrays of the fields:
+
+        >>> from bound_class.core import batch_type
+        >>> vs = batch_type(Cartesian).from_fields(x=np.array([3.0, 6.0]), y=np.array([4.0, 8.0]))
+        >>> vs.polar.r
+        array([ 5., 10.])
+
+    Raises
+    ------
+    ValueError
+        If ``ref_mode`` is ``"strong"`` and the ``store_in`` of ``kwargs`` is
+        ``"side_table"``.
+
     """
+    if ref_mode == "strong" and kwargs.get("store_in") == SIDE_TABLE:
+        msg = "ref_mode='strong' cannot be used with store_in='side_table'"
+        raise ValueError(msg)
 
-    def decorator(
-        descriptor: type[BoundDescriptorBase[BndTo]],
-    ) -> type[BoundDescriptorBase[BndTo]]:
+    def decorator(descriptor: Registered) -> Registered:
         """Set the descriptor on the class.
 
         Parameters
         ----------
-        descriptor : type[BoundClass[BndTo]]
-            The descriptor to set on the class.
+        descriptor : type[BoundClass[BndTo]] or str
+            The descriptor to set on the class, or its import path
+            ``"module:qualname"``, to import it on first access.
 
         Returns
         -------
-        type[BoundClass[BndTo]]
+        type[BoundClass[BndTo]] or str
             The descriptor object.
 
         Raises
         ------
         ValueError
-            If the descriptor is not a `bound_class.descriptors.base.BoundDescriptorBase`
+            If the descriptor is not a `bound_class.descriptors.base.SlottedBoundDescriptorBase`
 
         """
         if hasattr(cls, name):
@@ -99,23 +218,127 @@ def register_descriptor(
                 stacklevel=2,
             )
 
-        # Make the descriptor instance:
-        # opt 1) instantiate class
-        if not TYPE_CHECKING and not issubclass(descriptor, BoundDescriptorBase):
-            raise ValueError  # TODO: error message
+        if isinstance(descriptor, str):
+            register = partial(_set_descriptor, cls, name, kwargs, ref_mode)
+            setattr(cls, name, LazyDescriptor(descriptor, register))
+            _record(cls, name)
+        else:
+            _set_descriptor(cls, name, kwargs, ref_mode, descriptor)
 
-        # correctly parse args vs kwargs
-        sig = inspect.signature(descriptor.__init__)
-        # None -> self in unbound __init__
-        ba = sig.bind_partial(None, **kwargs)
-
-        # make instance (skip 'self=None')
-        descr = descriptor(*ba.args[1:], **ba.kwargs)
-
-        # Set the descriptor on the class.
-        descr.__set_name__(descriptor, name)  # descriptor callback
-        setattr(cls, name, descr)  # attach to class
+        # Set the batched descriptor on the batch class.
+        if batched is not None:
+            register_descriptor(batch_type(cls), name, ref_mode=ref_mode, **kwargs)(batched)
 
         return descriptor
 
     return decorator
+
+
+def _set_descriptor(
+    cls: type[BndTo],
+    name: str,
+    kwargs: dict[str, Any],
+    ref_mode: Literal["weak", "strong"] | None,
+    descriptor: type[SlottedBoundDescriptorBase[BndTo]],
+) -> SlottedBoundDescriptorBase[BndTo]:
+    """Make the descriptor and set it on the class."""
+    # Make the descriptor instance:
+    # opt 1) instantiate class
+    if not TYPE_CHECKING and not issubclass(descriptor, SlottedBoundDescriptorBase):
+        raise ValueError  # TODO: error message
+    # the descriptor class, with the mode of this registration
+    descriptor_type = descriptor if ref_mode is None else with_ref_mode(descriptor, ref_mode)
+
+    # correctly parse args vs kwargs
+    sig = inspect.signature(descriptor.__init__)
+    # None -> self in unbound __init__
+    ba = sig.bind_partial(None, **kwargs)
+
+    # make instance (skip 'self=None')
+    descr = descriptor_type(*ba.args[1:], **ba.kwargs)
+
+    # Set the descriptor on the class.
+    descr.__set_name__(descriptor, name)  # descriptor callback
+    setattr(cls, name, descr)  # attach to class
+    _record(cls, name)
+
+    return descr
+
+
+# ===================================================================
+# Lazy registration
+
+
+def _split_import_path(path: str) -> tuple[str, str]:
+    """Split ``"module:qualname"`` into the module and qualified names."""
+    module_name, sep, qualname = path.partition(":")
+    if not sep or not module_name or not qualname:
+        msg = f"import path must be 'module:qualname', not {path!r}"
+        raise ValueError(msg)
+    return module_name, qualname
+
+
+def import_path(path: str) -> Any:  # noqa: ANN401
+    """Import an object from its import path.
+
+    Parameters
+    ----------
+    path : str
+        ``"module:qualname"``, e.g. ``"bound_class.core.accessors:Accessor"``.
+
+    Returns
+    -------
+    Any
+        The object.
+
+    Raises
+    ------
+    ValueError
+        If ``path`` is not of the form ``"module:qualname"``.
+
+    """
+    module_name, qualname = _split_import_path(path)
+    obj = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
+class LazyDescriptor:
+    """Placeholder for a descriptor or accessor registered by import path.
+
+    On first access, from the class or an instance, the object at ``path`` is
+    imported and registered, replacing this placeholder on the class.
+
+    Parameters
+    ----------
+    path : str
+        The import path ``"module:qualname"`` of the registered class.
+    register : Callable[[type], Any]
+        Registers the imported class on the enclosing class, returning the
+        descriptor that replaces this one.
+
+    Raises
+    ------
+    ValueError
+        If ``path`` is not of the form ``"module:qualname"``.
+
+    """
+
+    def __init__(self, path: str, register: Callable[[type], Any]) -> None:
+        _split_import_path(path)  # validate, without importing
+        self.path = path
+        self._register = register
+        self._resolved: Any = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.path!r})"
+
+    def resolve(self) -> Any:  # noqa: ANN401
+        """Import and register the class, returning its descriptor."""
+        if self._resolved is None:
+            self._resolved = self._register(import_path(self.path))
+        return self._resolved
+
+    def __get__(self, enclosing: Any, enclosing_cls: type | None = None) -> Any:  # noqa: ANN401
+        return self.resolve().__get__(enclosing, enclosing_cls)
@@ -0,0 +1,236 @@
+"""Memory accounting of bound objects, to find leaks.
+
+`memory_report` walks the objects tracked by the garbage collector (see
+`gc.get_objects`) and reports the bound objects -- descriptors, accessors and
+other `~bound_class.core.base.BoundClass` instances -- and their references,
+with their estimated sizes. It is slow, so use it when memory grows, not in
+hot code.
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import weakref
+from dataclasses import dataclass, field
+from typing import Any
+
+from bound_class.core.base import BoundClassRef, SlottedBoundClass, StrongRef
+from bound_class.core.storage import locate
+
+__all__: list[str] = []
+
+
+@dataclass
+class Usage:
+    """The number and estimated size in bytes of a group of objects."""
+
+    count: int = 0
+    nbytes: int = 0
+
+    def add(self, nbytes: int) -> None:
+        """Count an object of ``nbytes`` bytes."""
+        self.count += 1
+        self.nbytes += nbytes
+
+
+def _name(key: object) -> str:
+    if isinstance(key, type):
+        return f"{key.__module__}.{key.__qualname__}"
+    if isinstance(key, tuple):  # (enclosing type, attribute name)
+        return f"{_name(key[0])}.{key[1]}"
+    return str(key)
+
+
+def _table(title: str, usages: dict[Any, Usage]) -> list[str]:
+    rows = [(title, "count", "bytes")]
+    rows.extend(
+        (_name(key), str(u.count), str(u.nbytes)) for key, u in sorted(usages.items(), key=lambda x: -x[1].nbytes)
+    )
+    widths = [max(len(row[i]) for row in rows) for i in range(3)]
+    return [f"{row[0].ljust(widths[0])}  {row[1].rjust(widths[1])}  {row[2].rjust(widths[2])}" for row in rows]
+
+
+@dataclass(frozen=True)
+class MemoryReport:
+    """The live bound objects and their references, see `memory_report`.
+
+    The size of a bound object is estimated by `sys.getsizeof` of it, its
+    ``__dict__`` (if any) and its reference to the object it is bound to, not
+    counting the objects they refer to, e.g. the values of cached properties.
+
+    Parameters
+    ----------
+    by_class : dict[type, Usage]
+        The bound objects, by class.
+    by_enclosing_type : dict[type, Usage]
+        The bound objects that are bound to a live object, by its type.
+    by_attribute : dict[tuple[type, str | None], Usage]
+        The bound objects that are bound to a live object, by its type and the
+        attribute under which they are cached on it. The attribute is `None`
+        for bound objects that are not cached on the object they are bound
+        to, e.g. with ``store_in=None``.
+    refs : dict[type, Usage]
+        The references of bound objects to the objects they are bound to,
+        `~bound_class.core.base.BoundClassRef` and
+        `~bound_class.core.base.StrongRef`, including those that are no
+        longer used by a bound object.
+    finalizers : int or None
+        The number of pending `weakref.finalize` callbacks, of any package,
+        or `None` if Python does not expose them. This package registers one
+        per enclosing object of `~bound_class.core.track_fields`, but not per
+        bound object.
+    stale : list[SlottedBoundClass]
+        The bound objects whose referent was deleted but that are still
+        referenced and not yet unbound: their reference is dead. Usually these
+        are held on purpose, but many of them point to a leak. The report
+        keeps them alive. By default bound objects are unbound as soon as
+        their referent is deleted, so they are not distinguished from bound
+        objects that were never bound or unbound on purpose; turn on
+        `~bound_class.core.base.set_deferred_cleanup` (and do not
+        `~bound_class.core.base.drain`) to find them.
+    orphan_refs : int
+        The number of references whose bound object was deleted or now uses
+        another reference.
+
+    """
+
+    by_class: dict[type, Usage] = field(default_factory=dict)
+    by_enclosing_type: dict[type, Usage] = field(default_factory=dict)
+    by_attribute: dict[tuple[type, str | None], Usage] = field(default_factory=dict)
+    refs: dict[type, Usage] = field(default_factory=dict)
+    finalizers: int | None = 0
+    stale: list[SlottedBoundClass[Any]] = field(default_factory=list)
+    orphan_refs: int = 0
+
+    @property
+    def count(self) -> int:
+        """Return the number of bound objects."""
+        return sum(u.count for u in self.by_class.values())
+
+    @property
+    def nbytes(self) -> int:
+        """Return the estimated size in bytes of the bound objects."""
+        return sum(u.nbytes for u in self.by_class.values())
+
+    def __str__(self) -> str:
+        """Return tables of the groups, from largest to smallest."""
+        lines = [f"{self.count} bound objects, {self.nbytes} bytes"]
+        for title, usages in (
+            ("bound class", self.by_class),
+            ("enclosing type", self.by_enclosing_type),
+            ("attribute", self.by_attribute),
+            ("reference", self.refs),
+        ):
+            lines.extend(("", *_table(title, usages)))
+        lines.extend(
+            (
+                "",
+                f"stale bound objects: {len(self.stale)}",
+                f"orphan references: {self.orphan_refs}",
+                f"pending finalizers: {'unknown' if self.finalizers is None else self.finalizers}",
+            )
+        )
+        return "\n".join(lines)
+
+
+def _sizeof(obj: object) -> int:
+    """Estimate the size of an object and its ``__dict__``, not their contents."""
+    size = sys.getsizeof(obj)
+    instance_dict = getattr(obj, "__dict__", None)
+    if instance_dict is not None:
+        size += sys.getsizeof(instance_dict)
+    return size
+
+
+def _sizeof_ref(ref: object) -> int:
+    """Estimate the size of a reference, with the back-reference of a `BoundClassRef`."""
+    size = sys.getsizeof(ref)
+    if isinstance(ref, BoundClassRef):
+        size += sys.getsizeof(ref._bound_ref)  # noqa: SLF001
+    return size
+
+
+def memory_report(*, collect: bool = True) -> MemoryReport:
+    """Report the live bound objects, their references and their sizes.
+
+    Parameters
+    ----------
+    collect : bool, optional
+        Whether to collect garbage first (default), so that objects in
+        unreachable cycles are not reported.
+
+    Returns
+    -------
+    `MemoryReport`
+
+    Examples
+    --------
+        >>> from bound_class.core import memory_report
+        >>> from bound_class.core.descriptors import BoundDescriptor
+
+        >>> class Example:
+        ...     attr = BoundDescriptor()
+
+        >>> exs = [Example() for _ in range(3)]
+        >>> bounds = [ex.attr for ex in exs]
+        >>> memory_report().by_attribute[Example, "attr"].count
+        3
+
+    With deferred cleanup, bound objects that outlive their referents are
+    reported as stale until they are unbound:
+
+        >>> from bound_class.core.base import drain, set_deferred_cleanup
+        >>> set_deferred_cleanup()
+        >>> exs = [Example() for _ in range(3)]
+        >>> bounds = [ex.attr for ex in exs]
+        >>> del exs
+        >>> {id(b) for b in bounds} <= {id(b) for b in memory_report().stale}
+        True
+        >>> set_deferred_cleanup(False)  # and drain
+        >>> {id(b) for b in bounds} & {id(b) for b in memory_report().stale}
+        set()
+
+    """
+    if collect:
+        gc.collect()
+
+    by_class: dict[type, Usage] = {}
+    by_enclosing_type: dict[type, Usage] = {}
+    by_attribute: dict[tuple[type, str | None], Usage] = {}
+    refs: dict[type, Usage] = {}
+    stale: list[SlottedBoundClass[Any]] = []
+    orphan_refs = 0
+
+    objects = gc.get_objects()
+    # Descriptors on classes are not bound objects, only their clones are.
+    on_classes = {id(v) for obj in objects if isinstance(obj, type) for v in vars(obj).values()}
+
+    for obj in objects:
+        if isinstance(obj, BoundClassRef | StrongRef):
+            refs.setdefault(type(obj), Usage()).add(_sizeof_ref(obj))
+            if isinstance(obj, BoundClassRef):
+                bound = obj._bound_ref()  # noqa: SLF001
+                orphan_refs += getattr(bound, "__selfref__", None) is not obj
+            continue
+        if not isinstance(obj, SlottedBoundClass) or id(obj) in on_classes:
+            continue
+
+        selfref = getattr(obj, "__selfref__", None)
+        nbytes = _sizeof(obj) + (0 if selfref is None else _sizeof_ref(selfref))
+        by_class.setdefault(type(obj), Usage()).add(nbytes)
+
+        enclosing = None if selfref is None else selfref()
+        if enclosing is None:
+            # Unbound objects have no reference, stale ones a dead one.
+            if isinstance(selfref, BoundClassRef):
+                stale.append(obj)
+            continue
+        by_enclosing_type.setdefault(type(enclosing), Usage()).add(nbytes)
+        location = locate(obj, enclosing)
+        by_attribute.setdefault((type(enclosing), None if location is None else location[1]), Usage()).add(nbytes)
+
+    # The registry is private, so this is best-effort.
+    registry = getattr(weakref.finalize, "_registry", None)
+    finalizers = len(registry) if isinstance(registry, dict) else None
+    return MemoryReport(by_class, by_enclosing_type, by_attribute, refs, finalizers, stale, orphan_refs)
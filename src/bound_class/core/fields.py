@@ -0,0 +1,384 @@
+"""Lightweight fields for bound classes, compatible with :mod:`dataclasses`.
+
+`dataclasses.dataclass` generates the source code of the methods of each class
+and ``exec``-s it, which is slow when defining many classes, e.g. descriptor
+subclasses. `light_dataclass` gives the same fields and methods with
+functions shared by all classes. `clone` copies a dataclass instance, like
+`dataclasses.replace`, but cheaper.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import inspect
+import sys
+from dataclasses import MISSING, Field
+from functools import lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, TypeVar, overload
+
+if sys.version_info >= (3, 11):
+    from typing import dataclass_transform
+else:
+    from typing_extensions import dataclass_transform
+
+__all__: list[str] = []
+
+if TYPE_CHECKING:
+    T = TypeVar("T")
+    C = TypeVar("C", bound=type)
+
+# `dataclasses.fields` only returns fields of this type.
+_FIELD = dataclasses._FIELD  # type: ignore[attr-defined]  # noqa: SLF001
+_FIELD_INITVAR = dataclasses._FIELD_INITVAR  # type: ignore[attr-defined]  # noqa: SLF001
+
+# (name, default, default_factory), with `dataclasses.MISSING` if not given.
+_Default = tuple[str, Any, Any]
+
+
+@overload
+def light_dataclass(cls: C, /) -> C: ...
+
+
+@overload
+def light_dataclass(*, repr: bool = ..., eq: bool = ..., slots: bool = ...) -> Callable[[C], C]: ...
+
+
+@dataclass_transform(field_specifiers=(dataclasses.field, Field))
+def light_dataclass(
+    cls: C | None = None,
+    /,
+    *,
+    repr: bool = True,  # noqa: A002
+    eq: bool = True,
+    slots: bool = False,
+) -> C | Callable[[C], C]:
+    """Add fields to a class, like `dataclasses.dataclass` but cheaper.
+
+    The fields are the annotated class attributes, as for
+    `dataclasses.dataclass`, with the same ``__init__``, ``__repr__`` and
+    ``__eq__``. Defaults and `dataclasses.field` (``default``,
+    ``default_factory``, ``init``, ``repr``, ``compare``, ``kw_only``) work as
+    for `dataclasses.dataclass`, and the fields are in
+    ``__dataclass_fields__``, so `dataclasses.fields`, `dataclasses.replace`,
+    `dataclasses.asdict` and ``@dataclass`` subclasses work too.
+
+    Parameters
+    ----------
+    cls : type, optional
+        The class. If not given, returns a decorator.
+    repr : bool, optional
+        Whether to add ``__repr__``. By default `True`.
+    eq : bool, optional
+        Whether to add ``__eq__``, making instances unhashable. By default
+        `True`.
+    slots : bool, optional
+        Whether to make a new class with ``__slots__`` for the new fields, like
+        ``@dataclass(slots=True)``. By default `False`.
+
+    Returns
+    -------
+    type or Callable
+        The class, or a decorator if ``cls`` is not given.
+
+    Raises
+    ------
+    TypeError
+        If a field without a default follows one with a default.
+    ValueError
+        If a default is mutable (``list``, ``dict``, ``set``, ...).
+
+    Notes
+    -----
+    Methods already defined in the class body are not replaced. Frozen
+    classes, ``order`` and `dataclasses.InitVar` are not supported; use
+    `dataclasses.dataclass` for those.
+
+    Examples
+    --------
+        >>> from bound_class.core.descriptors import InstanceDescriptor, light_dataclass
+        >>> @light_dataclass
+        ... class Scaled(InstanceDescriptor):
+        ...     scale: float = 1.0
+
+        >>> class Example:
+        ...     attribute = Scaled(scale=2.0)
+        >>> Example().attribute
+        Scaled(store_in='__dict__', scale=2.0)
+
+    """
+
+    def wrap(cls: C) -> C:
+        return _process_class(cls, repr_=repr, eq=eq, slots=slots)
+
+    return wrap if cls is None else wrap(cls)
+
+
+def _is_classvar(annotation: Any) -> bool:  # noqa: ANN401
+    """Whether an annotation, possibly a string, is a `typing.ClassVar`."""
+    if isinstance(annotation, str):
+        return annotation.partition("[")[0].rpartition(".")[2] == "ClassVar"
+    return getattr(annotation, "__origin__", annotation) is ClassVar
+
+
+def _make_field(cls: type, name: str, annotation: Any) -> Field[Any]:  # noqa: ANN401
+    """Make the field of a class attribute, as `dataclasses` does."""
+    default = cls.__dict__.get(name, MISSING)
+    f: Field[Any] = default if isinstance(default, Field) else dataclasses.field(default=default)
+    f.name = name
+    f.type = annotation
+    f._field_type = _FIELD  # type: ignore[attr-defined]  # noqa: SLF001
+    if f.kw_only is MISSING:
+        f.kw_only = False
+    if f.default is not MISSING and type(f.default).__hash__ is None:
+        msg = f"mutable default {type(f.default)} for field {name} is not allowed: use default_factory"
+        raise ValueError(msg)
+
+    # As for `dataclasses`, the class attribute is the default, if any.
+    if isinstance(default, Field):
+        if f.default is MISSING:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, f.default)
+    return f
+
+
+def _process_class(cls: C, *, repr_: bool, eq: bool, slots: bool) -> C:  # noqa: C901, PLR0912
+    # The fields of the bases, in the same order as `dataclasses`.
+    all_fields: dict[str, Field[Any]] = {}
+    for base in cls.__mro__[-1:0:-1]:
+        all_fields.update(getattr(base, "__dataclass_fields__", {}))
+
+    own: list[str] = []
+    for name, annotation in inspect.get_annotations(cls).items():
+        if not _is_classvar(annotation):
+            all_fields[name] = _make_field(cls, name, annotation)
+            own.append(name)
+
+    fields = list(all_fields.values())
+    positional = tuple(f.name for f in fields if f.init and not f.kw_only)
+    init_fields = tuple((f.name, f.default, f.default_factory) for f in fields if f.init)
+    noinit_fields = tuple(
+        (f.name, f.default, f.default_factory)
+        for f in fields
+        if not f.init and (f.default is not MISSING or f.default_factory is not MISSING)
+    )
+    seen_default = False
+    for f in fields:
+        if f.name not in positional:
+            continue
+        if f.default is not MISSING or f.default_factory is not MISSING:
+            seen_default = True
+        elif seen_default:
+            msg = f"non-default argument {f.name!r} follows default argument"
+            raise TypeError(msg)
+
+    namespace: dict[str, Any] = {
+        "__dataclass_fields__": all_fields,
+        "__dataclass_params__": _params(repr_=repr_, eq=eq),
+        "__init__": _make_init(positional, init_fields, noinit_fields),
+        "__match_args__": positional,
+    }
+    if repr_:
+        namespace["__repr__"] = _make_repr(tuple(f.name for f in fields if f.repr))
+    if eq:
+        namespace["__eq__"] = _make_eq(tuple(f.name for f in fields if f.compare))
+        namespace["__hash__"] = None
+    for name, value in namespace.items():
+        if name not in cls.__dict__:
+            if callable(value):
+                value.__qualname__ = f"{cls.__qualname__}.{name}"
+            setattr(cls, name, value)
+
+    if slots:
+        cls = _add_slots(cls, own)
+    return cls
+
+
+@lru_cache
+def _params(*, repr_: bool, eq: bool) -> Any:  # noqa: ANN401
+    """Return the ``__dataclass_params__``, read by `dataclasses` in subclasses."""
+    return dataclasses.dataclass(repr=repr_, eq=eq)(type("Params", (), {})).__dataclass_params__  # type: ignore[attr-defined]
+
+
+def _add_slots(cls: C, names: list[str]) -> C:
+    """Remake the class with ``__slots__``, as ``@dataclass(slots=True)``."""
+    namespace = dict(cls.__dict__)
+    namespace["__slots__"] = tuple(names)
+    for name in (*names, "__dict__", "__weakref__"):
+        namespace.pop(name, None)  # the default is in ``__init__``
+    new_cls: C = type(cls)(cls.__name__, cls.__bases__, namespace)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
+
+def _make_init(  # noqa: C901
+    positional: tuple[str, ...],
+    init_fields: tuple[_Default, ...],
+    noinit_fields: tuple[_Default, ...],
+) -> Callable[..., None]:
+    """Make the ``__init__`` of a `light_dataclass`."""
+    init_names = frozenset(name for name, _, _ in init_fields)
+    setattr_ = object.__setattr__
+
+    def __init__(self: Any, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401, C901, N807
+        if len(args) > len(positional):
+            msg = f"__init__() takes {len(positional) + 1} positional arguments but {len(args) + 1} were given"
+            raise TypeError(msg)
+        values = dict(zip(positional, args, strict=False))
+        for name in kwargs:
+            if name in values:
+                msg = f"__init__() got multiple values for argument {name!r}"
+                raise TypeError(msg)
+            if name not in init_names:
+                msg = f"__init__() got an unexpected keyword argument {name!r}"
+                raise TypeError(msg)
+        values.update(kwargs)
+
+        for name, default, factory in init_fields:
+            if name in values:
+                value = values[name]
+            elif default is not MISSING:
+                value = default
+            elif factory is not MISSING:
+                value = factory()
+            else:
+                msg = f"__init__() missing required argument: {name!r}"
+                raise TypeError(msg)
+            setattr_(self, name, value)
+        for name, default, factory in noinit_fields:
+            setattr_(self, name, default if factory is MISSING else factory())
+
+        post_init = getattr(self, "__post_init__", None)
+        if post_init is not None:
+            post_init()
+
+    return __init__
+
+
+_LIGHT_INIT_CODE = _make_init((), (), ()).__code__
+
+
+def _make_repr(names: tuple[str, ...]) -> Callable[[Any], str]:
+    """Make the ``__repr__`` of a `light_dataclass`."""
+
+    def __repr__(self: Any) -> str:  # noqa: ANN401, N807
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in names)
+        return f"{type(self).__qualname__}({fields})"
+
+    return __repr__
+
+
+def _make_eq(names: tuple[str, ...]) -> Callable[[Any, object], bool]:
+    """Make the ``__eq__`` of a `light_dataclass`."""
+
+    def __eq__(self: Any, other: object) -> bool:  # noqa: ANN401, N807
+        if type(other) is not type(self):
+            return NotImplemented
+        return tuple(getattr(self, name) for name in names) == tuple(getattr(other, name) for name in names)
+
+    return __eq__
+
+
+# ===================================================================
+# Clone
+
+
+def _getter(names: tuple[str, ...]) -> Callable[[Any], tuple[Any, ...]]:
+    """Return a function getting the attributes ``names`` as a tuple."""
+    if len(names) > 1:
+        return attrgetter(*names)
+    if names:
+        get = attrgetter(names[0])
+        return lambda obj: (get(obj),)
+    return lambda _: ()
+
+
+def _clone_plan(cls: type) -> tuple[Any, ...] | None:
+    """Return how `clone` copies instances of ``cls``.
+
+    Either ``("init", get_args, kwonly)`` to call the ``__init__`` made by
+    `dataclasses.dataclass` with the field values, ``("copy", get_values,
+    in_dict, get_slots, in_slots, noinit, post_init)`` to set the field values
+    on a new instance without the slow ``__init__`` of a `light_dataclass`
+    (the values of ``in_dict`` are put directly in the instance ``__dict__``),
+    or `None` if
+    instances must be copied with `dataclasses.replace`, as ``__init__`` is
+    hand-written or there are `dataclasses.InitVar`.
+    """
+    if any(f._field_type is _FIELD_INITVAR for f in cls.__dataclass_fields__.values()):  # type: ignore[attr-defined]  # noqa: SLF001
+        return None
+
+    fields = [f for f in dataclasses.fields(cls) if f.init]
+    code = getattr(getattr(cls, "__init__", None), "__code__", None)
+    if code is _LIGHT_INIT_CODE:
+        names = tuple(f.name for f in fields)
+        noinit = tuple(
+            (f.name, f.default, f.default_factory)
+            for f in dataclasses.fields(cls)
+            if not f.init and (f.default is not MISSING or f.default_factory is not MISSING)
+        )
+        # Fields that are not slots or other data descriptors are in the
+        # instance ``__dict__``, which is faster to update in one go.
+        in_dict = tuple(n for n in names if not hasattr(type(inspect.getattr_static(cls, n, None)), "__set__"))
+        in_slots = tuple(n for n in names if n not in in_dict)
+        return "copy", _getter(in_dict), in_dict, _getter(in_slots), in_slots, noinit, hasattr(cls, "__post_init__")
+    if code is not None and code.co_filename == "<string>":  # `dataclasses` ``exec``-s the source of ``__init__``.
+        positional = tuple(f.name for f in fields if not f.kw_only)
+        return "init", _getter(positional), tuple(f.name for f in fields if f.kw_only)
+    return None
+
+
+def clone(obj: T) -> T:
+    """Return a copy of a dataclass instance, like ``dataclasses.replace(obj)``.
+
+    The fields to copy are found once per class, not on every call as in
+    `dataclasses.replace`. Instances of `light_dataclass` classes are not
+    passed through ``__init__``: the values of the ``init`` fields are copied,
+    the other fields are set to their default, and ``__post_init__`` is
+    called, as ``__init__`` would.
+
+    Parameters
+    ----------
+    obj : T
+        An instance of a `dataclasses.dataclass` or `light_dataclass`.
+
+    Returns
+    -------
+    T
+
+    Notes
+    -----
+    Instances of classes with a hand-written ``__init__`` or with
+    `dataclasses.InitVar` are copied with `dataclasses.replace`.
+
+    """
+    cls = type(obj)
+    try:
+        plan = cls.__dict__["_clone_plan_"]
+    except KeyError:
+        plan = _clone_plan(cls)
+        setattr(cls, "_clone_plan_", plan)  # noqa: B010
+
+    if plan is None:
+        return dataclasses.replace(obj)  # type: ignore[type-var]
+    if plan[0] == "init":
+        _, get_args, kwonly = plan
+        if kwonly:
+            return cls(*get_args(obj), **{name: getattr(obj, name) for name in kwonly})
+        return cls(*get_args(obj))
+
+    _, get_values, in_dict, get_slots, in_slots, noinit, post_init = plan
+    new: T = object.__new__(cls)
+    # ``zip(..., strict=True)`` is slow, and the lengths match by construction.
+    if in_dict:
+        new.__dict__.update(zip(in_dict, get_values(obj)))  # noqa: B905
+    setattr_ = object.__setattr__
+    if in_slots:
+        for name, value in zip(in_slots, get_slots(obj)):  # noqa: B905
+            setattr_(new, name, value)
+    for name, default, factory in noinit:
+        setattr_(new, name, default if factory is MISSING else factory())
+    if post_init:
+        new.__post_init__()  # type: ignore[attr-defined]
+    return new
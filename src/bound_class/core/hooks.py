@@ -0,0 +1,267 @@
+"""Hooks called when bound objects are bound, rebound and unbound.
+
+The hooks are off by default and then cost nothing: the descriptors,
+accessors and `~bound_class.core.base.BoundClassRef` run their usual code,
+without checks of whether there are hooks. Adding the first hook (or turning
+on the `bound_class.core.counters`) swaps in versions of their methods that
+report events, and removing the last swaps the originals back.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, Callable, MutableMapping
+
+if TYPE_CHECKING:
+    Listener = Callable[[str, type, Any, Any], None]
+    Hook = Callable[[str, Any, Any], None]
+
+__all__: list[str] = []
+
+#: The events passed to the hooks of `add_hook`.
+HOOK_EVENTS = ("bind", "rebind", "unbind")
+
+# The events of the methods (see `_patches`) are passed to each listener as
+# ``listener(event, cls, bound, enclosing)``, where ``event`` is one of
+#   "get"      an access from an enclosing instance
+#   "make"     a new bound object was made
+#   "rebind"   a cached bound object was bound to the enclosing object again
+#   "ref"      a `BoundClassRef` or `StrongRef` was made
+#   "finalize" the callback of a `BoundClassRef` fired
+#   "unbind"   ... and unbound the bound object
+#   "evict"    a cached bound object was evicted, see `bound_class.core.budget`
+# and ``cls`` is the class to attribute the event to: the descriptor class,
+# the accessor class (not `AccessorProperty`) or the bound class.
+_listeners: tuple[Listener, ...] = ()  # replaced, not mutated, so it is safe to iterate
+_lock = threading.Lock()
+_originals: dict[tuple[type, str], Any] = {}
+_hooks: dict[Hook, Listener] = {}
+
+
+def _emit(event: str, cls: type, bound: Any, enclosing: Any) -> None:  # noqa: ANN401
+    for listener in _listeners:
+        listener(event, cls, bound, enclosing)
+
+
+# ===================================================================
+# Reporting methods
+
+
+def _reporting_get_bound(orig: Callable[..., Any]) -> Callable[..., Any]:
+    def _get_bound(self: Any, enclosing: Any) -> Any:  # noqa: ANN401
+        out = orig(self, enclosing)
+        _emit("get", type(self), out, enclosing)
+        if self.store_in is None:
+            _emit("make", type(self), out, enclosing)
+        return out
+
+    return _get_bound
+
+
+def _reporting_make(orig: Callable[..., Any], key: Callable[[Any], type]) -> Callable[..., Any]:
+    # For ``_bind`` of descriptors and ``_make`` of accessors.
+    def _make(self: Any, enclosing: Any, cache: MutableMapping[str, Any]) -> Any:  # noqa: ANN401
+        before = cache.get(self._enclosing_attr)
+        selfref = getattr(before, "__selfref__", None)
+        was_bound = selfref is not None and selfref() is enclosing  # made by another thread
+        out = orig(self, enclosing, cache)
+        if out is not before:
+            _emit("make", key(self), out, enclosing)
+        elif not was_bound:
+            _emit("rebind", key(self), out, enclosing)
+        return out
+
+    return _make
+
+
+def _reporting_bind_many(orig: Callable[..., Any], key: Callable[[Any], type]) -> Callable[..., Any]:
+    def bind_many(self: Any, enclosings: Any) -> list[Any]:  # noqa: ANN401
+        enclosings = list(enclosings)
+        out: list[Any] = orig(self, enclosings)
+        cls = key(self)
+        for bound, enclosing in zip(out, enclosings):  # noqa: B905
+            _emit("get", cls, bound, enclosing)
+            if self.store_in is None:
+                _emit("make", cls, bound, enclosing)
+        return out
+
+    return bind_many
+
+
+def _reporting_accessor_get(orig: Callable[..., Any]) -> Callable[..., Any]:
+    def __get__(self: Any, enclosing: Any, cls: Any) -> Any:  # noqa: ANN401, N807
+        out = orig(self, enclosing, cls)
+        if enclosing is not None:
+            _emit("get", self.accessor_cls, out, enclosing)
+            if self.store_in is None:
+                _emit("make", self.accessor_cls, out, enclosing)
+        return out
+
+    return __get__
+
+
+def _reporting_cached_accessor_get(orig: Callable[..., Any]) -> Callable[..., Any]:
+    def __get__(self: Any, enclosing: Any, cls: Any) -> Any:  # noqa: ANN401, N807
+        if enclosing is None:
+            return orig(self, enclosing, cls)
+        before = enclosing.__dict__.get(self._enclosing_attr)
+        out = orig(self, enclosing, cls)
+        _emit("get", self.accessor_cls, out, enclosing)
+        if out is not before:
+            _emit("make", self.accessor_cls, out, enclosing)
+        return out
+
+    return __get__
+
+
+def _reporting_ref_init(orig: Callable[..., Any]) -> Callable[..., Any]:
+    def __init__(self: Any, ob: Any, *args: Any, bound: Any) -> None:  # noqa: ANN401, N807
+        orig(self, ob, *args, bound=bound)
+        _emit("ref", type(bound), bound, ob)
+
+    return __init__
+
+
+def _reporting_finalizer_callback(orig: Callable[..., Any]) -> Callable[..., Any]:
+    def _finalizer_callback(self: Any) -> None:  # noqa: ANN401
+        bound = self._bound_ref()
+        unbinds = bound is not None and getattr(bound, "__selfref__", None) is self
+        orig(self)
+        _emit("finalize", type(self) if bound is None else type(bound), bound, None)
+        if unbinds:
+            _emit("unbind", type(bound), bound, None)
+
+    return _finalizer_callback
+
+
+def _patches() -> list[tuple[type, str, Callable[..., Any]]]:
+    """Return the methods to swap for reporting ones: (class, name, wrapper)."""
+    # Imported here, so that importing this module stays cheap.
+    from bound_class.core.accessors.descriptor import AccessorProperty, CachedAccessorProperty
+    from bound_class.core.base import BoundClassRef, StrongRef
+    from bound_class.core.descriptors.base import SlottedBoundDescriptorBase
+
+    def descriptor(self: Any) -> type:  # noqa: ANN401
+        return type(self)
+
+    def accessor(self: Any) -> type:  # noqa: ANN401
+        return self.accessor_cls  # type: ignore[no-any-return]
+
+    return [
+        (SlottedBoundDescriptorBase, "_get_bound", _reporting_get_bound),
+        (SlottedBoundDescriptorBase, "_bind", lambda f: _reporting_make(f, descriptor)),
+        (SlottedBoundDescriptorBase, "bind_many", lambda f: _reporting_bind_many(f, descriptor)),
+        (AccessorProperty, "__get__", _reporting_accessor_get),
+        (AccessorProperty, "_make", lambda f: _reporting_make(f, accessor)),
+        (AccessorProperty, "bind_many", lambda f: _reporting_bind_many(f, accessor)),
+        (CachedAccessorProperty, "__get__", _reporting_cached_accessor_get),
+        (BoundClassRef, "__init__", _reporting_ref_init),
+        (StrongRef, "__init__", _reporting_ref_init),
+        (BoundClassRef, "_finalizer_callback", _reporting_finalizer_callback),
+    ]
+
+
+def _add_listener(listener: Listener) -> None:
+    """Call ``listener`` on each event, swapping in the reporting methods if needed."""
+    global _listeners  # noqa: PLW0603
+    with _lock:
+        if listener in _listeners:
+            return
+        if not _originals:
+            for cls, name, wrap in _patches():
+                orig = cls.__dict__[name]
+                _originals[cls, name] = orig
+                setattr(cls, name, wrap(orig))
+        _listeners = (*_listeners, listener)
+
+
+def _remove_listener(listener: Listener) -> None:
+    """Stop calling ``listener``, swapping back the original methods if it was the last."""
+    global _listeners  # noqa: PLW0603
+    with _lock:
+        _listeners = tuple(x for x in _listeners if x != listener)
+        if not _listeners:
+            while _originals:
+                (cls, name), orig = _originals.popitem()
+                setattr(cls, name, orig)
+
+
+# ===================================================================
+# API
+
+
+def add_hook(hook: Hook) -> Hook:
+    """Call ``hook`` when a bound object is bound, rebound or unbound.
+
+    Parameters
+    ----------
+    hook : Callable[[str, Any, Any], None]
+        Called as ``hook(event, bound, enclosing)``, where ``event`` is one of
+        `HOOK_EVENTS`:
+
+        - ``"bind"``: a descriptor or accessor ``bound`` was made and bound to
+          ``enclosing``, e.g. on first access.
+        - ``"rebind"``: the cached ``bound`` was bound to ``enclosing`` again,
+          e.g. after ``del bound.__self__``.
+        - ``"unbind"``: the object ``bound`` was bound to was deleted.
+          ``enclosing`` is `None`.
+
+        Errors raised by the hook propagate to the attribute access, except
+        for ``"unbind"``, which is called from a :mod:`weakref` callback.
+
+    Returns
+    -------
+    Callable[[str, Any, Any], None]
+        ``hook``, so this can be used as a decorator.
+
+    Examples
+    --------
+        >>> from bound_class.core import add_hook, remove_hook
+        >>> from bound_class.core.descriptors import BoundDescriptor
+
+        >>> class Example:
+        ...     attr = BoundDescriptor()
+
+        >>> @add_hook
+        ... def log(event, bound, enclosing):
+        ...     print(event, type(bound).__name__)
+
+        >>> ex = Example()
+        >>> _ = ex.attr
+        bind BoundDescriptor
+        >>> _ = ex.attr  # cached, so no event
+        >>> dsc = ex.attr
+        >>> del ex
+        unbind BoundDescriptor
+
+        >>> remove_hook(log)
+
+    """
+
+    def listener(event: str, _: type, bound: Any, enclosing: Any) -> None:  # noqa: ANN401
+        if event == "make":
+            hook("bind", bound, enclosing)
+        elif event in {"rebind", "unbind"}:
+            hook(event, bound, enclosing)
+
+    with _lock:
+        if hook in _hooks:
+            return hook
+        _hooks[hook] = listener
+    _add_listener(listener)
+    return hook
+
+
+def remove_hook(hook: Hook) -> None:
+    """Stop calling a hook added by `add_hook`.
+
+    Parameters
+    ----------
+    hook : Callable[[str, Any, Any], None]
+        The hook. If it was not added, this does nothing.
+
+    """
+    with _lock:
+        listener = _hooks.pop(hook, None)
+    if listener is not None:
+        _remove_listener(listener)
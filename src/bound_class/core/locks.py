@@ -0,0 +1,80 @@
+"""Locks for making bound objects once, when accessed from many threads."""
+
+from __future__ import annotations
+
+import threading
+
+__all__: list[str] = []
+
+
+class KeyLock:
+    """The re-entrant lock of an attribute of an enclosing object, see `lock_for`.
+
+    It exists while a thread uses it, counted in ``users``, and is removed
+    from the table of locks when the last one exits it.
+    """
+
+    __slots__ = ("key", "lock", "users")
+
+    def __init__(self, key: tuple[int, str]) -> None:
+        self.key = key
+        self.lock = threading.RLock()
+        self.users = 0
+
+    def __enter__(self) -> None:
+        self.lock.acquire()
+
+    def __exit__(self, *_: object) -> None:
+        self.lock.release()
+        with _guard:
+            self.users -= 1
+            if not self.users:
+                del _locks[self.key]
+
+
+# The locks in use, by ``(id(enclosing), name)``. The ids are unique while
+# the lock is used, as the user holds the enclosing object.
+_locks: dict[tuple[int, str], KeyLock] = {}
+# Re-entrant, as garbage collection while it is held can access descriptors.
+_guard = threading.RLock()
+
+
+def lock_for(obj: object, name: str) -> KeyLock:
+    """Return the lock for making the bound object of an enclosing object.
+
+    Descriptors and accessors read the bound object stored on the enclosing
+    object without a lock. Only if it is missing (or must be rebound) do they
+    take this lock, check again and make it, so it is made once even when
+    many threads access it at the same time.
+
+    There is a lock per enclosing object and attribute, made on demand and
+    removed when no thread uses it, so there is no global lock and unrelated
+    bound objects never wait on each other. The locks are re-entrant.
+
+    Parameters
+    ----------
+    obj : object
+        The enclosing object.
+    name : str
+        The name of the attribute of the bound object.
+
+    Returns
+    -------
+    `KeyLock`
+        Use it once, as a context manager: ``with lock_for(obj, name): ...``.
+
+    Notes
+    -----
+    Making a bound object may access the bound objects of other attributes
+    and other enclosing objects, also while other threads do so in another
+    order. Threads only wait on each other in a cycle if a bound object needs
+    itself to be made, which recurses without end in one thread too.
+
+    """
+    key = (id(obj), name)
+    with _guard:
+        lock = _locks.get(key)
+        if lock is None:
+            lock = _locks[key] = KeyLock(key)
+        lock.users += 1
+    return lock
@@ -0,0 +1,397 @@
+"""Profile the time spent in each registered descriptor and accessor.
+
+The `Profiler` splits the wall time of each attribute registered with
+`~bound_class.core.register_descriptor` or
+`~bound_class.core.register_accessor` into the time to bind it (make or
+rebind the bound object, on a cache miss), the time of ``__get__`` when it was
+already bound (a cache hit) and the time in the methods and properties of the
+bound object. A script can be profiled from the command line with
+::
+
+    python -m bound_class.core.profiler [-s {total,bind,get,methods}] script.py [args ...]
+
+which prints the report when the script ends.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import inspect
+import runpy
+import sys
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, ClassVar
+
+from bound_class.core.base import ref_mode_base
+from bound_class.core.descriptors.register import LazyDescriptor, _register_listeners, registered_attributes
+from bound_class.core.storage import get_cache
+
+__all__: list[str] = []
+
+#: The columns by which `Profiler.report` can sort.
+SORT_KEYS = ("total", "bind", "get", "methods")
+
+_lock = threading.Lock()
+_local = threading.local()  # whether a profiled method is running, per thread
+
+
+@dataclass
+class Timing:
+    """The number of calls and their total wall time, in seconds."""
+
+    count: int = 0
+    time: float = 0.0
+
+    def add(self, time: float) -> None:
+        """Add a call that took ``time`` seconds."""
+        with _lock:
+            self.count += 1
+            self.time += time
+
+
+@dataclass
+class AttributeProfile:
+    """The profile of a registered attribute.
+
+    Parameters
+    ----------
+    enclosing_cls : type
+        The class on which the attribute is registered.
+    name : str
+        The name of the attribute.
+    bound_cls : type
+        The class of the bound objects: the descriptor class or accessor class.
+    bind : `Timing`
+        Accesses that made or rebound the bound object.
+    get : `Timing`
+        Accesses that found the bound object already bound.
+    methods : dict[str, `Timing`]
+        Calls of the public methods and properties of ``bound_cls``. These are
+        shared by all the attributes with the same ``bound_cls``.
+
+    """
+
+    enclosing_cls: type
+    name: str
+    bound_cls: type
+    bind: Timing = field(default_factory=Timing)
+    get: Timing = field(default_factory=Timing)
+    methods: dict[str, Timing] = field(default_factory=dict)
+
+    @property
+    def method_time(self) -> float:
+        """The total time in the methods of the bound objects, in seconds."""
+        return sum(t.time for t in list(self.methods.values()))
+
+    @property
+    def total_time(self) -> float:
+        """The total time of the attribute, in seconds."""
+        return self.bind.time + self.get.time + self.method_time
+
+
+class _ProfiledAttribute:
+    """Stands in for a non-data descriptor on its class, timing ``__get__``."""
+
+    __slots__ = ("_store_in", "descriptor", "profile")
+
+    def __init__(self, descriptor: Any, profile: AttributeProfile) -> None:  # noqa: ANN401
+        self.descriptor = descriptor
+        self.profile = profile
+        self._store_in: str | None = getattr(descriptor, "store_in", "__dict__")
+
+    def __repr__(self) -> str:
+        return f"<profiled {self.descriptor!r}>"
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        return getattr(self.descriptor, name)
+
+    def __get__(self, enclosing: Any, enclosing_cls: type | None = None) -> Any:  # noqa: ANN401
+        if enclosing is None:
+            return self.descriptor.__get__(enclosing, enclosing_cls)
+
+        # Whether the bound object is cached and bound to ``enclosing``.
+        cached = None if self._store_in is None else get_cache(enclosing, self._store_in).get(self.profile.name)
+        selfref = getattr(cached, "__selfref__", None)
+        hit = selfref is not None and selfref() is enclosing
+
+        start = perf_counter()
+        out = self.descriptor.__get__(enclosing, enclosing_cls)
+        (self.profile.get if hit else self.profile.bind).add(perf_counter() - start)
+        return out
+
+
+class _ProfiledDataAttribute(_ProfiledAttribute):
+    """Stands in for a data descriptor on its class, timing ``__get__``."""
+
+    __slots__ = ()
+
+    def __set__(self, enclosing: Any, value: Any) -> None:  # noqa: ANN401
+        self.descriptor.__set__(enclosing, value)
+
+
+class Profiler:
+    """Profile the time spent in each registered descriptor and accessor.
+
+    While enabled, the registered attributes (see
+    `~bound_class.core.registered_attributes`) are replaced on their classes
+    by stand-ins that time ``__get__``, and the public methods and properties
+    of the bound classes are replaced by ones that time the calls. Disabling
+    restores the originals. Attributes registered while enabled, including
+    those registered by import path when they are imported, are also
+    profiled.
+
+    The method times are wall times and include the time in the methods they
+    call, except in other profiled methods, which is counted only once, in the
+    outermost.
+
+    Attributes
+    ----------
+    attributes : dict[tuple[type, str], `AttributeProfile`]
+        The profile of each attribute, by enclosing class and name.
+
+    Examples
+    --------
+        >>> from bound_class.core import Profiler, register_accessor
+        >>> from bound_class.core.accessors import Accessor
+
+        >>> class Example:
+        ...     pass
+        >>> @register_accessor(Example, "acc")
+        ... class ExampleAccessor(Accessor):
+        ...     def method(self):
+        ...         return 1
+
+        >>> with Profiler() as profiler:
+        ...     ex = Example()
+        ...     for _ in range(3):
+        ...         _ = ex.acc.method()
+        >>> profile = profiler.attributes[Example, "acc"]
+        >>> profile.bind.count, profile.get.count, profile.methods["method"].count
+        (1, 2, 3)
+        >>> print(profiler.report())  # doctest: +SKIP
+        attribute    class            binds  bind (s)  gets  get (s)  calls  methods (s)  total (s)
+        Example.acc  ExampleAccessor      1  0.000004     2  0.000001      3     0.000001   0.000006
+
+    """
+
+    _active: ClassVar[Profiler | None] = None
+
+    def __init__(self) -> None:
+        self.attributes: dict[tuple[type, str], AttributeProfile] = {}
+        self._methods: dict[type, dict[str, Timing]] = {}
+        self._attribute_originals: dict[tuple[type, str], Any] = {}
+        self._method_originals: dict[tuple[type, str], Any] = {}
+
+    # ===============================================================
+    # Enabling
+
+    def enable(self) -> None:
+        """Start profiling.
+
+        Raises
+        ------
+        RuntimeError
+            If a profiler is already enabled.
+
+        """
+        with _lock:
+            if Profiler._active is not None:
+                msg = "a Profiler is already enabled"
+                raise RuntimeError(msg)
+            Profiler._active = self
+        for cls, name in registered_attributes():
+            self._profile_attribute(cls, name)
+        _register_listeners.append(self._profile_attribute)
+
+    def disable(self) -> None:
+        """Stop profiling, restoring the attributes and methods."""
+        if Profiler._active is not self:
+            return
+        _register_listeners.remove(self._profile_attribute)
+        while self._attribute_originals:
+            (cls, name), original = self._attribute_originals.popitem()
+            value = cls.__dict__.get(name)
+            if isinstance(value, _ProfiledAttribute) and value.descriptor is original:  # not replaced since
+                setattr(cls, name, original)
+        while self._method_originals:
+            (cls, name), original = self._method_originals.popitem()
+            setattr(cls, name, original)
+        Profiler._active = None
+
+    def __enter__(self) -> Profiler:  # noqa: PYI034
+        self.enable()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.disable()
+
+    def _profile_attribute(self, cls: type, name: str) -> None:
+        """Replace the attribute ``name`` of ``cls`` by a timing stand-in."""
+        descriptor = cls.__dict__.get(name)
+        if descriptor is None or isinstance(descriptor, LazyDescriptor | _ProfiledAttribute):
+            return  # LazyDescriptor is profiled when it is imported and replaced
+
+        # the class that was registered, not its `with_ref_mode` subclass
+        bound_cls = ref_mode_base(getattr(descriptor, "accessor_cls", None) or type(descriptor))
+        profile = self.attributes.get((cls, name))
+        if profile is None or profile.bound_cls is not bound_cls:
+            methods = self._methods.setdefault(bound_cls, {})
+            profile = self.attributes[cls, name] = AttributeProfile(cls, name, bound_cls, methods=methods)
+
+        stand_in = _ProfiledDataAttribute if hasattr(type(descriptor), "__set__") else _ProfiledAttribute
+        self._attribute_originals[cls, name] = descriptor
+        setattr(cls, name, stand_in(descriptor, profile))
+        self._profile_methods(bound_cls)
+
+    def _profile_methods(self, bound_cls: type) -> None:
+        """Replace the public methods and properties of ``bound_cls`` by timing ones."""
+        for klass in bound_cls.__mro__:
+            if klass is object or klass.__module__.startswith("bound_class.core"):
+                continue
+            for name, value in list(vars(klass).items()):
+                if name.startswith("_") or (klass, name) in self._method_originals:
+                    continue
+                if isinstance(value, property) and value.fget is not None:
+                    timed: Any = property(self._timed(value.fget, name), value.fset, value.fdel, value.__doc__)
+                elif inspect.isfunction(value):
+                    timed = self._timed(value, name)
+                else:
+                    continue
+                self._method_originals[klass, name] = value
+                setattr(klass, name, timed)
+
+    def _timed(self, func: Callable[..., Any], name: str) -> Callable[..., Any]:
+        """Return ``func``, timed in the profile of the class of its first argument."""
+        methods = self._methods
+
+        @functools.wraps(func)
+        def timed(obj: Any, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            if getattr(_local, "active", False):  # timed by the outer method
+                return func(obj, *args, **kwargs)
+            _local.active = True
+            start = perf_counter()
+            try:
+                return func(obj, *args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                _local.active = False
+                timings = methods.setdefault(ref_mode_base(type(obj)), {})
+                timing = timings.get(name)
+                if timing is None:
+                    timing = timings.setdefault(name, Timing())
+                timing.add(elapsed)
+
+        return timed
+
+    # ===============================================================
+    # Report
+
+    def report(self, sort: str = "total") -> str:
+        """Return a table of the profile of each attribute, slowest first.
+
+        Parameters
+        ----------
+        sort : {"total", "bind", "get", "methods"}, optional
+            The time by which to sort.
+
+        Returns
+        -------
+        str
+
+        Raises
+        ------
+        ValueError
+            If ``sort`` is not one of `SORT_KEYS`.
+
+        """
+        if sort not in SORT_KEYS:
+            msg = f"sort must be one of {SORT_KEYS}, not {sort!r}"
+            raise ValueError(msg)
+        key: Callable[[AttributeProfile], float] = {
+            "total": lambda p: p.total_time,
+            "bind": lambda p: p.bind.time,
+            "get": lambda p: p.get.time,
+            "methods": lambda p: p.method_time,
+        }[sort]
+
+        rows: list[tuple[str, ...]] = [
+            ("attribute", "class", "binds", "bind (s)", "gets", "get (s)", "calls", "methods (s)", "total (s)")
+        ]
+        for p in sorted(self.attributes.values(), key=key, reverse=True):
+            rows.append(  # noqa: PERF401
+                (
+                    f"{p.enclosing_cls.__qualname__}.{p.name}",
+                    p.bound_cls.__qualname__,
+                    str(p.bind.count),
+                    f"{p.bind.time:.6f}",
+                    str(p.get.count),
+                    f"{p.get.time:.6f}",
+                    str(sum(t.count for t in p.methods.values())),
+                    f"{p.method_time:.6f}",
+                    f"{p.total_time:.6f}",
+                )
+            )
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        return "\n".join(
+            "  ".join(v.ljust(widths[i]) if i < 2 else v.rjust(widths[i]) for i, v in enumerate(row))  # noqa: PLR2004
+            for row in rows
+        )
+
+
+# ===================================================================
+# Command line
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run a script under the `Profiler` and print the report.
+
+    Parameters
+    ----------
+    argv : list[str] or None, optional
+        The command line arguments. `None` (default) for `sys.argv`.
+
+    Returns
+    -------
+    int
+        The exit status.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m bound_class.core.profiler",
+        description="Profile the registered descriptors and accessors used by a script.",
+    )
+    parser.add_argument("-s", "--sort", choices=SORT_KEYS, default="total", help="the time by which to sort")
+    parser.add_argument("-o", "--outfile", help="write the report to this file, not stdout")
+    parser.add_argument("script", help="the script to run")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="arguments for the script")
+    args = parser.parse_args(argv)
+
+    # Run the script as if from ``python script.py args``
+    sys.argv = [args.script, *args.args]
+    sys.path.insert(0, str(Path(args.script).resolve().parent))
+
+    profiler = Profiler()
+    status = 0
+    try:
+        with profiler:
+            runpy.run_path(args.script, run_name="__main__")
+    except SystemExit as exc:
+        status = exc.code if isinstance(exc.code, int) else int(exc.code is not None)
+    finally:
+        report = profiler.report(args.sort)
+        if args.outfile:
+            Path(args.outfile).write_text(report + "\n")
+        else:
+            print(report)  # noqa: T201
+    return status
+
+
+if __name__ == "__main__":
+    # Use the imported module, not ``__main__``, so the script shares it.
+    from bound_class.core.profiler import main as _main
+
+    sys.exit(_main())
@@ -0,0 +1,180 @@
+"""Where descriptors and accessors store their bound objects.
+
+The ``store_in`` option of the descriptors and accessors names a mapping on
+the enclosing object, ``"__dict__"`` or ``"_attrs_"``, in which the bound
+objects are stored. Objects without either, e.g. of classes with
+``__slots__``, can use the side table of this module instead, with
+``store_in="side_table"``.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import Any, Literal, MutableMapping
+
+from bound_class.core.base import StrongRef
+
+__all__: list[str] = []
+
+#: The ``store_in`` of bound objects stored in the side table.
+SIDE_TABLE: Literal["side_table"] = "side_table"
+
+#: The ``store_in`` of the mappings searched by `locate`.
+STORE_INS = ("__dict__", "_attrs_", SIDE_TABLE)
+
+# The side table: ``id`` of the enclosing object -> its bound objects.
+_side_table: dict[int, _SideCache] = {}
+_lock = threading.Lock()
+
+
+class _SideCache(dict):  # type: ignore[type-arg]
+    """The bound objects of an enclosing object, by attribute name.
+
+    The cache holds a weak reference to the enclosing object, whose callback
+    removes the cache from the side table when the enclosing object is
+    deleted.
+    """
+
+    __slots__ = ("_ref",)
+
+    def __init__(self, enclosing: object) -> None:
+        super().__init__()
+        self._ref = weakref.KeyedRef(enclosing, _forget, id(enclosing))
+
+
+def _forget(ref: weakref.KeyedRef[Any, Any]) -> None:
+    """`weakref.ref` callback removing a deleted enclosing object from the side table."""
+    _side_table.pop(ref.key, None)
+
+
+def side_table(enclosing: object) -> MutableMapping[str, Any]:
+    """Return the bound objects of ``enclosing`` in the side table.
+
+    Parameters
+    ----------
+    enclosing : object
+        The enclosing object. It must be weak-referenceable, but need not have
+        a ``__dict__`` or be hashable.
+
+    Returns
+    -------
+    MutableMapping[str, Any]
+        The bound objects, by attribute name. It is made on first use and
+        removed from the side table when ``enclosing`` is deleted.
+
+    Raises
+    ------
+    TypeError
+        If ``enclosing`` is not weak-referenceable.
+
+    Examples
+    --------
+        >>> from bound_class.core.accessors import Accessor, AccessorProperty
+        >>> from bound_class.core.storage import side_table
+
+        >>> class Record:
+        ...     __slots__ = ("__weakref__", "value")
+        ...     accessor = AccessorProperty(Accessor, store_in="side_table")
+
+        >>> rec = Record()
+        >>> rec.accessor is rec.accessor
+        True
+        >>> side_table(rec)
+        {'accessor': <...Accessor object at ...>}
+
+    """
+    cache = _side_table.get(id(enclosing))
+    if cache is None:
+        with _lock:
+            cache = _side_table.get(id(enclosing))
+            if cache is None:
+                cache = _side_table[id(enclosing)] = _SideCache(enclosing)
+    return cache
+
+
+def check_store_in(bound_cls: type, store_in: str | None) -> None:
+    """Check that the bound objects of ``bound_cls`` can be stored in ``store_in``.
+
+    The side table holds its bound objects strongly, so a bound object that
+    strongly references its enclosing object, with ``ref_mode="strong"``
+    (see `bound_class.core.base.set_ref_mode`), would keep the enclosing
+    object alive forever.
+
+    Parameters
+    ----------
+    bound_cls : type
+        The class of the bound objects, e.g. an accessor class.
+    store_in : str or None
+        The ``store_in`` of the descriptor or accessor.
+
+    Raises
+    ------
+    ValueError
+        If ``store_in`` is `SIDE_TABLE` and ``bound_cls`` has
+        ``ref_mode="strong"``.
+
+    """
+    if store_in == SIDE_TABLE and getattr(bound_cls, "__selfref_type__", None) is StrongRef:
+        msg = (
+            f"{bound_cls.__qualname__} has ref_mode='strong', so it cannot be stored in the side table: "
+            "use store_in='_attrs_' or None, or ref_mode='weak'"
+        )
+        raise ValueError(msg)
+
+
+def get_cache(enclosing: object, store_in: str) -> MutableMapping[str, Any]:
+    """Return the mapping ``store_in`` in which bound objects of ``enclosing`` are stored.
+
+    Parameters
+    ----------
+    enclosing : object
+        The enclosing object.
+    store_in : str
+        The ``store_in`` of the descriptor or accessor: the name of an
+        attribute of ``enclosing`` or `SIDE_TABLE`.
+
+    Returns
+    -------
+    MutableMapping[str, Any]
+
+    """
+    if store_in == SIDE_TABLE:
+        return side_table(enclosing)
+    cache: MutableMapping[str, Any] = getattr(enclosing, store_in)
+    return cache
+
+
+def locate(bound: object, enclosing: object) -> tuple[str, str] | None:
+    """Return the ``store_in`` and name under which ``bound`` is stored on ``enclosing``.
+
+    Bound descriptors know both. Accessors do not, so the mappings of
+    `STORE_INS` are searched.
+
+    Parameters
+    ----------
+    bound : object
+        The bound descriptor or accessor.
+    enclosing : object
+        The enclosing object.
+
+    Returns
+    -------
+    tuple[str, str] or None
+        The ``store_in`` and attribute name, or `None` if ``bound`` is not
+        stored on ``enclosing``, e.g. with ``store_in=None``.
+
+    """
+    store_in = getattr(bound, "store_in", "")
+    name = getattr(bound, "_enclosing_attr", None)
+    if store_in is None:
+        return None
+    if store_in and name is not None:
+        return (store_in, name) if get_cache(enclosing, store_in).get(name) is bound else None
+
+    for store_in in STORE_INS:
+        cache = _side_table.get(id(enclosing)) if store_in == SIDE_TABLE else getattr(enclosing, store_in, None)
+        for name, value in getattr(cache, "items", dict)():
+            if value is bound:
+                return store_in, name
+    return None
@@ -0,0 +1,315 @@
+"""Cached values that are invalidated when the fields they read are written.
+
+`track_fields` makes the fields of an enclosing class, e.g. a mutable
+dataclass, record when they are read while a `tracked_cached_property` is
+computed, and invalidate the values that read them when they are written. So
+mutating the enclosing object invalidates only the dependent cached values of
+its descriptors and accessors; everything else stays cached.
+
+The side tables here are keyed by ``id`` and hold weak references, like the
+rest of `bound_class.core`, so tracking does not keep enclosing or bound
+objects alive.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, TypeVar, overload
+
+from bound_class.core.cached import bound_cached_property
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    # A computation's reads: (id of the enclosing object, field) -> weakref to the enclosing object.
+    Reads = dict[tuple[int, str], weakref.ReferenceType[Any]]
+
+__all__: list[str] = []
+
+T = TypeVar("T")
+C = TypeVar("C", bound=type)
+
+_MISSING = object()
+
+# The dependent cached values, as
+#   id of the enclosing object -> field -> (id of the bound object, attribute) -> weakref to the bound object.
+# An enclosing object's entry is removed when it is deleted.
+_dependents: dict[int, dict[str, dict[tuple[int, str], weakref.ReferenceType[Any]]]] = {}
+_lock = threading.Lock()
+
+# The reads of the computations in progress, innermost last, per thread.
+_local = threading.local()
+# The number of computations in progress in all threads, so reads outside of
+# computations cost one check.
+_active = 0
+
+
+def _push() -> Reads:
+    global _active  # noqa: PLW0603
+    reads: Reads = {}
+    stack: list[Reads] | None = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    stack.append(reads)
+    with _lock:
+        _active += 1
+    return reads
+
+
+def _pop() -> None:
+    global _active  # noqa: PLW0603
+    stack: list[Reads] = _local.stack
+    reads = stack.pop()
+    if stack:  # the outer computation read whatever the inner one read
+        stack[-1].update(reads)
+    with _lock:
+        _active -= 1
+
+
+def _record(reads: Reads) -> None:
+    """Add ``reads`` to the innermost computation in progress in this thread, if any."""
+    stack: list[Reads] | None = getattr(_local, "stack", None)
+    if stack:
+        stack[-1].update(reads)
+
+
+def _add_dependent(bound: Any, name: str, reads: Reads) -> None:  # noqa: ANN401
+    """Record that the value ``name`` of ``bound`` was computed from ``reads``."""
+    key = (id(bound), name)
+    boundref = weakref.ref(bound)
+    with _lock:
+        for (enclosing_id, field), enclosingref in reads.items():
+            fields = _dependents.get(enclosing_id)
+            if fields is None:
+                enclosing = enclosingref()
+                if enclosing is None:
+                    continue
+                fields = _dependents[enclosing_id] = {}
+                # Not called at exit, when ``_dependents`` is discarded anyway.
+                weakref.finalize(enclosing, _dependents.pop, enclosing_id, None).atexit = False
+            fields.setdefault(field, {})[key] = boundref
+
+
+def _invalidate_dependents(enclosing: object, field: str) -> None:
+    """Clear the cached values that read ``field`` of ``enclosing``."""
+    fields = _dependents.get(id(enclosing))
+    if not fields:
+        return
+    with _lock:
+        dependents = fields.pop(field, None)
+    if dependents:
+        for (_, name), boundref in dependents.items():
+            bound = boundref()
+            if bound is not None:
+                bound.__dict__.pop(name, None)
+
+
+class _TrackedField:
+    """Data descriptor for a field of a class decorated by `track_fields`."""
+
+    __slots__ = ("default", "name", "slot")
+
+    def __init__(self, name: str, original: Any) -> None:  # noqa: ANN401
+        self.name = name
+        # The class attribute that this replaces: the slot in which the value
+        # is stored, or else the default value (if any).
+        self.slot = original if hasattr(type(original), "__set__") else None
+        self.default = _MISSING if self.slot is not None else original
+
+    def __get__(self, enclosing: object | None, cls: type | None = None) -> Any:  # noqa: ANN401
+        if enclosing is None:
+            return self if self.default is _MISSING else self.default
+        if _active:
+            stack: list[Reads] | None = getattr(_local, "stack", None)
+            if stack:
+                stack[-1][id(enclosing), self.name] = weakref.ref(enclosing)
+
+        if self.slot is not None:
+            return self.slot.__get__(enclosing, cls)
+        value = enclosing.__dict__.get(self.name, self.default)
+        if value is _MISSING:
+            msg = f"{type(enclosing).__qualname__!r} object has no attribute {self.name!r}"
+            raise AttributeError(msg)
+        return value
+
+    def __set__(self, enclosing: object, value: Any) -> None:  # noqa: ANN401
+        if self.slot is not None:
+            self.slot.__set__(enclosing, value)
+        else:
+            enclosing.__dict__[self.name] = value
+        _invalidate_dependents(enclosing, self.name)
+
+    def __delete__(self, enclosing: object) -> None:
+        if self.slot is not None:
+            self.slot.__delete__(enclosing)
+        else:
+            try:
+                del enclosing.__dict__[self.name]
+            except KeyError:
+                raise AttributeError(self.name) from None
+        _invalidate_dependents(enclosing, self.name)
+
+
+@overload
+def track_fields(cls: C, *, fields: Iterable[str] | None = None) -> C: ...
+
+
+@overload
+def track_fields(cls: None = None, *, fields: Iterable[str] | None = None) -> Callable[[C], C]: ...
+
+
+def track_fields(cls: C | None = None, *, fields: Iterable[str] | None = None) -> C | Callable[[C], C]:
+    """Class decorator tracking reads and writes of the fields of an enclosing class.
+
+    Each field is replaced by a data descriptor that stores the value as
+    before, in the instance ``__dict__`` or slot. Reading it while a
+    `tracked_cached_property` is computed records the field as a dependency
+    of the cached value, and writing (or deleting) it invalidates the values
+    that depend on it.
+
+    Parameters
+    ----------
+    cls : type, optional
+        The enclosing class. Instances must be weak-referenceable.
+    fields : iterable[str] or None, optional
+        The names of the fields to track. If `None` (default), the fields of
+        ``cls``, which must then be a :mod:`dataclasses` dataclass.
+
+    Returns
+    -------
+    type
+        ``cls``, or a decorator if ``cls`` is not given.
+
+    Raises
+    ------
+    TypeError
+        If ``fields`` is not given and ``cls`` is not a dataclass, or if
+        instances of ``cls`` are not weak-referenceable.
+
+    Examples
+    --------
+        >>> from dataclasses import dataclass
+        >>> from math import atan2, sqrt
+        >>> from bound_class.core.descriptors import InstanceDescriptor
+
+        >>> class SphericalDescriptor(InstanceDescriptor):
+        ...     @tracked_cached_property
+        ...     def r(self):
+        ...         print("computing r")
+        ...         return sqrt(self.enclosing.x**2 + self.enclosing.y**2)
+        ...     @tracked_cached_property
+        ...     def phi(self):
+        ...         print("computing phi")
+        ...         return atan2(self.enclosing.y, self.enclosing.x)
+
+        >>> @track_fields
+        ... @dataclass
+        ... class Cartesian:
+        ...     x: float
+        ...     y: float
+        ...     z: float = 0.0
+        ...     spherical = SphericalDescriptor()
+
+        >>> v = Cartesian(3.0, 4.0)
+        >>> v.spherical.r, v.spherical.phi  # doctest: +FLOAT_CMP
+        computing r
+        computing phi
+        (5.0, 0.9272952180016122)
+
+    ``z`` is not read by either, so writing it invalidates nothing. Writing
+    ``x`` invalidates both:
+
+        >>> v.z = 1.0
+        >>> v.spherical.r
+        5.0
+        >>> v.x = 0.0
+        >>> v.spherical.r, v.spherical.phi  # doctest: +FLOAT_CMP
+        computing r
+        computing phi
+        (4.0, 1.5707963267948966)
+
+    """
+    if cls is None:
+        return lambda c: track_fields(c, fields=fields)
+
+    if fields is None:
+        if not dataclasses.is_dataclass(cls):
+            msg = f"fields must be given for {cls.__qualname__!r}, which is not a dataclass"
+            raise TypeError(msg)
+        fields = [f.name for f in dataclasses.fields(cls)]
+    if cls.__weakrefoffset__ == 0:
+        msg = f"instances of {cls.__qualname__!r} must be weak-referenceable to track their fields"
+        raise TypeError(msg)
+
+    for name in fields:
+        original = cls.__dict__.get(name, _MISSING)
+        if isinstance(original, _TrackedField):
+            continue
+        setattr(cls, name, _TrackedField(name, original))
+    return cls
+
+
+class tracked_cached_property(bound_cached_property[T]):  # noqa: N801
+    """A `~bound_class.core.bound_cached_property` invalidated by writes to what it read.
+
+    While the value is computed, the reads of the fields of classes decorated
+    by `track_fields` are recorded. Writing any of those fields then
+    invalidates the value. Reads of other tracked cached values count as reads
+    of their fields, so a value computed from another is invalidated with it.
+
+    Like `~bound_class.core.bound_cached_property`, the value is also cleared
+    when the instance is rebound and by `~bound_class.core.invalidate`. Unlike
+    it, this is a data descriptor, so reading a cached value calls
+    ``__get__``: prefer `~bound_class.core.bound_cached_property` for values
+    of immutable enclosing objects.
+
+    Parameters
+    ----------
+    func : callable[[BoundClass], T]
+        The function computing the value.
+
+    Examples
+    --------
+    See `track_fields`.
+
+    """
+
+    @overload
+    def __get__(self, instance: None, owner: type | None = None) -> tracked_cached_property[T]: ...
+
+    @overload
+    def __get__(self, instance: object, owner: type | None = None) -> T: ...
+
+    def __get__(self, instance: object | None, owner: type | None = None) -> tracked_cached_property[T] | T:
+        if instance is None:
+            return self
+
+        cache = instance.__dict__
+        name = self.attrname
+        entry: tuple[T, Reads] | None = cache.get(name)
+        if entry is not None:
+            if _active:
+                _record(entry[1])
+            return entry[0]
+
+        selfref = getattr(instance, "__selfref__", None)
+        reads = _push()
+        try:
+            value = self.func(instance)
+        finally:
+            _pop()
+        if getattr(instance, "__selfref__", None) is selfref:
+            cache[name] = (value, reads)
+            _add_dependent(instance, name, reads)
+        return value
+
+    def __set__(self, instance: object, value: T) -> None:
+        instance.__dict__[self.attrname] = (value, {})
+
+    def __delete__(self, instance: object) -> None:
+        try:
+            del instance.__dict__[self.attrname]
+        except KeyError:
+            raise AttributeError(self.attrname) from None
@@ -0,0 +1,214 @@
+import asyncio
+import copy
+
+# THIRD PARTY
+import pytest
+
+from bound_class.core import register_accessor
+from bound_class.core.accessors import AsyncAccessor, AsyncAccessorProperty
+
+
+class FakeLoader:
+    """Stands in for I/O, e.g. reading a calibration table.
+
+    ``load`` waits until ``release`` is set, so the tests control how many
+    awaits are in flight at once.
+    """
+
+    def __init__(self, fail=0):
+        self.calls = 0
+        self.fail = fail  # the number of calls that raise
+        self.release = None
+
+    async def load(self, accessee):
+        self.calls += 1
+        if self.release is not None:
+            await self.release.wait()
+        await asyncio.sleep(0)
+        if self.calls <= self.fail:
+            msg = "load failed"
+            raise OSError(msg)
+        return {"id": id(accessee)}
+
+
+@pytest.fixture
+def loader():
+    return FakeLoader()
+
+
+@pytest.fixture(params=["__dict__", "_attrs_", None])
+def store_in(request):
+    return request.param
+
+
+@pytest.fixture
+def encl_cls(loader, store_in):
+    class Calibration(AsyncAccessor):
+        async def ainit(self):
+            self.table = await loader.load(self.accessee)
+
+    prop = AsyncAccessorProperty(Calibration, store_in=store_in)
+    prop.__set_name__(prop, "cal")
+
+    class Detector:
+        cal = prop
+
+        def __init__(self):
+            self._attrs_ = {}
+
+    return Detector
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+#####################################################################
+
+
+def test___get__from_cls(encl_cls):
+    assert encl_cls.cal is vars(encl_cls)["cal"].accessor_cls
+
+
+def test___get__from_inst(encl_cls, loader, store_in):
+    async def main():
+        det = encl_cls()
+        cal = await det.cal
+        assert cal.accessee is det
+        assert cal.table == {"id": id(det)}
+        return det, cal, await det.cal
+
+    det, cal, again = run(main())
+    if store_in is None:
+        assert again is not cal
+        assert loader.calls == 2
+    else:
+        assert getattr(det, store_in)["cal"] is cal
+        assert again is cal
+        assert loader.calls == 1
+
+
+@pytest.mark.parametrize("store_in", ["__dict__"])
+def test_single_flight(encl_cls, loader):
+    """Concurrent awaits share one in-flight load."""
+
+    async def main():
+        loader.release = asyncio.Event()
+        det, det2 = encl_cls(), encl_cls()
+        waiting = [asyncio.ensure_future(d.cal) for d in (det, det, det, det2, det2)]
+        await asyncio.sleep(0.01)
+        assert loader.calls == 2  # one per instance, both in flight at once
+        loader.release.set()
+        cals = await asyncio.gather(*waiting)
+        assert all(c is cals[0] for c in cals[:3])
+        assert all(c is cals[3] for c in cals[3:])
+        assert cals[0] is not cals[3]
+        assert vars(encl_cls)["cal"]._tasks == {}  # cleaned up
+
+    run(main())
+    assert loader.calls == 2
+
+
+@pytest.mark.parametrize("store_in", ["__dict__"])
+def test_stored_does_not_suspend(encl_cls):
+    async def main():
+        det = encl_cls()
+        cal = await det.cal
+        # a stored accessor is returned by ``await`` without suspending
+        with pytest.raises(StopIteration) as exc:
+            det.cal.__await__().send(None)
+        assert exc.value.value is cal
+
+    run(main())
+
+
+@pytest.mark.parametrize("store_in", ["__dict__"])
+def test_error(encl_cls, loader):
+    """All awaiters get the error, and the next await tries again."""
+    loader.fail = 1
+
+    async def main():
+        det = encl_cls()
+        results = await asyncio.gather(det.cal, det.cal, return_exceptions=True)
+        assert all(isinstance(r, OSError) for r in results)
+        assert "cal" not in vars(det)
+        assert loader.calls == 1
+
+        cal = await det.cal
+        assert vars(det)["cal"] is cal
+        assert loader.calls == 2
+
+    run(main())
+
+
+@pytest.mark.parametrize("store_in", ["__dict__"])
+def test_cancel(encl_cls, loader):
+    """Cancelling one awaiter does not cancel the load for the others."""
+
+    async def main():
+        loader.release = asyncio.Event()
+        det = encl_cls()
+        first, second = asyncio.ensure_future(det.cal), asyncio.ensure_future(det.cal)
+        await asyncio.sleep(0)
+        first.cancel()
+        loader.release.set()
+        cal = await second
+        assert first.cancelled()
+        assert vars(det)["cal"] is cal
+
+    run(main())
+    assert loader.calls == 1
+
+
+@pytest.mark.parametrize("store_in", ["__dict__"])
+def test_after_copy(encl_cls):
+    async def main():
+        det = encl_cls()
+        cal = await det.cal
+        det2 = copy.copy(det)  # shares the stored accessor
+        cal2 = await det2.cal
+        assert cal2 is not cal
+        assert cal2.accessee is det2
+        assert (await det.cal) is cal
+
+    run(main())
+
+
+@pytest.mark.parametrize("store_in", ["__dict__"])
+def test___get__wrong_type(encl_cls):
+    det = encl_cls()
+    det.__dict__["cal"] = object()
+    with pytest.raises(TypeError, match="accessor must be type"):
+        det.cal  # noqa: B018
+
+
+@pytest.mark.parametrize("store_in", ["__dict__"])
+def test___set__(encl_cls):
+    with pytest.raises(AttributeError):
+        encl_cls().cal = 1
+
+
+def test_register_accessor(loader):
+    class Detector:
+        pass
+
+    @register_accessor(Detector, "cal", asynchronous=True)
+    class Calibration(AsyncAccessor):
+        async def ainit(self):
+            self.table = await loader.load(self.accessee)
+
+    assert isinstance(vars(Detector)["cal"], AsyncAccessorProperty)
+
+    async def main():
+        det = Detector()
+        cals = await asyncio.gather(det.cal, det.cal)
+        assert cals[0] is cals[1]
+        assert cals[0].table == {"id": id(det)}
+
+    run(main())
+    assert loader.calls == 1
+
+
+def test_register_accessor_shadow():
+    with pytest.raises(ValueError, match="incompatible"):
+        register_accessor(object, "cal", shadow=True, asynchronous=True)
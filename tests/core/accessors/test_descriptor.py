@@ -0,0 +1,158 @@
+import copy
+import pickle
+
+# THIRD PARTY
+import pytest
+
+from bound_class.core.accessors import Accessor, AccessorProperty, CachedAccessorProperty, SlottedAccessor
+
+
+class ExampleAccessor(Accessor):
+    pass
+
+
+class ExampleSlottedAccessor(SlottedAccessor):
+    __slots__ = ()
+
+
+@pytest.fixture(params=[ExampleAccessor, ExampleSlottedAccessor])
+def accessor_cls(request) -> type:
+    return request.param
+
+
+@pytest.fixture(params=["__dict__", None])
+def store_in(request) -> str | None:
+    return request.param
+
+
+@pytest.fixture
+def encl_cls(accessor_cls, store_in) -> type:
+    prop = AccessorProperty(accessor_cls, store_in=store_in)
+    prop.__set_name__(prop, "attr")
+    return type("Enclosing", (object,), {"attr": prop})
+
+
+@pytest.fixture
+def enclosing(encl_cls) -> object:
+    return encl_cls()
+
+
+#####################################################################
+
+
+def test___get__from_cls(encl_cls, accessor_cls):
+    assert encl_cls.attr is accessor_cls
+
+
+def test___get__from_inst(enclosing, accessor_cls, store_in):
+    accessor = enclosing.attr
+    assert isinstance(accessor, accessor_cls)
+    assert accessor.accessee is enclosing
+
+    if store_in is None:
+        assert "attr" not in enclosing.__dict__
+        assert enclosing.attr is not accessor
+    else:
+        assert enclosing.__dict__["attr"] is accessor
+        assert enclosing.attr is accessor  # cached
+
+
+@pytest.mark.parametrize("store_in", ["__dict__"])
+def test___get__wrong_type(enclosing):
+    enclosing.__dict__["attr"] = object()
+    with pytest.raises(TypeError, match="accessor must be type"):
+        enclosing.attr  # noqa: B018
+
+
+def test___get__after_copy(enclosing):
+    accessor = enclosing.attr
+    enclosing2 = copy.copy(enclosing)
+
+    accessor2 = enclosing2.attr
+    assert accessor2 is not accessor
+    assert accessor2.accessee is enclosing2
+    assert enclosing.attr.accessee is enclosing
+
+
+def test___set__(enclosing):
+    with pytest.raises(AttributeError):
+        enclosing.attr = 1
+
+
+def test_bind_many(encl_cls, accessor_cls, store_in):
+    enclosings = [encl_cls() for _ in range(3)]
+    cached = enclosings[0].attr
+    enclosings.append(copy.copy(enclosings[0]))  # shares ``cached``
+
+    accessors = vars(encl_cls)["attr"].bind_many(enclosings)
+    assert len(accessors) == len(enclosings)
+    for accessor, enclosing in zip(accessors, enclosings, strict=True):
+        assert isinstance(accessor, accessor_cls)
+        assert accessor.accessee is enclosing
+        if store_in is not None:
+            assert enclosing.attr is accessor
+    assert (accessors[0] is cached) is (store_in is not None)
+
+
+@pytest.mark.parametrize("store_in", ["__dict__"])
+def test_bind_many_wrong_type(encl_cls):
+    enclosing = encl_cls()
+    enclosing.__dict__["attr"] = object()
+    with pytest.raises(TypeError, match="accessor must be type"):
+        vars(encl_cls)["attr"].bind_many([enclosing])
+
+
+#####################################################################
+# CachedAccessorProperty
+
+
+class Enclosing:
+    """Enclosing class at module level, so that it can be pickled."""
+
+    attr = CachedAccessorProperty(ExampleAccessor)
+    slotted = CachedAccessorProperty(ExampleSlottedAccessor)
+    uncached = AccessorProperty(ExampleAccessor)
+
+
+def test_cached___get__from_cls():
+    assert Enclosing.attr is ExampleAccessor
+
+
+def test_cached___get__from_inst():
+    enclosing = Enclosing()
+    assert "attr" not in enclosing.__dict__
+
+    accessor = enclosing.attr
+    assert accessor.accessee is enclosing
+    assert enclosing.__dict__["attr"] is accessor
+    assert enclosing.attr is accessor
+
+
+def test_cached_not_data_descriptor():
+    assert not hasattr(CachedAccessorProperty, "__set__")
+    assert not hasattr(CachedAccessorProperty, "__delete__")
+
+
+def test_cached_delete():
+    enclosing = Enclosing()
+    accessor = enclosing.attr
+    del enclosing.attr
+
+    assert enclosing.attr is not accessor
+    assert enclosing.attr.accessee is enclosing
+
+
+@pytest.mark.parametrize("attr", ["attr", "slotted", "uncached"])
+@pytest.mark.parametrize(
+    "copier", [copy.deepcopy, lambda obj: pickle.loads(pickle.dumps(obj))], ids=["deepcopy", "pickle"]  # noqa: S301
+)
+def test_copy_enclosing(attr, copier):
+    """Deep copies and pickles of the enclosing rebind the cached accessor."""
+    enclosing = Enclosing()
+    accessor = getattr(enclosing, attr)
+
+    enclosing2 = copier(enclosing)
+    accessor2 = enclosing2.__dict__[attr]
+    assert accessor2 is not accessor
+    assert accessor2.accessee is enclosing2
+    assert getattr(enclosing2, attr) is accessor2
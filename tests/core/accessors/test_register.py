@@ -0,0 +1,163 @@
+import importlib.metadata
+import sys
+from dataclasses import dataclass
+from importlib.metadata import EntryPoint
+from math import sqrt
+
+# THIRD PARTY
+import pytest
+
+from bound_class.core import register_accessor
+from bound_class.core.accessors import (
+    Accessor,
+    AccessorProperty,
+    CachedAccessorProperty,
+    register_accessor_entry_points,
+)
+from bound_class.core.accessors.register import AccessorRegistrationWarning
+from bound_class.core.base import StrongRef
+from bound_class.core.descriptors import LazyDescriptor
+
+
+@dataclass
+class Vector:
+    x: float
+    y: float
+
+
+class Radial(Accessor[Vector]):
+    @property
+    def r(self):
+        return sqrt(self.accessee.x**2 + self.accessee.y**2)
+
+
+@pytest.mark.parametrize(("shadow", "descr_cls"), [(False, AccessorProperty), (True, CachedAccessorProperty)])
+def test_register_cls(shadow, descr_cls):
+    cls = type("Vector2", (Vector,), {})
+
+    # not yet registered
+    assert not hasattr(cls, "radial")
+
+    assert register_accessor(cls, "radial", shadow=shadow)(Radial) is Radial
+    assert isinstance(vars(cls)["radial"], descr_cls)
+    assert cls.radial is Radial
+
+    # test that it works
+    v = cls(3.0, 4.0)
+    assert v.radial.r == 5.0
+    assert vars(v)["radial"] is v.radial
+
+
+def test_register_ref_mode():
+    class Record:
+        __slots__ = ("__dict__", "x", "y")  # not weak-referenceable
+
+        def __init__(self, x, y):
+            self.x, self.y = x, y
+
+    class StrongRadial(Radial):
+        pass
+
+    register_accessor(Record, "radial", ref_mode="strong")(StrongRadial)
+    register_accessor(Record, "shadowed", shadow=True, ref_mode="strong")(StrongRadial)
+    rec = Record(3.0, 4.0)
+    assert rec.radial.r == 5.0
+    assert rec.radial.accessee is rec
+    assert isinstance(rec.radial, StrongRadial)
+    assert type(rec.radial.__selfref__) is StrongRef
+    assert rec.shadowed.accessee is rec
+
+    # the accessor class is not changed, so other registrations are weak
+    assert StrongRadial.__selfref_type__ is not StrongRef
+    cls = type("Vector2", (Vector,), {})
+    register_accessor(cls, "radial")(StrongRadial)
+    assert type(cls(3.0, 4.0).radial.__selfref__) is not StrongRef
+
+    with pytest.raises(ValueError, match="ref_mode must be one of"):
+        register_accessor(Record, "other", ref_mode="soft")(StrongRadial)
+
+
+def test_register_ref_mode_side_table():
+    with pytest.raises(ValueError, match="side_table"):
+        register_accessor(Vector, "other", store_in="side_table", ref_mode="strong")
+
+    class StrongRadial(Radial, ref_mode="strong"):
+        pass
+
+    with pytest.raises(ValueError, match="side_table"):
+        register_accessor(Vector, "other", store_in="side_table")(StrongRadial)
+    assert not hasattr(Vector, "other")
+
+
+def test_register_overriding():
+    cls = type("Vector2", (Vector,), {"radial": None})
+
+    with pytest.warns(AccessorRegistrationWarning):
+        register_accessor(cls, "radial")(Radial)
+
+
+def test_register_shadow_store_in():
+    with pytest.raises(ValueError, match="shadow=True requires"):
+        register_accessor(Vector, "radial", store_in=None, shadow=True)
+
+
+# -------------------------------------------
+# Lazy registration
+
+
+@pytest.fixture
+def lazy_module(tmp_path, monkeypatch):
+    """A module, not yet imported, with an accessor class."""
+    name = "lazy_accessor_module"
+    (tmp_path / f"{name}.py").write_text(
+        "from bound_class.core.accessors import Accessor\n\n"
+        "class Lazy(Accessor):\n"
+        "    @property\n"
+        "    def double(self):\n"
+        "        return 2 * self.accessee.x\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, name, raising=False)
+    yield name
+    sys.modules.pop(name, None)
+
+
+@pytest.mark.parametrize(("shadow", "descr_cls"), [(False, AccessorProperty), (True, CachedAccessorProperty)])
+def test_register_lazy(lazy_module, shadow, descr_cls):
+    cls = type("Vector2", (Vector,), {})
+
+    path = f"{lazy_module}:Lazy"
+    assert register_accessor(cls, "lazy", shadow=shadow)(path) == path
+    assert isinstance(vars(cls)["lazy"], LazyDescriptor)
+    assert lazy_module not in sys.modules  # not imported yet
+
+    v = cls(3.0, 4.0)
+    assert v.lazy.double == 6.0
+    assert lazy_module in sys.modules
+
+    # the placeholder is replaced
+    assert isinstance(vars(cls)["lazy"], descr_cls)
+    assert cls.lazy is sys.modules[lazy_module].Lazy
+
+
+def test_register_lazy_from_cls(lazy_module):
+    cls = type("Vector2", (Vector,), {})
+    register_accessor(cls, "lazy")(f"{lazy_module}:Lazy")
+    assert cls.lazy is sys.modules[lazy_module].Lazy
+
+
+@pytest.mark.parametrize("path", ["module", "module:", ":Cls"])
+def test_register_lazy_bad_path(path):
+    with pytest.raises(ValueError, match="import path must be"):
+        register_accessor(type("Vector2", (Vector,), {}), "lazy")(path)
+
+
+def test_register_accessor_entry_points(lazy_module, monkeypatch):
+    cls = type("Vector2", (Vector,), {})
+    eps = [EntryPoint(name="lazy", value=f"{lazy_module}:Lazy", group="test.accessors")]
+    monkeypatch.setattr(importlib.metadata, "entry_points", lambda group: [ep for ep in eps if ep.group == group])
+
+    assert register_accessor_entry_points(cls, "test.accessors") == ["lazy"]
+    assert lazy_module not in sys.modules
+
+    assert cls(3.0, 4.0).lazy.double == 6.0
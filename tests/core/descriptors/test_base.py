@@ -1,3 +1,4 @@
+import copy
 from abc import ABCMeta, abstractmethod
 from dataclasses import replace
 
@@ -55,6 +56,77 @@ class BoundDescriptorBase_Test(metaclass=ABCMeta):
         assert encl_attr in enclosing.__dict__
         assert enclosing.__dict__[encl_attr] is descr_on_inst
 
+    def test___get__no_rebind(self, descr_on_inst, enclosing, encl_attr):
+        """Repeated access does not rebuild the reference."""
+        selfref = descr_on_inst.__selfref__
+        assert getattr(enclosing, encl_attr) is descr_on_inst
+        assert descr_on_inst.__selfref__ is selfref
+
+    def test___get__after_copy(self, descr_on_inst, enclosing, encl_attr):
+        """A shallow copy of the enclosing gets its own bound descriptor."""
+        enclosing2 = copy.copy(enclosing)
+        assert enclosing2.__dict__[encl_attr] is descr_on_inst  # shared
+
+        descr2 = getattr(enclosing2, encl_attr)
+        assert descr2 is not descr_on_inst
+        assert descr2.enclosing is enclosing2
+        assert enclosing2.__dict__[encl_attr] is descr2
+
+        # The original is unaffected
+        assert getattr(enclosing, encl_attr) is descr_on_inst
+        assert descr_on_inst.enclosing is enclosing
+
+    def test___get__after_referent_deleted(self, encl_cls, encl_attr):
+        """A descriptor whose referent died is rebound in place."""
+        # need to make here for proper garbage collection
+        enclosing = encl_cls()
+        descr = getattr(enclosing, encl_attr)
+        enclosing2 = copy.copy(enclosing)
+        del enclosing
+        assert descr.__selfref__ is None
+
+        assert getattr(enclosing2, encl_attr) is descr
+        assert descr.enclosing is enclosing2
+
+    def test_deepcopy_enclosing(self, descr_on_inst, enclosing, encl_attr):
+        """A deep copy of the enclosing is rebound once, when copied."""
+        enclosing2 = copy.deepcopy(enclosing)
+        descr2 = enclosing2.__dict__[encl_attr]
+        assert descr2 is not descr_on_inst
+        assert descr2.__self__ is enclosing2
+
+        # No rebinding on access
+        selfref = descr2.__selfref__
+        assert getattr(enclosing2, encl_attr) is descr2
+        assert descr2.__selfref__ is selfref
+
+        # The original is unaffected
+        assert descr_on_inst.enclosing is enclosing
+
+    # -------------------------------------------
+    # Test bind_many
+
+    def test_bind_many(self, descr_on_cls, encl_cls, encl_attr):
+        """Binding many is the same as getting the attribute on each."""
+        enclosings = [encl_cls() for _ in range(3)]
+        cached = getattr(enclosings[0], encl_attr)
+        enclosings.append(copy.copy(enclosings[0]))  # shares ``cached``
+
+        dscs = descr_on_cls.bind_many(enclosings)
+        assert len(dscs) == len(enclosings)
+        assert dscs[0] is cached
+        assert dscs[-1] is not cached
+        for dsc, enclosing in zip(dscs, enclosings, strict=True):
+            assert type(dsc) is type(descr_on_cls)
+            assert dsc.enclosing is enclosing
+            assert dsc._enclosing_attr == encl_attr
+            assert getattr(enclosing, encl_attr) is dsc
+
+    def test_bind_many_wrong_type(self, descr_on_cls, enclosing, encl_attr):
+        enclosing.__dict__[encl_attr] = object()
+        with pytest.raises(TypeError, match="descriptor must be type"):
+            descr_on_cls.bind_many([enclosing])
+
     # -------------------------------------------
 
     def test_enclosing(self, descr_on_inst, enclosing):
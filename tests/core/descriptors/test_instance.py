@@ -1,7 +1,7 @@
 # THIRD PARTY
 import pytest
 
-from bound_class.core.descriptors import InstanceDescriptor
+from bound_class.core.descriptors import InstanceDescriptor, SlottedInstanceDescriptor, light_dataclass
 
 from .test_base import BoundDescriptorBase_Test
 
@@ -35,3 +35,43 @@ class Test_InstanceDescriptor(BoundDescriptorBase_Test):
         # And vice versa
         vars(encl_cls)[encl_attr].from_cls = 2
         assert not hasattr(getattr(enclosing, encl_attr), "from_cls")
+
+
+class Test_SlottedInstanceDescriptor(Test_InstanceDescriptor):
+    @pytest.fixture
+    def descr_cls(self) -> type:
+        return SlottedInstanceDescriptor
+
+    # ===============================================================
+
+    def test_encl_attr_on_cls(self, descr_on_cls):
+        # On the class ``_enclosing_attr`` is the slot, so test the instance.
+        assert not hasattr(type(descr_on_cls)(), "_enclosing_attr")
+
+    def test_no_dict(self, descr_on_cls, descr_on_inst):
+        assert not hasattr(descr_on_cls, "__dict__")
+        assert not hasattr(descr_on_inst, "__dict__")
+
+    # ===============================================================
+    # Usage Tests
+
+    def test_inst_decoupled_from_cls(self, descr_on_inst):
+        # Slotted descriptors cannot gain attributes.
+        with pytest.raises(AttributeError):
+            descr_on_inst.from_inst = 2
+
+
+@light_dataclass
+class LightInstanceDescriptor(InstanceDescriptor):
+    scale: float = 2.0
+
+
+class Test_LightInstanceDescriptor(Test_InstanceDescriptor):
+    @pytest.fixture
+    def descr_cls(self) -> type:
+        return LightInstanceDescriptor
+
+    # ===============================================================
+
+    def test_fields_copied(self, descr_on_inst):
+        assert descr_on_inst.scale == 2.0
@@ -1,3 +1,4 @@
+import sys
 import warnings
 from dataclasses import dataclass
 from math import sqrt
@@ -6,7 +7,8 @@ from math import sqrt
 import pytest
 
 from bound_class.core import register_descriptor
-from bound_class.core.descriptors import BoundDescriptor
+from bound_class.core.base import StrongRef
+from bound_class.core.descriptors import BoundDescriptor, LazyDescriptor
 from bound_class.core.descriptors.register import DescriptorRegistrationWarning
 
 # TODO: add registration tests to ``test_base.py`` so that it applies to both
@@ -41,3 +43,78 @@ def test_register_cls():
     v = Vector(3.0, 4.0)
     r = v.radial
     assert r.r == 5.0
+
+
+def test_register_ref_mode():
+    class Record:
+        __slots__ = ("__dict__", "x", "y")  # not weak-referenceable
+
+        def __init__(self, x, y):
+            self.x, self.y = x, y
+
+    @register_descriptor(Record, "radial", ref_mode="strong")
+    class Radial(BoundDescriptor):
+        @property
+        def r(self):
+            return sqrt(self.enclosing.x**2 + self.enclosing.y**2)
+
+    rec = Record(3.0, 4.0)
+    assert rec.radial.r == 5.0
+    assert rec.radial.enclosing is rec
+    assert isinstance(rec.radial, Radial)
+    assert type(rec.radial.__selfref__) is StrongRef
+
+    # the descriptor class is not changed, so other registrations are weak
+    assert Radial.__selfref_type__ is not StrongRef
+
+    @dataclass
+    class Vector:
+        x: float
+        y: float
+
+    register_descriptor(Vector, "radial")(Radial)
+    assert type(Vector(3.0, 4.0).radial.__selfref__) is not StrongRef
+
+
+def test_register_ref_mode_side_table():
+    class Vector:
+        pass
+
+    with pytest.raises(ValueError, match="side_table"):
+        register_descriptor(Vector, "other", store_in="side_table", ref_mode="strong")
+
+    class StrongRadial(BoundDescriptor, ref_mode="strong"):
+        pass
+
+    with pytest.raises(ValueError, match="side_table"):
+        register_descriptor(Vector, "other", store_in="side_table")(StrongRadial)
+    assert not hasattr(Vector, "other")
+
+
+def test_register_lazy(tmp_path, monkeypatch):
+    name = "lazy_descriptor_module"
+    (tmp_path / f"{name}.py").write_text(
+        "from bound_class.core.descriptors import BoundDescriptor\n\n"
+        "class Radial(BoundDescriptor):\n"
+        "    @property\n"
+        "    def r(self):\n"
+        "        return (self.enclosing.x**2 + self.enclosing.y**2) ** 0.5\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, name, raising=False)
+
+    @dataclass
+    class Vector:
+        x: float
+        y: float
+
+    register_descriptor(Vector, "radial")(f"{name}:Radial")
+    assert isinstance(vars(Vector)["radial"], LazyDescriptor)
+    assert name not in sys.modules  # not imported yet
+
+    assert Vector(3.0, 4.0).radial.r == 5.0
+
+    # the placeholder is replaced
+    Radial = sys.modules.pop(name).Radial
+    assert isinstance(vars(Vector)["radial"], Radial)
+    assert isinstance(Vector.radial, Radial)
@@ -1,16 +1,24 @@
+import copy
+import gc
+import pickle
+import tracemalloc
+import weakref
 from weakref import ReferenceType
 
 # THIRD PARTY
 import pytest
 
-from bound_class.core.base import BoundClass, BoundClassRef
+from bound_class.core import base
+from bound_class.core.accessors import AccessorProperty, SlottedAccessor
+from bound_class.core.base import BoundClass, BoundClassRef, SlottedBoundClass, StrongRef, set_ref_mode, with_ref_mode
+from bound_class.core.descriptors import InstanceDescriptor
 
 #####################################################################
 
 
-@pytest.fixture
-def bound_cls() -> type:
-    return BoundClass
+@pytest.fixture(params=[BoundClass, SlottedBoundClass])
+def bound_cls(request) -> type:
+    return request.param
 
 
 @pytest.fixture
@@ -118,3 +126,297 @@ def test_bound_not_alive_from_reference(bound_cls, boundto):
         bound  # noqa: B018, F821
 
     assert boundref._bound_ref() is None
+
+
+def test_referent_callback(unbound, boundto_cls):
+    """A user callback is called after the bound object is cleaned up."""
+    called = []
+
+    def callback(ref):
+        called.append((ref, unbound.__selfref__))
+
+    # need to make here for proper garbage collection
+    boundto = boundto_cls()
+    ref = BoundClassRef(boundto, callback, bound=unbound)
+    object.__setattr__(unbound, "__selfref__", ref)
+
+    del boundto
+
+    assert called == [(ref, None)]
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_fast_shutdown(monkeypatch, unbound, boundto_cls, fast):
+    """At exit, with fast shutdown, the callbacks do not unbind."""
+    monkeypatch.setattr(base, "_skip_unbind", False)
+    monkeypatch.setattr(base, "_fast_shutdown", True)
+    base.set_fast_shutdown(fast)
+    base._at_exit()
+    assert base._skip_unbind is fast
+
+    called = []
+    boundto = boundto_cls()
+    ref = BoundClassRef(boundto, called.append, bound=unbound)
+    object.__setattr__(unbound, "__selfref__", ref)
+    del boundto
+
+    assert called == [ref]  # user callbacks are still called
+    assert (unbound.__selfref__ is ref) is fast
+    with pytest.raises(ReferenceError):
+        unbound.__self__  # noqa: B018
+
+
+@pytest.fixture
+def deferred():
+    base.set_deferred_cleanup()
+    yield
+    base.set_deferred_cleanup(False)
+    assert not base._pending
+
+
+@pytest.mark.usefixtures("deferred")
+def test_deferred_cleanup(bound_cls, boundto_cls):
+    """The cleanup is queued, then done by `drain`, or on access of ``__self__``."""
+    boundtos = [boundto_cls() for _ in range(3)]
+    bounds = [bound_cls() for _ in boundtos]
+    for bound, boundto in zip(bounds, boundtos, strict=True):
+        bound._set__self__(boundto)
+    refs = [bound.__selfref__ for bound in bounds]
+    del bound, boundto, boundtos
+
+    assert [b.__selfref__ for b in bounds] == refs  # not yet unbound
+    assert {id(r) for r in base._pending} == {id(r) for r in refs}
+
+    assert base.drain(max_items=1) == 1
+    assert len(base._pending) == 2
+
+    bound = next(b for b in bounds if b.__selfref__ is not None)
+    with pytest.raises(ReferenceError, match="no longer exists"):
+        bound.__self__  # noqa: B018
+    assert bound.__selfref__ is None  # unbound on access
+    assert not base._pending  # which also drains `DRAIN_BATCH` references
+    assert all(b.__selfref__ is None for b in bounds)
+    assert base.drain() == 0
+
+
+@pytest.mark.usefixtures("deferred")
+def test_deferred_cleanup_bounded(bound_cls, boundto_cls):
+    """While bound objects are made, the queue does not grow without bound."""
+    bounds = []
+    for _ in range(100):
+        boundtos = [boundto_cls() for _ in range(10)]
+        for boundto in boundtos:
+            bound = bound_cls()
+            bound._set__self__(boundto)
+            bounds.append(bound)
+        del boundto, boundtos
+        assert len(base._pending) == 10  # the previous ones were drained
+    assert all(b.__selfref__ is None for b in bounds[:-10])
+
+
+@pytest.mark.usefixtures("deferred")
+def test_deferred_cleanup_rebound(unbound, boundto_cls, boundto):
+    """A rebound object is not unbound when the old reference is drained."""
+    boundto1 = boundto_cls()
+    unbound._set__self__(boundto1)
+    unbound._set__self__(boundto)
+    del boundto1
+    base.drain()
+    assert unbound.__self__ is boundto
+
+
+def test_deferred_cleanup_off(unbound, boundto_cls):
+    """Turning deferred cleanup off drains the queue."""
+    base.set_deferred_cleanup()
+    boundto = boundto_cls()
+    unbound._set__self__(boundto)
+    del boundto
+    assert base._pending
+    base.set_deferred_cleanup(False)
+    assert not base._pending
+    assert unbound.__selfref__ is None
+
+
+def test_stale_reference_does_not_unbind(unbound, boundto_cls, boundto):
+    """Only the current reference cleans up the bound object."""
+    # need to make here for proper garbage collection
+    boundto1 = boundto_cls()
+    unbound._set__self__(boundto1)
+    oldref = unbound.__selfref__  # stays alive
+
+    unbound._set__self__(boundto)  # rebind
+    del boundto1
+
+    assert oldref() is None
+    assert unbound.__self__ is boundto
+
+
+def test_rebind_does_not_leak(unbound, boundto):
+    """Repeatedly rebinding uses constant memory."""
+    unbound._set__self__(boundto)  # warm up
+
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        for _ in range(10_000):
+            unbound._set__self__(boundto)
+        end, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # One finalizer per binding would be > 1 MB.
+    assert end - start < 10_000
+
+
+def test_slotted_no_dict():
+    assert not hasattr(SlottedBoundClass(), "__dict__")
+
+
+def test_copy(bound):
+    """A copy is bound to the same object."""
+    bound2 = copy.copy(bound)
+    assert bound2 is not bound
+    assert bound2.__self__ is bound.__self__
+    assert bound2.__selfref__ is not bound.__selfref__
+
+
+def test_deepcopy(bound, boundto):
+    """A deep copy is bound to the copy of the bound object."""
+    boundto2, bound2 = copy.deepcopy([boundto, bound])
+    assert boundto2 is not boundto
+    assert bound2.__self__ is boundto2
+
+
+def test_deepcopy_alone(bound, boundto):
+    """A deep copy of only the bound class is bound to the same object."""
+    bound2 = copy.deepcopy(bound)
+    assert bound2 is not bound
+    assert bound2.__self__ is boundto
+
+
+def test_copy_unbound(unbound):
+    assert not hasattr(copy.copy(unbound), "__selfref__")
+
+    unbound._del__self__()
+    assert copy.copy(unbound).__selfref__ is None
+    assert copy.deepcopy(unbound).__selfref__ is None
+
+
+#####################################################################
+# Strong references
+
+
+class StrongBound(SlottedBoundClass):
+    __slots__ = ()
+    __selfref_type__ = StrongRef
+
+
+class Record:
+    """Not weak-referenceable."""
+
+    __slots__ = ("_attrs_", "value")
+
+    def __init__(self, value=0):
+        self._attrs_ = {}
+        self.value = value
+
+
+def test_strong_not_weakrefable():
+    rec = Record()
+    with pytest.raises(TypeError):
+        SlottedBoundClass()._set__self__(rec)
+
+    bound = StrongBound()
+    bound._set__self__(rec)
+    assert isinstance(bound.__selfref__, StrongRef)
+    assert bound.__self__ is rec
+
+    bound._del__self__()
+    with pytest.raises(ReferenceError):
+        bound.__self__  # noqa: B018
+
+
+def test_strong_cycle_collected():
+    """A bound object cached on its referent forms a cycle, which gc frees."""
+
+    class Enclosing:
+        pass
+
+    enclosing, bound = Enclosing(), StrongBound()
+    bound._set__self__(enclosing)
+    enclosing.bound = bound
+    ref = weakref.ref(enclosing)
+    del enclosing, bound
+    assert ref() is not None  # kept alive by the cycle
+    gc.collect()
+    assert ref() is None
+
+
+def test_strong_copy():
+    rec = Record(1)
+    bound = StrongBound()
+    bound._set__self__(rec)
+    assert copy.copy(bound).__self__ is rec
+
+    rec2, bound2 = copy.deepcopy([rec, bound])
+    assert bound2.__self__ is rec2
+    rec3, bound3 = pickle.loads(pickle.dumps([rec, bound]))  # noqa: S301
+    assert bound3.__self__ is rec3
+    assert rec3.value == 1
+
+
+def test_strong_accessor_and_descriptor():
+    class RecordAccessor(SlottedAccessor):
+        __slots__ = ()
+        __selfref_type__ = StrongRef
+
+    class RecordDescriptor(InstanceDescriptor):
+        __selfref_type__ = StrongRef
+
+    class Slotted(Record):
+        __slots__ = ()
+        acc = AccessorProperty(RecordAccessor, store_in="_attrs_")
+        dsc = RecordDescriptor(store_in="_attrs_")
+
+    rec = Slotted()
+    assert rec.acc is rec.acc
+    assert rec.acc.accessee is rec
+    assert rec.dsc is rec.dsc
+    assert rec.dsc.enclosing is rec
+    assert set(rec._attrs_) == {"acc", "dsc"}
+
+
+def test_ref_mode():
+    class Weak(StrongBound, ref_mode="weak"):
+        __slots__ = ()
+
+    class Strong(BoundClass, ref_mode="strong"):
+        pass
+
+    assert Weak.__selfref_type__ is BoundClassRef
+    assert Strong.__selfref_type__ is StrongRef
+    assert type("Sub", (Strong,), {}).__selfref_type__ is StrongRef  # inherited
+    assert BoundClass.__selfref_type__ is BoundClassRef
+
+    with pytest.raises(ValueError, match="ref_mode must be one of"):
+        type("Bad", (BoundClass,), {}, ref_mode="soft")
+    with pytest.raises(TypeError, match="subclass of SlottedBoundClass"):
+        set_ref_mode(Record, "strong")
+
+
+def test_with_ref_mode():
+    Strong = with_ref_mode(SlottedBoundClass, "strong")
+    assert with_ref_mode(SlottedBoundClass, "strong") is Strong
+    assert with_ref_mode(StrongBound, "strong") is StrongBound
+    assert Strong.__qualname__ == "SlottedBoundClass"
+    assert SlottedBoundClass.__selfref_type__ is BoundClassRef  # not changed
+
+    rec, bound = Record(), Strong()
+    bound._set__self__(rec)
+    rec2, bound2 = pickle.loads(pickle.dumps([rec, bound]))  # noqa: S301
+    assert type(bound2) is Strong
+    assert bound2.__self__ is rec2
+    assert type(copy.deepcopy(bound)) is Strong
+
+    with pytest.raises(ValueError, match="ref_mode must be one of"):
+        with_ref_mode(BoundClass, "soft")
@@ -0,0 +1,132 @@
+import gc
+import weakref
+from dataclasses import dataclass
+
+# THIRD PARTY
+import pytest
+
+from bound_class.core import Batch, batch, batch_type, register_accessor, register_descriptor
+from bound_class.core import batched as batched_module
+from bound_class.core.accessors import Accessor
+from bound_class.core.descriptors import InstanceDescriptor
+
+#####################################################################
+
+
+@dataclass
+class Point:
+    x: float
+    y: float
+
+
+class NormAccessor(Accessor):
+    @property
+    def norm1(self):
+        return abs(self.accessee.x) + abs(self.accessee.y)
+
+
+class BatchedNormAccessor(Accessor):
+    calls = 0
+
+    @property
+    def norm1(self):
+        type(self).calls += 1
+        return abs(self.accessee.x) + abs(self.accessee.y)
+
+
+register_accessor(Point, "norm")(NormAccessor)
+register_accessor(Point, "bnorm", batched=BatchedNormAccessor)(NormAccessor)
+
+
+class SumDescriptor(InstanceDescriptor):
+    @property
+    def total(self):
+        return self.enclosing.x + self.enclosing.y
+
+
+register_descriptor(Point, "sum", batched=SumDescriptor)(SumDescriptor)
+
+
+@pytest.fixture
+def points():
+    return [Point(1.0, -2.0), Point(3.0, 4.0)]
+
+
+#####################################################################
+
+
+def test_batch_type():
+    batch_cls = batch_type(Point)
+    assert issubclass(batch_cls, Batch)
+    assert batch_cls.enclosing_cls is Point
+    assert batch_type(Point) is batch_cls
+
+
+def test_batch_type_weak():
+    """The batch type does not keep a dynamically made enclosing class alive."""
+    cls = type("Dynamic", (), {})
+    batch_cls = batch_type(cls)
+    assert batch_cls.enclosing_cls is cls
+    ref = weakref.ref(cls)
+    del cls, batch_cls
+    gc.collect()
+    assert ref() is None
+
+
+def test_batch(points):
+    pts = batch(points)
+    assert isinstance(pts, batch_type(Point))
+    assert len(pts) == 2
+    assert list(pts) == points
+    assert list(pts.x) == [1.0, 3.0]
+    assert pts.x is pts.x  # gathered once
+
+
+def test_batch_errors(points):
+    with pytest.raises(ValueError, match="cannot batch"):
+        batch([])
+    with pytest.raises(TypeError, match="cannot contain"):
+        batch([*points, object()])
+    with pytest.raises(AttributeError):
+        batch(points).z  # noqa: B018
+
+
+def test_batch_without_numpy(points, monkeypatch):
+    monkeypatch.setattr(batched_module, "HAS_NUMPY", False)
+    assert batch(points).x == [1.0, 3.0]
+
+
+def test_unbatched_accessor(points):
+    """Without a batched implementation the accessor is used on each object."""
+    norms = batch(points).norm
+    assert isinstance(norms, batch_type(NormAccessor))
+    assert list(norms.norm1) == [3.0, 7.0]
+
+
+def test_batched_accessor(points):
+    pytest.importorskip("numpy")
+
+    pts = batch(points)
+    norm = pts.bnorm
+    assert isinstance(norm, BatchedNormAccessor)
+    assert norm.accessee is pts
+    assert pts.bnorm is norm  # cached on the batch
+
+    calls = BatchedNormAccessor.calls
+    assert list(norm.norm1) == [3.0, 7.0]
+    assert BatchedNormAccessor.calls == calls + 1  # once for the batch
+
+    # The objects still use the per-object accessor
+    assert isinstance(points[0].bnorm, NormAccessor)
+
+
+def test_batched_descriptor_from_fields():
+    np = pytest.importorskip("numpy")
+
+    pts = batch_type(Point).from_fields(x=np.array([1.0, 3.0]), y=np.array([-2.0, 4.0]))
+    assert len(pts) == 2
+    assert isinstance(pts.sum, SumDescriptor)
+    np.testing.assert_array_equal(pts.sum.total, [-1.0, 7.0])
+
+    with pytest.raises(TypeError, match="cannot be iterated"):
+        iter(pts)
@@ -0,0 +1,157 @@
+import gc
+from dataclasses import dataclass
+
+# THIRD PARTY
+import pytest
+
+from bound_class.core import budget_usage, disable_budget, enable_budget, hooks, reset_budget
+from bound_class.core.accessors import Accessor, AccessorProperty, CachedAccessorProperty
+from bound_class.core.budget import _sizeof
+from bound_class.core.descriptors import BoundDescriptor, InstanceDescriptor
+from bound_class.core.storage import SIDE_TABLE, side_table
+
+#####################################################################
+
+
+class Example:
+    attr = BoundDescriptor()
+    instance = InstanceDescriptor()
+    uncached = BoundDescriptor(store_in=None)
+    acc = AccessorProperty(Accessor)
+
+
+@dataclass(slots=True, weakref_slot=True)
+class Slotted:
+    attr = BoundDescriptor(store_in=SIDE_TABLE)
+    acc = AccessorProperty(Accessor, store_in=SIDE_TABLE)
+
+
+@pytest.fixture(autouse=True)
+def _budget():
+    reset_budget()
+    yield
+    disable_budget()
+    reset_budget()
+
+
+#####################################################################
+
+
+def test_lru():
+    enable_budget(max_count=2)
+    a, b, c = Example(), Example(), Example()
+    a_attr = a.attr
+    b.attr  # noqa: B018
+    a.attr  # noqa: B018, used, so ``b`` is evicted next
+    c.attr  # noqa: B018
+    assert ("attr" in vars(a), "attr" in vars(b), "attr" in vars(c)) == (True, False, True)
+    assert a.attr is a_attr
+    assert budget_usage().count == 2
+    assert budget_usage().evictions == {BoundDescriptor: 1}
+
+    # and rebuilt on access
+    assert b.attr.enclosing is b
+    assert budget_usage().evictions == {BoundDescriptor: 2}
+
+
+def test_kinds():
+    enable_budget(max_count=1)
+    ex, rec = Example(), Slotted()
+    ex.instance  # noqa: B018
+    ex.acc  # noqa: B018
+    rec.attr  # noqa: B018
+    rec.acc  # noqa: B018
+    assert vars(ex) == {}
+    assert list(side_table(rec)) == ["acc"]
+    assert budget_usage().evictions == {InstanceDescriptor: 1, Accessor: 1, BoundDescriptor: 1}
+
+
+def test_referenced_stay_bound():
+    enable_budget(max_count=1)
+    ex = Example()
+    attr = ex.attr
+    Example().attr  # noqa: B018
+    assert "attr" not in vars(ex)
+    assert attr.enclosing is ex
+
+
+def test_uncached_and_deleted():
+    enable_budget(max_count=1)
+    ex = Example()
+    ex.uncached  # noqa: B018
+    assert budget_usage().count == 0
+
+    ex.attr  # noqa: B018
+    assert budget_usage().count == 1
+    del ex
+    gc.collect()
+    assert budget_usage().count == 0
+    assert budget_usage().nbytes == 0
+
+
+def test_shadowed():
+    class Shadowed:
+        acc = CachedAccessorProperty(Accessor)
+
+    enable_budget(max_count=1)
+    a, b = Shadowed(), Shadowed()
+    a.acc  # noqa: B018
+    b.acc  # noqa: B018
+    assert "acc" not in vars(a)
+    assert isinstance(a.acc, Accessor)
+
+
+def test_max_bytes():
+    exs = [Example() for _ in range(4)]
+    size = _sizeof(exs[0].attr)
+    enable_budget(max_bytes=2 * size)
+    for ex in exs:
+        ex.attr  # noqa: B018
+    assert [("attr" in vars(ex)) for ex in exs] == [False, False, True, True]
+    assert budget_usage().count == 2
+    assert 0 < budget_usage().nbytes <= 2 * size
+
+
+def test_enable_evicts_tracked():
+    enable_budget(max_count=3)
+    exs = [Example() for _ in range(3)]
+    for ex in exs:
+        ex.attr  # noqa: B018
+    enable_budget(max_count=1)
+    assert [("attr" in vars(ex)) for ex in exs] == [False, False, True]
+
+
+def test_disable():
+    enable_budget(max_count=1)
+    a, b = Example(), Example()
+    a.attr  # noqa: B018
+    disable_budget()
+    b.attr  # noqa: B018
+    assert "attr" in vars(a)
+    assert not hooks._listeners
+    assert budget_usage().count == 0
+    assert "off" in str(budget_usage())
+
+
+def test_evict_event():
+    events = []
+
+    def listener(event, cls, _, enclosing):
+        if event == "evict":
+            events.append((cls, enclosing))
+
+    hooks._add_listener(listener)
+    try:
+        enable_budget(max_count=1)
+        a, b = Example(), Example()
+        a.attr  # noqa: B018
+        b.attr  # noqa: B018
+    finally:
+        hooks._remove_listener(listener)
+    assert events == [(BoundDescriptor, a)]
+    assert "evicted 1 bound_class.core.descriptors.bound.BoundDescriptor" in str(budget_usage())
+
+
+def test_errors():
+    with pytest.raises(ValueError, match="one of max_count and max_bytes"):
+        enable_budget()
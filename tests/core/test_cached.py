@@ -0,0 +1,152 @@
+import copy
+import gc
+import pickle
+from dataclasses import dataclass
+
+# THIRD PARTY
+import pytest
+
+from bound_class.core import bound_cached_property, invalidate
+from bound_class.core.accessors import Accessor, AccessorProperty
+from bound_class.core.descriptors import InstanceDescriptor, SlottedInstanceDescriptor
+
+#####################################################################
+
+
+class Spherical(InstanceDescriptor):
+    calls = 0
+
+    @bound_cached_property
+    def r(self):
+        """The radius."""
+        type(self).calls += 1
+        return (self.enclosing.x**2 + self.enclosing.y**2) ** 0.5
+
+    @bound_cached_property
+    def r2(self):
+        return self.r**2
+
+
+class Geo(Accessor):
+    @bound_cached_property
+    def norm(self):
+        return (self.accessee.x**2 + self.accessee.y**2) ** 0.5
+
+
+@dataclass
+class Point:
+    x: float
+    y: float
+    spherical = Spherical()
+    geo = AccessorProperty(Geo)
+
+
+@pytest.fixture(autouse=True)
+def _reset_calls():
+    Spherical.calls = 0
+
+
+#####################################################################
+
+
+def test_from_cls():
+    prop = Spherical.r
+    assert isinstance(prop, bound_cached_property)
+    assert prop.__doc__ == "The radius."
+    assert Spherical._bound_cached_names == ("r", "r2")
+
+
+def test_cached():
+    p = Point(3.0, 4.0)
+    assert p.spherical.r == 5.0
+    assert p.spherical.r == 5.0
+    assert p.spherical.r2 == pytest.approx(25.0)
+    assert Spherical.calls == 1
+    assert vars(p.spherical)["r"] == 5.0
+
+    assert p.geo.norm == 5.0
+    assert vars(p.geo)["norm"] == 5.0
+
+
+def test_invalidate():
+    p = Point(3.0, 4.0)
+    p.spherical.r2  # noqa: B018
+    p.x, p.y = 6.0, 8.0
+
+    invalidate(p.spherical, "r2")
+    assert p.spherical.r2 == pytest.approx(25.0)  # ``r`` is still cached
+    invalidate(p.spherical)  # all
+    assert p.spherical.r2 == pytest.approx(100.0)
+    assert Spherical.calls == 2
+
+    with pytest.raises(AttributeError, match="no bound_cached_property 'x'"):
+        invalidate(p.spherical, "x")
+
+
+def test_del():
+    p = Point(3.0, 4.0)
+    p.spherical.r  # noqa: B018
+    del p.spherical.r
+    p.spherical.r  # noqa: B018
+    assert Spherical.calls == 2
+
+
+def test_rebind():
+    """The cached values are cleared when the instance is (re/un)bound."""
+    p = Point(3.0, 4.0)
+    spherical = p.spherical
+    spherical.r  # noqa: B018
+
+    q = Point(6.0, 8.0)
+    spherical._set__self__(q)
+    assert "r" not in vars(spherical)
+    assert spherical.r == 10.0
+
+    spherical._del__self__()
+    assert "r" not in vars(spherical)
+
+
+def test_unbind_on_delete():
+    p = Point(3.0, 4.0)
+    spherical = p.spherical
+    spherical.r  # noqa: B018
+    del p
+    gc.collect()
+    assert "r" not in vars(spherical)  # the value is freed with the enclosing object
+
+
+@pytest.mark.parametrize(
+    "copier", [copy.copy, copy.deepcopy, lambda obj: pickle.loads(pickle.dumps(obj))]  # noqa: S301
+)
+def test_copy(copier):
+    p = Point(3.0, 4.0)
+    p.spherical.r  # noqa: B018
+    q = copier(p)
+    q.x, q.y = 6.0, 8.0
+    assert q.spherical.r == 10.0
+    assert p.spherical.r == 5.0
+
+
+def test_not_bound_class():
+    with pytest.raises((TypeError, RuntimeError)) as exc:
+
+        class Example:
+            @bound_cached_property
+            def r(self):
+                return 1
+
+    exc = exc.value if isinstance(exc.value, TypeError) else exc.value.__cause__  # Python < 3.12
+    assert "must be on a BoundClass subclass" in str(exc)
+
+
+def test_no_dict():
+    with pytest.raises((TypeError, RuntimeError)) as exc:
+
+        @dataclass(slots=True)
+        class Example(SlottedInstanceDescriptor):
+            @bound_cached_property
+            def r(self):
+                return 1
+
+    exc = exc.value if isinstance(exc.value, TypeError) else exc.value.__cause__  # Python < 3.12
+    assert "needs a __dict__" in str(exc)
@@ -0,0 +1,38 @@
+import importlib
+import os
+from pathlib import Path
+
+# THIRD PARTY
+import pytest
+
+from bound_class.core.base import BoundClass, SlottedBoundClass
+
+#####################################################################
+
+# The modules compiled with ``BOUND_CLASS_USE_MYPYC=1``; see ``setup.py``.
+MYPYC_MODULES = [
+    "bound_class.core.base",
+    "bound_class.core.accessors.descriptor",
+    "bound_class.core.descriptors.bound",
+    "bound_class.core.descriptors.instance",
+]
+
+
+@pytest.mark.parametrize("name", MYPYC_MODULES)
+def test_build(name):
+    """The suite runs against the build selected by ``BOUND_CLASS_USE_MYPYC``."""
+    compiled = Path(importlib.import_module(name).__file__).suffix != ".py"
+    assert compiled is (os.environ.get("BOUND_CLASS_USE_MYPYC", "0") == "1")
+
+
+@pytest.mark.parametrize("bound_cls", [BoundClass, SlottedBoundClass])
+def test_interpreted_subclass(bound_cls):
+    """Subclasses defined in Python bind, whether or not the base is compiled."""
+
+    class Sub(bound_cls[object]):
+        __slots__ = ()
+
+    boundto = type("Enclosing", (object,), {})()
+    sub = Sub()
+    sub._set__self__(boundto)
+    assert sub.__self__ is boundto
@@ -0,0 +1,103 @@
+import copy
+
+# THIRD PARTY
+import pytest
+
+from bound_class.core import rebind_on_copy
+from bound_class.core.accessors import Accessor, AccessorProperty, CachedAccessorProperty
+from bound_class.core.copying import rebind
+from bound_class.core.descriptors import BoundDescriptor, InstanceDescriptor
+
+#####################################################################
+
+
+@rebind_on_copy
+class Example:
+    dsc = BoundDescriptor()
+    instance = InstanceDescriptor()
+    acc = AccessorProperty(Accessor)
+    cached = CachedAccessorProperty(Accessor)
+    uncached = BoundDescriptor(store_in=None)
+
+    def __init__(self):
+        self.value = 1
+
+
+@rebind_on_copy
+class Record:
+    __slots__ = ("__weakref__", "_attrs_")
+    dsc = BoundDescriptor(store_in="_attrs_")
+    acc = AccessorProperty(Accessor, store_in="_attrs_")
+
+    def __init__(self):
+        self._attrs_ = {}
+
+
+NAMES = ("dsc", "instance", "acc", "cached")
+
+
+def bound_to(bound):
+    return bound.__selfref__()
+
+
+#####################################################################
+
+
+def test_copy():
+    ex = Example()
+    originals = {name: getattr(ex, name) for name in NAMES}
+
+    ex2 = copy.copy(ex)
+    cached = dict(vars(ex2))
+    assert all(bound_to(cached[name]) is ex2 for name in NAMES)
+    assert all(getattr(ex2, name) is cached[name] for name in NAMES)  # reads do not rebind
+
+    assert ex2.value == 1
+    assert {name: getattr(ex, name) for name in NAMES} == originals
+    assert all(bound_to(b) is ex for b in originals.values())
+
+
+def test_copy_attrs():
+    rec = Record()
+    dsc, acc = rec.dsc, rec.acc
+    rec2 = copy.copy(rec)
+    assert rec2._attrs_ is not rec._attrs_
+    assert bound_to(rec2._attrs_["dsc"]) is rec2
+    assert bound_to(rec2._attrs_["acc"]) is rec2
+    assert (rec.dsc, rec.acc) == (dsc, acc)
+
+
+def test_own_copy_wrapped():
+    @rebind_on_copy
+    class Copied:
+        acc = AccessorProperty(Accessor)
+
+        def __copy__(self):
+            new = type(self)()
+            new.__dict__.update(self.__dict__)
+            new.copied = True
+            return new
+
+    obj = Copied()
+    obj.acc  # noqa: B018
+    obj2 = copy.copy(obj)
+    assert obj2.copied
+    assert bound_to(vars(obj2)["acc"]) is obj2
+
+
+@pytest.mark.parametrize("copier", [copy.copy, copy.deepcopy])
+def test_rebind(copier):
+    class Plain:
+        acc = AccessorProperty(Accessor)
+        dsc = BoundDescriptor()
+
+    obj = Plain()
+    obj.acc, obj.dsc  # noqa: B018
+    obj.other = Accessor(obj)  # not cached by a descriptor
+    obj2 = copier(obj)
+
+    expected = 2 if copier is copy.copy else 0  # deep copies are already rebound
+    assert rebind(obj2) == expected
+    assert bound_to(vars(obj2)["acc"]) is obj2
+    assert bound_to(vars(obj2)["dsc"]) is obj2
+    assert rebind(obj2) == 0
@@ -0,0 +1,153 @@
+import copy
+from collections import Counter
+
+# THIRD PARTY
+import pytest
+
+from bound_class.core import collect_stats, disable_stats, enable_stats, reset_stats, stats
+from bound_class.core.accessors import Accessor, AccessorProperty, CachedAccessorProperty
+from bound_class.core.base import BoundClassRef
+from bound_class.core.counters import Stats, stats_enabled
+from bound_class.core.descriptors import BoundDescriptor, InstanceDescriptor
+from bound_class.core.hooks import _patches
+
+#####################################################################
+
+
+class ExampleAccessor(Accessor):
+    pass
+
+
+class Example:
+    dsc = BoundDescriptor()
+    nocache = InstanceDescriptor(store_in=None)
+    acc = AccessorProperty(ExampleAccessor)
+    cached = CachedAccessorProperty(ExampleAccessor)
+
+
+@pytest.fixture(autouse=True)
+def _clean_counters():
+    yield
+    disable_stats()
+    reset_stats()
+
+
+#####################################################################
+
+
+def test_disabled():
+    """When off, the classes have their own methods and nothing is counted."""
+    originals = [cls.__dict__[name] for cls, name, _ in _patches()]
+
+    enable_stats()
+    assert stats_enabled()
+    assert [cls.__dict__[name] for cls, name, _ in _patches()] != originals
+
+    disable_stats()
+    assert not stats_enabled()
+    assert [cls.__dict__[name] for cls, name, _ in _patches()] == originals
+
+    Example().dsc  # noqa: B018
+    assert stats().counts == {}
+
+
+def test_enable_reset():
+    enable_stats()
+    Example().dsc  # noqa: B018
+    enable_stats()  # already on, so no change
+    assert stats()[BoundDescriptor]["make"] == 1
+
+    enable_stats(reset=True)
+    assert stats().counts == {}
+
+
+def test_descriptor():
+    with collect_stats() as counts:
+        ex = Example()
+        for _ in range(3):
+            ex.dsc  # noqa: B018
+
+    assert counts[BoundDescriptor] == {"get": 3, "make": 1, "ref": 1}
+    assert counts.hits(BoundDescriptor) == 2
+
+
+def test_descriptor_rebind():
+    ex = Example()
+    ex.dsc._del__self__()  # e.g. as by ``del dsc.__self__``
+
+    with collect_stats() as counts:
+        ex.dsc  # noqa: B018
+    assert counts[BoundDescriptor] == {"get": 1, "rebind": 1, "ref": 1}
+
+    # a shallow copy shares the cached descriptor, which is replaced on it.
+    with collect_stats() as counts:
+        ex2 = copy.copy(ex)
+        ex2.dsc  # noqa: B018
+    assert counts[BoundDescriptor] == {"get": 1, "make": 1, "ref": 1}
+
+
+def test_descriptor_not_stored():
+    with collect_stats() as counts:
+        ex = Example()
+        ex.nocache  # noqa: B018
+        ex.nocache  # noqa: B018
+    assert counts[InstanceDescriptor] == {"get": 2, "make": 2, "ref": 2}
+    assert counts.hits(InstanceDescriptor) == 0
+
+
+def test_accessor():
+    with collect_stats() as counts:
+        ex = Example()
+        ex.acc  # noqa: B018
+        ex.acc  # noqa: B018
+        ex.cached  # noqa: B018
+        ex.cached  # noqa: B018  # not counted, as it is a plain lookup
+    assert counts[ExampleAccessor] == {"get": 3, "make": 2, "ref": 2}
+    assert counts[AccessorProperty] == {}
+
+
+def test_bind_many():
+    exs = [Example() for _ in range(4)]
+    exs[0].dsc  # noqa: B018
+    with collect_stats() as counts:
+        vars(Example)["dsc"].bind_many(exs)
+        vars(Example)["acc"].bind_many(exs)
+    assert counts[BoundDescriptor] == {"get": 4, "make": 3, "ref": 3}
+    assert counts[ExampleAccessor] == {"get": 4, "make": 4, "ref": 4}
+
+
+def test_finalize():
+    enable_stats()
+    ex = Example()
+    dsc = ex.dsc
+    del ex
+    assert stats()[BoundDescriptor]["finalize"] == 1
+    assert dsc.__selfref__ is None
+
+
+def test_collect_stats_nested():
+    enable_stats()
+    Example().dsc  # noqa: B018
+    with collect_stats() as counts:
+        Example().dsc  # noqa: B018
+    assert stats_enabled()  # still on
+    assert counts[BoundDescriptor]["make"] == 1
+    assert stats()[BoundDescriptor]["make"] == 2
+
+
+def test_Stats():
+    counts = Stats(
+        {
+            BoundDescriptor: Counter(get=5, make=2),
+            ExampleAccessor: Counter(get=1, make=4),
+        }
+    )
+    assert counts.total("get") == 6
+    assert counts.most_common() == [(ExampleAccessor, 4), (BoundDescriptor, 2)]
+    assert counts.most_common("get", 1) == [(BoundDescriptor, 5)]
+    assert counts[BoundClassRef] == {}
+    assert (counts - counts).counts == {}
+
+    table = str(counts).splitlines()
+    assert table[0].split() == ["class", "get", "make", "rebind", "ref", "finalize"]
+    assert "ExampleAccessor" in table[1]  # most makes first
@@ -0,0 +1,113 @@
+import gc
+
+# THIRD PARTY
+import pytest
+
+from bound_class.core import base, memory_report
+from bound_class.core.accessors import Accessor, AccessorProperty
+from bound_class.core.base import BoundClass, BoundClassRef, StrongRef
+from bound_class.core.descriptors import BoundDescriptor, InstanceDescriptor
+
+#####################################################################
+
+
+class Attr(BoundDescriptor):
+    pass
+
+
+class Instance(InstanceDescriptor):
+    pass
+
+
+class StrongAccessor(Accessor, ref_mode="strong"):
+    pass
+
+
+class Enclosing:
+    attr = Attr()
+    instance = Instance()
+    acc = AccessorProperty(Accessor)
+    strong = AccessorProperty(StrongAccessor)
+    uncached = Attr(store_in=None)
+
+
+@pytest.fixture
+def enclosings():
+    encls = [Enclosing() for _ in range(3)]
+    for encl in encls:
+        encl.attr, encl.instance, encl.acc, encl.strong  # noqa: B018
+    return encls
+
+
+#####################################################################
+
+
+def test_groups(enclosings):
+    uncached = enclosings[0].uncached
+    report = memory_report()
+
+    assert report.by_class[Attr].count == 4  # with ``uncached``
+    assert report.by_class[Instance].count == 3
+    assert report.by_class[StrongAccessor].count == 3
+    assert report.by_enclosing_type[Enclosing].count == 13
+    for name in ("attr", "instance", "acc", "strong"):
+        assert report.by_attribute[Enclosing, name].count == 3
+    assert report.by_attribute[Enclosing, None].count == 1
+    assert uncached.__self__ is enclosings[0]
+
+    assert report.refs[BoundClassRef].count >= 10
+    assert report.refs[StrongRef].count >= 3
+    assert report.by_class[StrongAccessor].nbytes > 0
+    assert report.count >= 13
+    assert report.nbytes == sum(u.nbytes for u in report.by_class.values())
+
+
+def test_descriptors_on_classes_not_reported():
+    report = memory_report()
+    assert all(b is not vars(Enclosing)["attr"] for b in report.stale)
+    assert Enclosing not in report.by_enclosing_type
+
+
+@pytest.fixture
+def deferred():
+    base.set_deferred_cleanup()
+    yield
+    base.set_deferred_cleanup(False)
+
+
+@pytest.mark.usefixtures("deferred")
+def test_stale():
+    encls = [Enclosing() for _ in range(3)]
+    kept = [encl.attr for encl in encls]
+    unbound = encls[0].instance
+    unbound._del__self__()  # on purpose
+    fresh = Attr()
+    del encls
+    gc.collect()
+
+    stale = {id(b) for b in memory_report().stale}
+    assert {id(b) for b in kept} <= stale
+    assert id(unbound) not in stale
+    assert id(fresh) not in stale
+
+    base.drain()
+    assert not {id(b) for b in kept} & {id(b) for b in memory_report().stale}
+
+
+def test_orphan_refs():
+    bound, enclosing = BoundClass(), Enclosing()
+    bound._set__self__(enclosing)
+    old = bound.__selfref__
+    bound._set__self__(enclosing)  # ``old`` is no longer used
+    report = memory_report()
+    assert report.orphan_refs >= 1
+    assert old is not bound.__selfref__
+
+
+@pytest.mark.usefixtures("enclosings")
+def test_str():
+    text = str(memory_report())
+    assert "bound class" in text
+    assert "test_diagnostics.Enclosing.attr" in text
+    assert "stale bound objects:" in text
+    assert "pending finalizers:" in text
@@ -0,0 +1,197 @@
+import dataclasses
+from dataclasses import dataclass, field
+from typing import ClassVar
+
+# THIRD PARTY
+import pytest
+
+from bound_class.core.descriptors import InstanceDescriptor, SlottedInstanceDescriptor
+from bound_class.core.fields import clone, light_dataclass
+
+#####################################################################
+
+
+@light_dataclass
+class Point:
+    x: float
+    y: float = 0.0
+    tags: list = field(default_factory=list)
+    count: int = field(init=False, default=0)
+    scale: ClassVar[float] = 1.0
+
+
+@light_dataclass(slots=True)
+class SlottedPoint:
+    x: float
+    y: float = 0.0
+
+
+# -------------------------------------------
+# light_dataclass
+
+
+def test_init():
+    p = Point(1.0, tags=["a"])
+    assert (p.x, p.y, p.tags, p.count) == (1.0, 0.0, ["a"], 0)
+    assert Point(1.0).tags is not Point(1.0).tags  # default_factory
+
+    with pytest.raises(TypeError, match="missing required argument: 'x'"):
+        Point()
+    with pytest.raises(TypeError, match="unexpected keyword argument 'count'"):
+        Point(1.0, count=1)
+    with pytest.raises(TypeError, match="multiple values for argument 'x'"):
+        Point(1.0, x=2.0)
+    with pytest.raises(TypeError, match="takes 4 positional arguments but 5 were given"):
+        Point(1.0, 2.0, [], 3)
+
+
+def test_repr_eq():
+    assert repr(Point(1.0)) == "Point(x=1.0, y=0.0, tags=[], count=0)"
+    assert Point(1.0) == Point(1.0)
+    assert Point(1.0) != Point(2.0)
+    assert Point.__hash__ is None
+
+
+def test_dataclasses_compatible():
+    """The fields are the same as for `dataclasses.dataclass`."""
+
+    @dataclass
+    class Reference:
+        x: float
+        y: float = 0.0
+        tags: list = field(default_factory=list)
+        count: int = field(init=False, default=0)
+        scale: ClassVar[float] = 1.0
+
+    assert dataclasses.is_dataclass(Point)
+    assert [f.name for f in dataclasses.fields(Point)] == [f.name for f in dataclasses.fields(Reference)]
+    assert Point.__match_args__ == Reference.__match_args__
+    assert Point.y == Reference.y
+    assert dataclasses.asdict(Point(1.0)) == dataclasses.asdict(Reference(1.0))
+    assert dataclasses.replace(Point(1.0), y=2.0) == Point(1.0, 2.0)
+
+
+def test_dataclass_subclass():
+    @dataclass
+    class Point3D(Point):
+        z: float = 0.0
+
+    assert repr(Point3D(1.0, z=3.0)).endswith("Point3D(x=1.0, y=0.0, tags=[], count=0, z=3.0)")
+
+
+def test_kw_only():
+    @light_dataclass
+    class KwOnly:
+        x: float = 0.0
+        y: float = field(kw_only=True)
+
+    assert KwOnly.__match_args__ == ("x",)
+    assert repr(KwOnly(1.0, y=2.0)).endswith("KwOnly(x=1.0, y=2.0)")
+
+
+def test_keeps_methods():
+    @light_dataclass
+    class Custom:
+        x: float
+
+        def __repr__(self):
+            return "custom"
+
+    assert repr(Custom(1.0)) == "custom"
+
+
+def test_slots():
+    p = SlottedPoint(1.0)
+    assert not hasattr(p, "__dict__")
+    assert SlottedPoint.__slots__ == ("x", "y")
+    assert (p.x, p.y) == (1.0, 0.0)
+
+
+def test_errors():
+    with pytest.raises(ValueError, match="mutable default"):
+
+        @light_dataclass
+        class Mutable:
+            x: list = []  # noqa: RUF012
+
+    with pytest.raises(TypeError, match="non-default argument 'y' follows default argument"):
+
+        @light_dataclass
+        class Order:
+            x: float = 0.0
+            y: float
+
+
+# -------------------------------------------
+# clone
+
+
+@dataclass
+class Reference:
+    x: float
+
+
+@pytest.mark.parametrize("cls", [Point, SlottedPoint, Reference])
+def test_clone(cls):
+    obj = cls(1.0)
+    new = clone(obj)
+    assert new is not obj
+    assert new == obj
+
+
+def test_clone_fields():
+    """As for `dataclasses.replace`, init fields are copied, others are reset."""
+    p = Point(1.0, tags=["a"])
+    p.count = 5
+    new = clone(p)
+    assert new.tags is p.tags
+    assert new.count == 0
+
+
+def test_clone_post_init():
+    @light_dataclass
+    class PostInit:
+        x: float
+
+        def __post_init__(self):
+            self.double = 2 * self.x
+
+    assert clone(PostInit(1.0)).double == 2.0
+
+
+def test_clone_kw_only():
+    @dataclass(kw_only=True)
+    class KwOnly:
+        x: float
+        y: float
+
+    assert clone(KwOnly(x=1.0, y=2.0)) == KwOnly(x=1.0, y=2.0)
+
+
+def test_clone_handwritten_init():
+    """A hand-written ``__init__`` is called, as by `dataclasses.replace`."""
+
+    @dataclass
+    class Handwritten:
+        x: float
+
+        def __init__(self, x):
+            self.x = x
+            self.called = True
+
+    assert clone(Handwritten(1.0)).called
+
+
+@pytest.mark.parametrize("base", [InstanceDescriptor, SlottedInstanceDescriptor])
+def test_clone_descriptor(base):
+    """A cloned descriptor is not bound."""
+
+    @light_dataclass(slots=base is SlottedInstanceDescriptor)
+    class Scaled(base):
+        scale: float = 1.0
+
+    enclosing = type("Enclosing", (), {"attr": Scaled(scale=2.0)})()
+    descr = enclosing.attr
+    new = clone(descr)
+    assert new.scale == 2.0
+    assert new.__selfref__ is None
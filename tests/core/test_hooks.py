@@ -0,0 +1,109 @@
+import gc
+
+# THIRD PARTY
+import pytest
+
+from bound_class.core import add_hook, disable_stats, enable_stats, remove_hook, reset_stats, stats
+from bound_class.core.accessors import Accessor, AccessorProperty
+from bound_class.core.descriptors import BoundDescriptor
+from bound_class.core.hooks import _listeners, _patches
+
+#####################################################################
+
+
+class ExampleAccessor(Accessor):
+    pass
+
+
+class Example:
+    dsc = BoundDescriptor()
+    acc = AccessorProperty(ExampleAccessor)
+
+
+@pytest.fixture
+def events():
+    """Add a hook recording the events, and remove it after the test."""
+    events = []
+
+    def hook(event, bound, enclosing):
+        events.append((event, type(bound), enclosing))
+
+    add_hook(hook)
+    yield events
+    remove_hook(hook)
+
+
+def originals():
+    return [cls.__dict__[name] for cls, name, _ in _patches()]
+
+
+#####################################################################
+
+
+def test_events(events):
+    ex = Example()
+    dsc = ex.dsc
+    ex.dsc  # noqa: B018  # cached, so no event
+    acc = ex.acc
+    assert events == [("bind", BoundDescriptor, ex), ("bind", ExampleAccessor, ex)]
+
+    events.clear()
+    dsc._del__self__()
+    ex.dsc  # noqa: B018
+    assert events == [("rebind", BoundDescriptor, ex)]
+
+    events.clear()
+    del ex
+    gc.collect()
+    assert sorted(events, key=str) == [("unbind", BoundDescriptor, None), ("unbind", ExampleAccessor, None)]
+    assert acc.__selfref__ is None
+
+
+def test_add_remove():
+    before = originals()
+    calls = []
+
+    @add_hook
+    def hook(*args):
+        calls.append(args)
+
+    assert add_hook(hook) is hook  # adding again does nothing
+    assert originals() != before
+
+    Example().dsc  # noqa: B018
+    assert len(calls) == 1
+
+    remove_hook(hook)
+    remove_hook(hook)  # removing again does nothing
+    assert originals() == before
+    assert _listeners == ()
+
+    Example().dsc  # noqa: B018
+    assert len(calls) == 1
+
+
+def test_with_counters(events):
+    """Hooks and counters share the reporting methods."""
+    enable_stats(reset=True)
+    Example().dsc  # noqa: B018
+    disable_stats()
+    assert stats()[BoundDescriptor]["make"] == 1
+    reset_stats()
+
+    Example().dsc  # noqa: B018  # hooks still on
+    assert [e for e, *_ in events].count("bind") == 2
+
+
+def test_hook_error():
+    """Errors from the hook are raised from the attribute access."""
+
+    def hook(event, _bound, _enclosing):
+        if event == "bind":
+            raise ValueError(event)
+
+    add_hook(hook)
+    try:
+        with pytest.raises(ValueError, match="bind"):
+            Example().acc  # noqa: B018
+    finally:
+        remove_hook(hook)
@@ -0,0 +1,58 @@
+import pkgutil
+import subprocess
+import sys
+
+# THIRD PARTY
+import pytest
+
+import bound_class.core
+import bound_class.core.accessors
+import bound_class.core.descriptors
+
+#####################################################################
+
+PACKAGES = [bound_class.core, bound_class.core.accessors, bound_class.core.descriptors]
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+def test_all(package):
+    """Every name in ``__all__`` is lazily importable and in ``dir``."""
+    for name in package.__all__:
+        assert getattr(package, name) is not None
+        assert name in dir(package)
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+def test_missing(package):
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        package.missing  # noqa: B018
+
+
+@pytest.mark.parametrize(
+    ("code", "not_imported"),
+    [
+        ("import bound_class.core", ["bound_class.core.base", "bound_class.core.accessors", "dataclasses"]),
+        ("from bound_class.core import BoundClass", ["bound_class.core.accessors", "bound_class.core.descriptors"]),
+        ("from bound_class.core import register_accessor", ["numpy", "importlib.metadata"]),
+    ],
+)
+def test_lazy(code, not_imported):
+    """Importing does not import the modules that are not needed."""
+    check = f"import sys; {code}; print(*sorted(sys.modules))"
+    modules = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", check], capture_output=True, text=True, check=True
+    ).stdout.split()
+    assert not set(not_imported) & set(modules)
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+def test_no_module_names(package):
+    """No name in ``__all__`` is also a submodule, which importing would rebind."""
+    assert not set(package.__all__) & {m.name for m in pkgutil.iter_modules(package.__path__)}
+
+
+def test_import_module_first():
+    """The lazy names stay bound after their module is imported, e.g. by another lazy name."""
+    code = "from bound_class.core import enable_budget, budget_usage; print(budget_usage().count)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout  # noqa: S603
+    assert out.strip() == "0"
@@ -0,0 +1,190 @@
+import copy
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+# THIRD PARTY
+import pytest
+
+from bound_class.core.accessors import Accessor, AccessorProperty, CachedAccessorProperty
+from bound_class.core.descriptors import (
+    BoundDescriptor,
+    InstanceDescriptor,
+    SlottedBoundDescriptor,
+    SlottedInstanceDescriptor,
+)
+from bound_class.core.locks import _locks, lock_for
+
+N_THREADS = 8
+N_OBJECTS = 16
+
+#####################################################################
+
+
+def make_enclosing_cls(kind, made):
+    """Make an enclosing class, recording each bound object made in ``made``."""
+
+    def record(obj):
+        time.sleep(1e-3)  # give the other threads time to race
+        made.append(obj)
+
+    if kind in {"AccessorProperty", "CachedAccessorProperty"}:
+
+        class CountingAccessor(Accessor):
+            def __init__(self, accessee):
+                super().__init__(accessee)
+                record(self)
+
+        prop = AccessorProperty if kind == "AccessorProperty" else CachedAccessorProperty
+        return type("Enclosing", (object,), {"attr": prop(CountingAccessor)})
+
+    base = {
+        "BoundDescriptor": BoundDescriptor,
+        "InstanceDescriptor": InstanceDescriptor,
+        "SlottedBoundDescriptor": SlottedBoundDescriptor,
+        "SlottedInstanceDescriptor": SlottedInstanceDescriptor,
+    }[kind]
+
+    def __post_init__(self):
+        base.__post_init__(self)
+        record(self)
+
+    dsc_cls = dataclass(slots=kind.startswith("Slotted"))(
+        type("CountingDescriptor", (base,), {"__post_init__": __post_init__})
+    )
+    encl_cls = type("Enclosing", (object,), {"attr": dsc_cls()})
+    made.clear()  # the descriptor on the class
+    return encl_cls
+
+
+def run_threads(func, n_threads=N_THREADS):
+    """Call ``func`` from ``n_threads`` threads, all starting together."""
+    barrier = threading.Barrier(n_threads)
+
+    def work(_):
+        barrier.wait()
+        return func()
+
+    with ThreadPoolExecutor(n_threads) as pool:
+        return list(pool.map(work, range(n_threads)))
+
+
+KINDS = [
+    "BoundDescriptor",
+    "InstanceDescriptor",
+    "SlottedBoundDescriptor",
+    "SlottedInstanceDescriptor",
+    "AccessorProperty",
+    "CachedAccessorProperty",
+]
+
+
+@pytest.fixture(params=KINDS)
+def kind(request):
+    return request.param
+
+
+@pytest.fixture
+def made():
+    return []
+
+
+@pytest.fixture
+def enclosings(kind, made):
+    encl_cls = make_enclosing_cls(kind, made)
+    return [encl_cls() for _ in range(N_OBJECTS)]
+
+
+#####################################################################
+
+
+def test_lock_for():
+    obj = object()
+    with lock_for(obj, "attr"), lock_for(obj, "attr"):  # re-entrant
+        assert len(_locks) == 1
+        assert _locks[id(obj), "attr"].users == 2
+        with lock_for(obj, "other"), lock_for(object(), "attr"):
+            assert len(_locks) == 3
+    assert not _locks  # removed when unused
+
+
+def test_no_deadlock_across_objects():
+    """Making a bound object may access those of another object, in any order."""
+    barrier = threading.Barrier(2, timeout=5)
+
+    class Second(Accessor):
+        pass
+
+    class First(Accessor):
+        def __init__(self, accessee):
+            super().__init__(accessee)
+            barrier.wait()  # both threads hold the lock of their ``first``
+            accessee.other.second  # noqa: B018
+
+    class Enclosing:
+        first = AccessorProperty(First)
+        second = AccessorProperty(Second)
+
+    a, b = Enclosing(), Enclosing()
+    a.other, b.other = b, a
+    threads = [threading.Thread(target=lambda e=e: e.first, daemon=True) for e in (a, b)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    assert not any(thread.is_alive() for thread in threads)
+    assert isinstance(vars(a)["second"], Second)
+    assert isinstance(vars(b)["second"], Second)
+
+
+def test_first_get(enclosings, made):
+    """Each bound object is made once, and all threads get it."""
+    results = run_threads(lambda: [enc.attr for enc in enclosings])
+
+    assert len(made) == N_OBJECTS
+    for got in results:
+        assert all(a is b for a, b in zip(got, results[0], strict=True))
+    assert all(a is enc.attr for a, enc in zip(results[0], enclosings, strict=True))
+
+
+def test_first_get_one_object(kind, made):
+    """Many threads race on the first access of a single object."""
+    encl_cls = make_enclosing_cls(kind, made)
+    for _ in range(5):
+        enclosing = encl_cls()
+        results = run_threads(lambda enclosing=enclosing: enclosing.attr)
+        assert all(r is results[0] for r in results)
+    assert len(made) == 5
+
+
+def test_bind_many(kind, enclosings, made):
+    """``bind_many`` and ``__get__`` also make each bound object once."""
+    if kind == "CachedAccessorProperty":
+        pytest.skip("no bind_many")
+    dsc = vars(type(enclosings[0]))["attr"]
+
+    results = run_threads(lambda: dsc.bind_many(enclosings) + [enc.attr for enc in enclosings])
+
+    assert len(made) == N_OBJECTS
+    for got in results:
+        assert all(a is b for a, b in zip(got, results[0], strict=True))
+        assert all(a is b for a, b in zip(got[:N_OBJECTS], got[N_OBJECTS:], strict=True))
+
+
+def test_rebind_copies(kind, enclosings, made):
+    """Shallow copies (which share the cached object) are also bound once."""
+    if kind == "CachedAccessorProperty":
+        pytest.skip("shallow copies share the accessor")
+
+    enclosings[0].attr  # noqa: B018
+    copies = [copy.copy(enclosings[0]) for _ in range(N_OBJECTS)]
+    made.clear()
+
+    results = run_threads(lambda: [c.attr for c in copies])
+
+    for got in results:
+        assert all(a is b for a, b in zip(got, results[0], strict=True))
+    attr = "accessee" if kind == "AccessorProperty" else "enclosing"
+    assert all(getattr(a, attr) is c for a, c in zip(results[0], copies, strict=True))
+    assert len(made) == N_OBJECTS
@@ -0,0 +1,200 @@
+import sys
+from dataclasses import dataclass
+
+# THIRD PARTY
+import pytest
+
+from bound_class.core import Profiler, register_accessor, register_descriptor, registered_attributes
+from bound_class.core.accessors import Accessor
+from bound_class.core.descriptors import InstanceDescriptor
+from bound_class.core.profiler import main
+
+#####################################################################
+
+
+@dataclass
+class Point:
+    x: float
+    y: float
+
+
+@register_accessor(Point, "geo")
+class Geo(Accessor):
+    def norm(self):
+        return (self.accessee.x**2 + self.accessee.y**2) ** 0.5
+
+    @property
+    def doubled(self):
+        return 2 * self.norm()
+
+
+@register_descriptor(Point, "polar")
+class Polar(InstanceDescriptor):
+    @property
+    def r(self):
+        return self.enclosing.geo.norm()
+
+
+SCRIPT = """\
+import sys
+from bound_class.core import register_accessor
+from bound_class.core.accessors import Accessor
+
+class Example:
+    pass
+
+@register_accessor(Example, "acc")
+class ExampleAccessor(Accessor):
+    def method(self):
+        return 1
+
+for _ in range(3):
+    Example().acc.method()
+print("args", *sys.argv[1:])
+"""
+
+
+@pytest.fixture
+def script(tmp_path, monkeypatch):
+    path = tmp_path / "script.py"
+    path.write_text(SCRIPT)
+    monkeypatch.setattr(sys, "argv", list(sys.argv))
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    return path
+
+
+#####################################################################
+
+
+def test_registered_attributes():
+    attrs = registered_attributes()
+    assert (Point, "geo") in attrs
+    assert (Point, "polar") in attrs
+
+
+def test_profiler():
+    originals = {name: vars(Point)[name] for name in ("geo", "polar")}
+    norm = vars(Geo)["norm"]
+
+    with Profiler() as profiler:
+        assert vars(Point)["geo"] is not originals["geo"]
+        p = Point(3.0, 4.0)
+        assert p.geo.doubled == 10.0
+        assert p.polar.r == 5.0
+        assert p.polar.r == 5.0
+
+    # restored
+    assert {name: vars(Point)[name] for name in ("geo", "polar")} == originals
+    assert vars(Geo)["norm"] is norm
+
+    geo = profiler.attributes[Point, "geo"]
+    assert geo.bound_cls is Geo
+    assert (geo.bind.count, geo.get.count) == (1, 2)
+    # ``norm`` from ``doubled`` is timed in ``doubled``, and from ``Polar.r``
+    # in ``r``.
+    assert geo.methods.keys() == {"doubled"}
+    assert geo.methods["doubled"].count == 1
+
+    polar = profiler.attributes[Point, "polar"]
+    assert polar.bound_cls is Polar
+    assert (polar.bind.count, polar.get.count) == (1, 1)
+    assert polar.methods["r"].count == 2
+    assert polar.total_time == polar.bind.time + polar.get.time + polar.method_time > 0
+
+
+def test_profiler_ref_mode():
+    """The methods are timed under the registered class, not its `with_ref_mode` subclass."""
+
+    class Strong:
+        pass
+
+    class StrongAccessor(Accessor):
+        def method(self):
+            return 1
+
+    class StrongDescriptor(InstanceDescriptor):
+        def method(self):
+            return 1
+
+    register_accessor(Strong, "acc", ref_mode="strong")(StrongAccessor)
+    register_descriptor(Strong, "dsc", ref_mode="strong")(StrongDescriptor)
+    with Profiler() as profiler:
+        for _ in range(3):
+            ex = Strong()
+            ex.acc.method()
+            ex.dsc.method()
+
+    for name, bound_cls in (("acc", StrongAccessor), ("dsc", StrongDescriptor)):
+        profile = profiler.attributes[Strong, name]
+        assert profile.bound_cls is bound_cls
+        assert profile.methods["method"].count == 3
+
+
+def test_profiler_data_descriptor():
+    with Profiler():
+        p = Point(3.0, 4.0)
+        with pytest.raises(AttributeError):
+            p.geo = None
+        assert Point.geo is Geo  # from the class
+
+
+def test_profiler_registered_while_enabled(tmp_path, monkeypatch):
+    name = "profiled_lazy_module"
+    (tmp_path / f"{name}.py").write_text(
+        "from bound_class.core.accessors import Accessor\n\nclass LazyAccessor(Accessor):\n    pass\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, name, raising=False)
+
+    class Example:
+        pass
+
+    with Profiler() as profiler:
+        register_accessor(Example, "lazy")(f"{name}:LazyAccessor")
+        assert (Example, "lazy") not in profiler.attributes  # not imported yet
+        ex = Example()
+        ex.lazy  # noqa: B018  # imports and registers it
+        ex.lazy  # noqa: B018
+
+    profile = profiler.attributes[Example, "lazy"]
+    assert profile.bound_cls.__name__ == "LazyAccessor"
+    assert profile.get.count == 1
+    sys.modules.pop(name)
+
+
+def test_profiler_one_at_a_time():
+    with Profiler(), pytest.raises(RuntimeError, match="already enabled"), Profiler():
+        pass
+
+    with Profiler():  # can enable after the first is disabled
+        pass
+
+
+def test_report():
+    with Profiler() as profiler:
+        p = Point(3.0, 4.0)
+        p.polar.r  # noqa: B018
+
+    lines = profiler.report().splitlines()
+    assert lines[0].split()[:2] == ["attribute", "class"]
+    assert any(line.startswith("Point.polar") for line in lines)
+
+    assert profiler.report("bind").splitlines()[1].startswith("Point.polar")
+    with pytest.raises(ValueError, match="sort must be one of"):
+        profiler.report("name")
+
+
+def test_main(script, capsys):
+    assert main(["-s", "methods", str(script), "a", "b"]) == 0
+    out = capsys.readouterr().out.splitlines()
+    assert out[0] == "args a b"
+    assert out[1].split()[:2] == ["attribute", "class"]
+    row = next(line for line in out if line.startswith("Example.acc")).split()
+    assert row[1:3] == ["ExampleAccessor", "3"]  # class, binds
+
+
+def test_main_outfile(script, tmp_path, capsys):
+    outfile = tmp_path / "report.txt"
+    assert main(["-o", str(outfile), str(script)]) == 0
+    assert capsys.readouterr().out == "args\n"
+    assert "Example.acc" in outfile.read_text()
@@ -0,0 +1,133 @@
+import copy
+import gc
+from dataclasses import dataclass
+
+# THIRD PARTY
+import pytest
+
+from bound_class.core import register_accessor
+from bound_class.core.accessors import Accessor, AccessorProperty, AsyncAccessor, AsyncAccessorProperty, SlottedAccessor
+from bound_class.core.descriptors import BoundDescriptor, InstanceDescriptor, SlottedInstanceDescriptor
+from bound_class.core.storage import SIDE_TABLE, _side_table, get_cache, side_table
+
+#####################################################################
+
+
+class ExampleSlottedAccessor(SlottedAccessor):
+    __slots__ = ()
+
+
+@pytest.fixture(
+    params=[
+        lambda: AccessorProperty(Accessor, store_in=SIDE_TABLE),
+        lambda: AccessorProperty(ExampleSlottedAccessor, store_in=SIDE_TABLE),
+        lambda: BoundDescriptor(store_in=SIDE_TABLE),
+        lambda: InstanceDescriptor(store_in=SIDE_TABLE),
+        lambda: SlottedInstanceDescriptor(store_in=SIDE_TABLE),
+    ],
+    ids=["Accessor", "SlottedAccessor", "BoundDescriptor", "InstanceDescriptor", "SlottedInstanceDescriptor"],
+)
+def attr(request):
+    return request.param()
+
+
+@pytest.fixture
+def encl_cls(attr):
+    """A slotted class, without a ``__dict__``."""
+
+    @dataclass(slots=True, weakref_slot=True)  # and unhashable
+    class Record:
+        value: float = 0.0
+
+    Record.attr = attr
+    attr.__set_name__(Record, "attr")
+    return Record
+
+
+#####################################################################
+
+
+def test_cached(encl_cls):
+    rec = encl_cls()
+    assert not hasattr(rec, "__dict__")
+    bound = rec.attr
+    assert bound.__self__ is rec
+    assert rec.attr is bound
+    assert side_table(rec) == {"attr": bound}
+    assert get_cache(rec, SIDE_TABLE) is side_table(rec)
+
+
+def test_deleted(encl_cls):
+    rec = encl_cls()
+    bound = rec.attr
+    key = id(rec)
+    assert key in _side_table
+
+    del rec
+    gc.collect()
+    assert key not in _side_table
+    with pytest.raises(ReferenceError):
+        bound.__self__  # noqa: B018
+
+
+def test_copy(encl_cls):
+    rec = encl_cls()
+    bound = rec.attr
+    rec2 = copy.copy(rec)
+    assert rec2.attr is not bound
+    assert rec2.attr.__self__ is rec2
+    assert rec.attr is bound
+
+
+def test_bind_many(encl_cls):
+    recs = [encl_cls() for _ in range(3)]
+    cached = recs[0].attr
+    bound = vars(encl_cls)["attr"].bind_many(recs)
+    assert bound[0] is cached
+    assert all(b is rec.attr and b.__self__ is rec for b, rec in zip(bound, recs, strict=True))
+
+
+def test_not_weakrefable():
+    class Record:
+        __slots__ = ("value",)
+        attr = AccessorProperty(Accessor, store_in=SIDE_TABLE)
+
+    with pytest.raises(TypeError, match="weak reference"):
+        Record().attr  # noqa: B018
+
+
+def test_register_accessor():
+    class Record:
+        __slots__ = ("__weakref__",)
+
+    @register_accessor(Record, "acc", store_in=SIDE_TABLE)
+    class RecordAccessor(Accessor):
+        pass
+
+    rec = Record()
+    assert rec.acc is rec.acc
+    assert isinstance(side_table(rec)["acc"], RecordAccessor)
+
+
+class StrongAccessor(Accessor, ref_mode="strong"):
+    pass
+
+
+class StrongDescriptor(InstanceDescriptor, ref_mode="strong"):
+    pass
+
+
+@pytest.mark.parametrize(
+    "make",
+    [
+        lambda: AccessorProperty(StrongAccessor, store_in=SIDE_TABLE),
+        lambda: AccessorProperty(Accessor, store_in=SIDE_TABLE, ref_mode="strong"),
+        lambda: AsyncAccessorProperty(AsyncAccessor, store_in=SIDE_TABLE, ref_mode="strong"),
+        lambda: StrongDescriptor(store_in=SIDE_TABLE),
+    ],
+    ids=["AccessorProperty", "ref_mode", "AsyncAccessorProperty", "InstanceDescriptor"],
+)
+def test_strong_rejected(make):
+    """The side table would keep the enclosing object alive, through the strong reference."""
+    with pytest.raises(ValueError, match="side table"):
+        make()
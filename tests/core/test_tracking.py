@@ -0,0 +1,198 @@
+import copy
+import gc
+from collections import Counter
+from dataclasses import dataclass
+
+# THIRD PARTY
+import pytest
+
+from bound_class.core import bound_cached_property, invalidate, track_fields, tracked_cached_property
+from bound_class.core.accessors import Accessor, AccessorProperty
+from bound_class.core.descriptors import InstanceDescriptor
+from bound_class.core.tracking import _dependents, _TrackedField
+
+#####################################################################
+
+calls = Counter()
+
+
+class Spherical(InstanceDescriptor):
+    @tracked_cached_property
+    def r(self):
+        calls["r"] += 1
+        return (self.enclosing.x**2 + self.enclosing.y**2) ** 0.5
+
+    @tracked_cached_property
+    def r2(self):
+        calls["r2"] += 1
+        return self.r**2  # read from the cache, after ``r``
+
+    @tracked_cached_property
+    def scaled(self):
+        calls["scaled"] += 1
+        return self.enclosing.scale * self.enclosing.geo.norm
+
+    @bound_cached_property
+    def untracked(self):
+        calls["untracked"] += 1
+        return self.enclosing.x
+
+
+class Geo(Accessor):
+    @tracked_cached_property
+    def norm(self):
+        calls["norm"] += 1
+        return self.accessee.spherical.r
+
+
+@track_fields
+@dataclass
+class Point:
+    x: float
+    y: float
+    scale: float = 1.0
+    spherical = Spherical()
+    geo = AccessorProperty(Geo)
+
+
+@pytest.fixture(autouse=True)
+def _reset_calls():
+    calls.clear()
+
+
+@pytest.fixture
+def point():
+    p = Point(3.0, 4.0)
+    assert (p.spherical.r, p.spherical.r2, p.spherical.scaled) == (5.0, pytest.approx(25.0), 5.0)
+    calls.clear()
+    return p
+
+
+#####################################################################
+
+
+def test_fields(point):
+    assert isinstance(vars(Point)["x"], _TrackedField)
+    assert Point.scale == 1.0  # the default
+    assert vars(point) == {"x": 3.0, "y": 4.0, "scale": 1.0, "spherical": point.spherical, "geo": point.geo}
+    assert point == Point(3.0, 4.0)
+
+
+def test_cached(point):
+    assert (point.spherical.r, point.spherical.r2, point.spherical.scaled) == (5.0, pytest.approx(25.0), 5.0)
+    assert calls == {}
+
+
+def test_only_dependents(point):
+    point.scale = 2.0
+    assert point.spherical.scaled == 10.0
+    assert point.spherical.r == 5.0
+    assert calls == {"scaled": 1}
+
+
+def test_transitive(point):
+    """Values read from the cache of other values are invalidated with them."""
+    point.x, point.y = 6.0, 8.0
+    assert point.spherical.r2 == pytest.approx(100.0)
+    assert point.spherical.scaled == 10.0  # via ``geo.norm``, another bound object
+    assert calls == {"r": 1, "r2": 1, "norm": 1, "scaled": 1}
+
+
+def test_delete(point):
+    point.scale = 2.0
+    assert point.spherical.scaled == 10.0
+    del point.scale  # back to the default
+    assert point.spherical.scaled == 5.0
+    assert calls == {"scaled": 2}
+
+
+def test_other_instance(point):
+    other = Point(3.0, 4.0)
+    other.spherical.r  # noqa: B018
+    other.x = 0.0
+    assert point.spherical.r == 5.0
+    assert other.spherical.r == 4.0
+    assert calls == {"r": 2}
+
+
+def test_untracked(point):
+    """`bound_cached_property` does not track."""
+    assert point.spherical.untracked == 3.0
+    point.x = 0.0
+    assert point.spherical.untracked == 3.0
+
+
+def test_set_del(point):
+    point.spherical.r = 1.0
+    assert point.spherical.r2 == pytest.approx(25.0)  # not a dependent of the set value
+    assert point.spherical.r == 1.0
+    del point.spherical.r
+    with pytest.raises(AttributeError):
+        del point.spherical.r
+    assert point.spherical.r == 5.0
+
+
+def test_invalidate_and_copy(point):
+    invalidate(point.spherical, "r")
+    assert point.spherical.r == 5.0
+    q = copy.deepcopy(point)
+    q.x, q.y = 6.0, 8.0
+    assert q.spherical.r == 10.0
+    assert point.spherical.r == 5.0
+    assert calls == {"r": 2}
+
+
+def test_no_leak():
+    p = Point(3.0, 4.0)
+    p.spherical.r  # noqa: B018
+    key = id(p)
+    assert key in _dependents
+    del p
+    gc.collect()
+    assert key not in _dependents
+
+
+def test_slots():
+    class Descriptor(InstanceDescriptor):
+        @tracked_cached_property
+        def double(self):
+            return 2 * self.enclosing.x
+
+    @track_fields
+    @dataclass(slots=True, weakref_slot=True)
+    class Slotted:
+        x: float
+        double = Descriptor(store_in=None)
+
+    s = Slotted(1.0)
+    double = s.double
+    assert double.double == 2.0
+    s.x = 2.0
+    assert double.double == 4.0
+
+
+def test_fields_argument():
+    @track_fields(fields=["x"])
+    class Plain:
+        x = 1.0
+        spherical = Spherical()
+
+    p = Plain()
+    p.y = 0.0
+    assert p.spherical.r == 1.0
+    p.x = 2.0
+    assert p.spherical.r == 2.0
+    p.y = 1.0  # not tracked
+    assert p.spherical.r == 2.0
+
+
+def test_errors():
+    with pytest.raises(TypeError, match="fields must be given"):
+        track_fields(type("Example", (), {}))
+
+    @dataclass(slots=True)
+    class NotWeakrefable:
+        x: float
+
+    with pytest.raises(TypeError, match="weak-referenceable"):
+        track_fields(NotWeakrefable)